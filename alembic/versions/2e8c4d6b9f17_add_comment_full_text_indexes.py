@@ -0,0 +1,71 @@
+"""Add comment full-text indexes
+
+Revision ID: 2e8c4d6b9f17
+Revises: 6a2b9e0f4c81
+Create Date: 2026-10-19 18:05:12.480913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e8c4d6b9f17'
+down_revision: Union[str, None] = '6a2b9e0f4c81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('evaluation_result', 'question_result')
+
+
+def upgrade() -> None:
+    # Same statements as app/db/full_text.py, which create_all runs
+    if op.get_bind().dialect.name == 'sqlite':
+        for table in TABLES:
+            fts = f'{table}_fts'
+            insert = f'INSERT INTO {fts}(rowid, comment) VALUES (new.id, new.comment);'
+            delete = (
+                f"INSERT INTO {fts}({fts}, rowid, comment) "
+                "VALUES ('delete', old.id, old.comment);"
+            )
+            op.execute(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5(comment, content='{table}', "
+                "content_rowid='id', tokenize='porter unicode61')"
+            )
+            op.execute(f'CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END')
+            op.execute(f'CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {delete} END')
+            op.execute(
+                f'CREATE TRIGGER {fts}_au AFTER UPDATE OF comment ON {table} '
+                f'BEGIN {delete} {insert} END'
+            )
+            op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        return
+
+    for table in TABLES:
+        # Generated columns are computed for the existing rows too
+        op.execute(
+            f'ALTER TABLE {table} ADD COLUMN comment_tsv tsvector '
+            "GENERATED ALWAYS AS (to_tsvector('english', coalesce(comment, ''))) STORED"
+        )
+        op.create_index(
+            f'ix_{table}_comment_tsv',
+            table,
+            ['comment_tsv'],
+            unique=False,
+            postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for table in TABLES:
+            fts = f'{table}_fts'
+            for trigger in ('ai', 'ad', 'au'):
+                op.execute(f'DROP TRIGGER IF EXISTS {fts}_{trigger}')
+            op.execute(f'DROP TABLE IF EXISTS {fts}')
+        return
+
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_comment_tsv', table_name=table)
+        op.drop_column(table, 'comment_tsv')
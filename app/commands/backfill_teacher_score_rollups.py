@@ -0,0 +1,33 @@
+"""Backfill Teacher Score Rollups.
+
+Recompute the weekly rollups of the teacher scores from every submitted
+answer, e.g. after the migration adding them, to split the rollups written
+before weeks were split at month boundaries or to catch up answers moved to
+another teacher or category::
+
+    python -m app.commands.backfill_teacher_score_rollups
+"""
+
+import logging
+
+from app.core.logging_config import setup_logging
+from app.db.session import SessionLocal
+from app.models import TeacherScoreRollup
+from app.repositories.teacher_score_rollup import TeacherScoreRollupRepository
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Rebuild the rollups in one transaction."""
+    db = SessionLocal()
+    try:
+        count = TeacherScoreRollupRepository(TeacherScoreRollup).rebuild(db)
+        logger.info(f"Rebuilt {count} teacher score rollups.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    main()
@@ -0,0 +1,74 @@
+"""Rebuild Comment Terms.
+
+Recount the terms of every comment of the evaluation results and answers,
+e.g. after the migration adding them or to catch up answers moved to
+another teacher or evaluation. Comments are tokenized in parallel by a pool
+of processes, one chunk at a time::
+
+    python -m app.commands.rebuild_comment_terms [--workers N]
+"""
+
+import argparse
+import logging
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.core.logging_config import setup_logging
+from app.db.session import SessionLocal
+from app.models import CommentTerm
+from app.repositories.comment_term import CommentTermRepository, count_comment_terms
+
+logger = logging.getLogger(__name__)
+
+
+def count_all_terms(
+    db: Session, executor: ProcessPoolExecutor, workers: int
+) -> Counter:
+    """Count the terms of every comment, with at most 2 chunks per worker in flight."""
+    counts = Counter()
+    pending: Set[Future] = set()
+
+    for chunk in CommentTermRepository.iter_comment_chunks(db):
+        if len(pending) >= 2 * workers:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                counts.update(future.result())
+        pending.add(executor.submit(count_comment_terms, chunk))
+
+    for future in pending:
+        counts.update(future.result())
+
+    return counts
+
+
+def rebuild(db: Session, workers: Optional[int] = None) -> int:
+    """Count the terms and replace the index with them, returns the term count."""
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = count_all_terms(db, executor, workers)
+
+    return CommentTermRepository(CommentTerm).rebuild(db, counts)
+
+
+def main(workers: Optional[int] = None) -> None:
+    """Rebuild the terms in one transaction."""
+    db = SessionLocal()
+    try:
+        count = rebuild(db, workers)
+        logger.info(f"Rebuilt {count} comment terms.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Processes, one per CPU by default."
+    )
+
+    setup_logging()
+    main(parser.parse_args().workers)
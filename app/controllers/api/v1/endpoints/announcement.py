@@ -1,11 +1,13 @@
 """Announcement Endpoint."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 
 from app import schemas, models
+from app.core.etag import conditional_response
 from app.core.security import get_current_active_user
+from app.core.serialization import serialize
 from app.db.session import get_db
 from app.use_cases.announcement import AnnouncementUseCase
 
@@ -14,26 +16,40 @@ announcement_router = APIRouter()
 
 @announcement_router.get("/announcement", response_model=Page[schemas.AnnouncementsOut])
 def get_announcements(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
 ):
     """Get all announcements."""
     announcement_uc = AnnouncementUseCase(db=db)
 
+    etag = announcement_uc.get_announcements_etag(request.url.query)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
     announcements = announcement_uc.get_announcements()
 
-    return announcements
+    return serialize(Page[schemas.AnnouncementsOut], announcements, response)
 
 
 @announcement_router.get("/announcement/{_id}", response_model=schemas.AnnouncementOut)
 def get_announcement(
     _id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
 ):
     """Get announcement by ID."""
     announcement_uc = AnnouncementUseCase(db=db)
 
+    etag = announcement_uc.get_announcement_etag(_id=_id)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
     announcement = announcement_uc.get_announcement(_id=_id)
 
     return announcement
@@ -1,11 +1,16 @@
 """Evaluation Endpoint."""
 
-from fastapi import APIRouter, Depends
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 
 from app import schemas, models
+from app.core.etag import conditional_response
+from app.core.params import ids_param
 from app.core.security import get_current_active_user
+from app.core.serialization import serialize
 from app.db.session import get_db
 from app.use_cases.evaluation import EvaluationUseCase
 
@@ -14,15 +19,23 @@ evaluation_router = APIRouter()
 
 @evaluation_router.get("/evaluation", response_model=Page[schemas.EvaluationsOut])
 def get_all(
+    request: Request,
+    response: Response,
+    ids: Optional[List[int]] = Depends(ids_param),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
 ):
     """Get all evaluations."""
     evaluation_uc = EvaluationUseCase(db=db)
 
-    evaluations = evaluation_uc.get_evaluations()
+    etag = evaluation_uc.get_evaluations_etag(request.url.query)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    evaluations = evaluation_uc.get_evaluations(ids=ids)
 
-    return evaluations
+    return serialize(Page[schemas.EvaluationsOut], evaluations, response)
 
 
 @evaluation_router.get(
@@ -30,31 +43,106 @@ def get_all(
 )
 def get_all_by_teacher_id(
     teacher_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
 ):
     """Get all evaluations."""
     evaluation_uc = EvaluationUseCase(db=db)
 
+    etag = evaluation_uc.get_evaluations_by_teacher_id_etag(
+        teacher_id, request.url.query
+    )
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
     evaluations = evaluation_uc.get_evaluations_by_teacher_id(teacher_id=teacher_id)
 
-    return evaluations
+    return serialize(Page[schemas.EvaluationsOut], evaluations, response)
+
+
+@evaluation_router.get(
+    "/evaluation/pending", response_model=Page[schemas.EvaluationsOut]
+)
+def get_pending(
+    admin_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get the evaluations not submitted yet.
+
+    Submissions are the ones of `admin_id`, the current user by default.
+    """
+    evaluation_uc = EvaluationUseCase(db=db)
+
+    evaluations = evaluation_uc.get_pending_evaluations(
+        admin_id=admin_id if admin_id is not None else current_user.id
+    )
+
+    return serialize(Page[schemas.EvaluationsOut], evaluations)
 
 
 @evaluation_router.get("/evaluation/{_id}", response_model=schemas.EvaluationOut)
 def get(
     _id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
 ):
     """Get evaluation by ID."""
     evaluation_uc = EvaluationUseCase(db=db)
 
+    etag = evaluation_uc.get_evaluation_etag(_id=_id)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+
     evaluation = evaluation_uc.get_evaluation(_id=_id)
 
     return evaluation
 
 
+@evaluation_router.get(
+    "/evaluation/{_id}/form", response_model=schemas.EvaluationFormOut
+)
+def get_form(
+    _id: int,
+    admin_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get evaluation, its questions and prior answers in one round trip.
+
+    Prior answers are the ones of `admin_id`, the current user by default.
+    """
+    evaluation_uc = EvaluationUseCase(db=db)
+
+    form = evaluation_uc.get_evaluation_form(
+        _id=_id, admin_id=admin_id if admin_id is not None else current_user.id
+    )
+
+    return serialize(schemas.EvaluationFormOut, form)
+
+
+@evaluation_router.get(
+    "/evaluation/{_id}/histogram", response_model=schemas.RatingHistogramOut
+)
+def get_histogram(
+    _id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get the rating distribution of each answered question of an evaluation."""
+    evaluation_uc = EvaluationUseCase(db=db)
+
+    histogram = evaluation_uc.get_rating_histogram(_id=_id)
+
+    return serialize(schemas.RatingHistogramOut, histogram)
+
+
 @evaluation_router.post("/evaluation", response_model=schemas.EvaluationDetailedOut)
 def create(
     obj_in: schemas.EvaluationIn,
@@ -66,7 +154,63 @@ def create(
 
     evaluation = evaluation_uc.create_evaluation(obj_in=obj_in)
 
-    return evaluation
+    return serialize(schemas.EvaluationDetailedOut, evaluation)
+
+
+@evaluation_router.post(
+    "/evaluation/{_id}/clone", response_model=List[schemas.EvaluationOut]
+)
+def clone(
+    _id: int,
+    obj_in: schemas.EvaluationCloneIn,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Clone evaluation and its questions to each of the given teachers."""
+    evaluation_uc = EvaluationUseCase(db=db)
+
+    evaluations = evaluation_uc.clone_evaluation(_id=_id, obj_in=obj_in)
+
+    return serialize(List[schemas.EvaluationOut], evaluations)
+
+
+@evaluation_router.get(
+    "/evaluation/{_id}/weights",
+    response_model=List[schemas.EvaluationCategoryWeightOut],
+)
+def get_weights(
+    _id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get the category weights of an evaluation."""
+    evaluation_uc = EvaluationUseCase(db=db)
+
+    weights = evaluation_uc.get_category_weights(_id=_id)
+
+    return serialize(List[schemas.EvaluationCategoryWeightOut], weights)
+
+
+@evaluation_router.put(
+    "/evaluation/{_id}/weights",
+    response_model=List[schemas.EvaluationCategoryWeightOut],
+)
+def update_weights(
+    _id: int,
+    obj_in: List[schemas.EvaluationCategoryWeightIn],
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Replace the category weights of an evaluation.
+
+    Results are scored with these weights, a category of the evaluation
+    without one weighs 1.
+    """
+    evaluation_uc = EvaluationUseCase(db=db)
+
+    weights = evaluation_uc.update_category_weights(_id=_id, obj_in=obj_in)
+
+    return serialize(List[schemas.EvaluationCategoryWeightOut], weights)
 
 
 @evaluation_router.put(
@@ -83,7 +227,7 @@ def update(
 
     evaluation = evaluation_uc.update_evaluation(_id=_id, obj_in=obj_in)
 
-    return evaluation
+    return serialize(schemas.EvaluationDetailedOut, evaluation)
 
 
 @evaluation_router.delete("/evaluation/{_id}", response_model=schemas.EvaluationOut)
@@ -1,11 +1,14 @@
 """Evaluation Result Endpoint."""
 
-from fastapi import APIRouter, Depends
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
 from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 
 from app import schemas, models
 from app.core.security import get_current_active_user
+from app.core.serialization import serialize
 from app.db.session import get_db
 from app.use_cases.evaluation_result import EvaluationResultUseCase
 
@@ -24,7 +27,7 @@ def get_all(
 
     evaluations = evaluation_uc.get_evaluation_results()
 
-    return evaluations
+    return serialize(Page[schemas.EvaluationsResultOut], evaluations)
 
 
 @evaluation_result_router.get(
@@ -44,7 +47,7 @@ def get_all_by_evaluation_and_admin_id(
         evaluation_id=evaluation_id, admin_id=admin_id
     )
 
-    return evaluations
+    return serialize(Page[schemas.EvaluationsOut], evaluations)
 
 
 @evaluation_result_router.get(
@@ -63,7 +66,147 @@ def get_all_by_evaluation_id(
         evaluation_id=evaluation_id
     )
 
-    return evaluations
+    return serialize(Page[schemas.EvaluationDetailedResultOut], evaluations)
+
+
+@evaluation_result_router.get(
+    "/{evaluation_id}/evaluation-result/pending",
+    response_model=Page[schemas.EvaluationsResultOut],
+)
+def get_pending_by_evaluation_id(
+    evaluation_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get the evaluation results of an evaluation not submitted yet."""
+    evaluation_uc = EvaluationResultUseCase(db=db)
+
+    evaluations = evaluation_uc.get_pending_evaluation_results(
+        evaluation_id=evaluation_id
+    )
+
+    return serialize(Page[schemas.EvaluationsResultOut], evaluations)
+
+
+@evaluation_result_router.post(
+    "/{evaluation_id}/evaluation-result/assign",
+    response_model=schemas.EvaluationAssignmentOut,
+)
+def assign(
+    evaluation_id: int,
+    admin_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Assign evaluation to every student of an admin.
+
+    Students are the ones of `admin_id`, the current user by default.
+    """
+    evaluation_uc = EvaluationResultUseCase(db=db)
+
+    assignment = evaluation_uc.assign_evaluation(
+        evaluation_id=evaluation_id,
+        admin_id=admin_id if admin_id is not None else current_user.id,
+    )
+
+    return assignment
+
+
+@evaluation_result_router.get("/{evaluation_id}/evaluation-result/export")
+def export_by_evaluation_id(
+    evaluation_id: int,
+    export_format: schemas.ExportFormatEnum = Query(
+        schemas.ExportFormatEnum.csv, alias="format"
+    ),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Export all evaluation results of an evaluation as CSV or NDJSON."""
+    evaluation_uc = EvaluationResultUseCase(db=db)
+
+    return evaluation_uc.export_evaluation_results(
+        evaluation_id=evaluation_id, export_format=export_format
+    )
+
+
+@evaluation_result_router.get("/{evaluation_id}/evaluation-result/live")
+def stream_dashboard(
+    evaluation_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Stream the live counts and category averages of an evaluation as SSE."""
+    evaluation_uc = EvaluationResultUseCase(db=db)
+
+    return evaluation_uc.stream_dashboard(evaluation_id=evaluation_id)
+
+
+@evaluation_result_router.get(
+    "/evaluation-result/ranking",
+    response_model=Page[schemas.TeacherRankOut],
+)
+def get_teacher_rankings(
+    admin_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get teachers ranked by their average score, or average in a category.
+
+    Only results of the evaluations of `admin_id` count if given.
+    """
+    evaluation_uc = EvaluationResultUseCase(db=db)
+
+    rankings = evaluation_uc.get_teacher_rankings(
+        admin_id=admin_id, category_id=category_id
+    )
+
+    return serialize(Page[schemas.TeacherRankOut], rankings)
+
+
+@evaluation_result_router.get(
+    "/evaluation-result/comments/search",
+    response_model=Page[schemas.CommentSearchOut],
+)
+def search_comments(
+    q: str = Query(min_length=1),
+    evaluation_id: Optional[int] = None,
+    teacher_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Search the comments of evaluation results and answers by keywords.
+
+    Matches come best first, with the matched words highlighted in a snippet.
+    """
+    evaluation_uc = EvaluationResultUseCase(db=db)
+
+    comments = evaluation_uc.search_comments(
+        text=q, evaluation_id=evaluation_id, teacher_id=teacher_id
+    )
+
+    return serialize(Page[schemas.CommentSearchOut], comments)
+
+
+@evaluation_result_router.get(
+    "/evaluation-result/themes",
+    response_model=List[schemas.ThemeOut],
+)
+def get_themes(
+    teacher_id: Optional[int] = None,
+    evaluation_id: Optional[int] = None,
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get the most recurring terms of the comments of a teacher or evaluation."""
+    evaluation_uc = EvaluationResultUseCase(db=db)
+
+    themes = evaluation_uc.get_themes(
+        teacher_id=teacher_id, evaluation_id=evaluation_id, limit=limit
+    )
+
+    return serialize(List[schemas.ThemeOut], themes)
 
 
 @evaluation_result_router.get(
@@ -81,10 +224,64 @@ def get_all_by_teacher_id(
         teacher_id=teacher_id
     )
 
-    return evaluations
+    return serialize(Page[schemas.EvaluationDetailedResultOut], evaluations)
 
 
 
+@evaluation_result_router.get(
+    "/evaluation-result/teacher/{teacher_id}/report",
+    response_model=schemas.TeacherReportOut,
+)
+def get_teacher_report(
+    teacher_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get rating statistics of a teacher per category and per question."""
+    evaluation_uc = EvaluationResultUseCase(db=db)
+
+    report = evaluation_uc.get_teacher_report(teacher_id=teacher_id)
+
+    return serialize(schemas.TeacherReportOut, report)
+
+
+@evaluation_result_router.get(
+    "/evaluation-result/teacher/{teacher_id}/trend",
+    response_model=schemas.TeacherTrendOut,
+)
+def get_teacher_trend(
+    teacher_id: int,
+    bucket: schemas.TrendBucketEnum = schemas.TrendBucketEnum.week,
+    category_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get the average rating of a teacher per category by week, month or term."""
+    evaluation_uc = EvaluationResultUseCase(db=db)
+
+    trend = evaluation_uc.get_teacher_trend(
+        teacher_id=teacher_id, bucket=bucket, category_id=category_id
+    )
+
+    return serialize(schemas.TeacherTrendOut, trend)
+
+
+@evaluation_result_router.get(
+    "/evaluation-result/participation",
+    response_model=schemas.ParticipationReportOut,
+)
+def get_participation(
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get submitted vs pending counts per evaluation and per teacher."""
+    evaluation_uc = EvaluationResultUseCase(db=db)
+
+    participation = evaluation_uc.get_participation()
+
+    return serialize(schemas.ParticipationReportOut, participation)
+
+
 @evaluation_result_router.get(
     "/evaluation-result/{_id}", response_model=schemas.EvaluationOut
 )
@@ -106,15 +303,19 @@ def get(
 )
 def create(
     obj_in: schemas.EvaluationResultIn,
+    upsert: bool = False,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
 ):
-    """Create evaluation result."""
+    """Create evaluation result.
+
+    With `upsert=true` a resubmission updates the student's existing result.
+    """
     evaluation_uc = EvaluationResultUseCase(db=db)
 
-    evaluation = evaluation_uc.create_evaluation_result(obj_in=obj_in)
+    evaluation = evaluation_uc.create_evaluation_result(obj_in=obj_in, upsert=upsert)
 
-    return evaluation
+    return serialize(schemas.EvaluationDetailedResultOut, evaluation)
 
 
 @evaluation_result_router.put(
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from app import schemas, models
 from app.core.security import get_current_active_user
+from app.core.serialization import serialize
 from app.db.session import get_db
 from app.use_cases.item import ItemUseCase
 
@@ -22,7 +23,7 @@ def get_items(
 
     items = item_uc.get_items()
 
-    return items
+    return serialize(Page[schemas.ItemOut], items)
 
 
 @item_router.get("/item/{_id}", response_model=schemas.ItemOut)
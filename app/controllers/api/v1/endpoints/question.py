@@ -1,11 +1,15 @@
 """Question Endpoint."""
 
+from typing import List, Optional
+
 from fastapi import APIRouter, Depends
 from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 
 from app import schemas, models
+from app.core.params import ids_param
 from app.core.security import get_current_active_user
+from app.core.serialization import serialize
 from app.db.session import get_db
 from app.use_cases.question import QuestionUseCase
 
@@ -14,15 +18,32 @@ question_router = APIRouter()
 
 @question_router.get("/question", response_model=Page[schemas.QuestionOut])
 def get_questions(
+    ids: Optional[List[int]] = Depends(ids_param),
     db: Session = Depends(get_db),
     current_question: models.Question = Depends(get_current_active_user),
 ):
     """Get all questions."""
     question_uc = QuestionUseCase(db=db)
 
-    questions = question_uc.get_questions()
+    questions = question_uc.get_questions(ids=ids)
+
+    return serialize(Page[schemas.QuestionOut], questions)
+
+
+@question_router.get(
+    "/evaluation/{evaluation_id}/questions", response_model=Page[schemas.QuestionOut]
+)
+def get_questions_by_evaluation_id(
+    evaluation_id: int,
+    db: Session = Depends(get_db),
+    current_question: models.Question = Depends(get_current_active_user),
+):
+    """Get all questions of an evaluation."""
+    question_uc = QuestionUseCase(db=db)
+
+    questions = question_uc.get_questions_by_evaluation_id(evaluation_id=evaluation_id)
 
-    return questions
+    return serialize(Page[schemas.QuestionOut], questions)
 
 
 @question_router.get("/question/{_id}", response_model=schemas.QuestionOut)
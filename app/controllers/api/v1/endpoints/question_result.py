@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from app import schemas, models
 from app.core.security import get_current_active_user
+from app.core.serialization import serialize
 from app.db.session import get_db
 from app.use_cases.question_result import QuestionResultUseCase
 
@@ -24,7 +25,7 @@ def get_question_results(
 
     questions = question_uc.get_question_results()
 
-    return questions
+    return serialize(Page[schemas.QuestionResultOut], questions)
 
 
 @question_result_router.get(
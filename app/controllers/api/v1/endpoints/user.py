@@ -1,11 +1,15 @@
 """User Endpoint."""
 
+from typing import List, Optional
+
 from fastapi import APIRouter, Depends
 from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 
 from app import schemas, models
+from app.core.params import ids_param
 from app.core.security import get_current_active_user
+from app.core.serialization import serialize
 from app.db.session import get_db
 from app.schemas.password import ResetPasswordRequest, EmailSchema
 from app.use_cases.user import UserUseCase
@@ -15,15 +19,16 @@ user_router = APIRouter()
 
 @user_router.get("/user", response_model=Page[schemas.UserOut])
 def get_users(
+    ids: Optional[List[int]] = Depends(ids_param),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user),
 ):
     """Get all users."""
     user_uc = UserUseCase(db=db)
 
-    users = user_uc.get_users()
+    users = user_uc.get_users(ids=ids)
 
-    return users
+    return serialize(Page[schemas.UserOut], users)
 
 
 @user_router.get("/user/{_id}", response_model=schemas.UserOut)
@@ -17,6 +17,16 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1000000
     TOKEN_URL = API_PREFIX + "/auth/login/token"
     ALGORITHM = "HS256"
+    FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "false").lower() == "true"
+    RAISE_ON_LAZY_LOAD = os.getenv("RAISE_ON_LAZY_LOAD", "false").lower() == "true"
+    IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+    IDEMPOTENCY_MAX_KEYS = int(os.getenv("IDEMPOTENCY_MAX_KEYS", "10000"))
+    TERM_START_MONTHS = tuple(
+        int(month) for month in os.getenv("TERM_START_MONTHS", "1,8").split(",")
+    )
+    DASHBOARD_KEEPALIVE_SECONDS = float(os.getenv("DASHBOARD_KEEPALIVE_SECONDS", "15"))
+    DASHBOARD_RESYNC_SECONDS = float(os.getenv("DASHBOARD_RESYNC_SECONDS", "300"))
+    DASHBOARD_SNAPSHOT_ATTEMPTS = int(os.getenv("DASHBOARD_SNAPSHOT_ATTEMPTS", "3"))
 
 
 settings = Settings()
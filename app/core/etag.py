@@ -0,0 +1,41 @@
+"""ETag."""
+
+import hashlib
+from http import HTTPStatus
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def compute_etag(*parts: Any) -> str:
+    """Compute a weak ETag from the given validator parts."""
+    digest = hashlib.md5(
+        "|".join(str(part) for part in parts).encode("utf-8"), usedforsecurity=False
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check whether an If-None-Match header value matches the ETag."""
+    if not if_none_match:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # Weak comparison, the W/ prefix is ignored on both sides
+    return "*" in candidates or etag.removeprefix("W/") in [
+        candidate.removeprefix("W/") for candidate in candidates
+    ]
+
+
+def conditional_response(
+    request: Request, response: Response, etag: Optional[str]
+) -> Optional[Response]:
+    """Return a 304 response when the client's ETag matches, else tag the response."""
+    if etag is None:
+        return None
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return None
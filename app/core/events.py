@@ -0,0 +1,131 @@
+"""Events.
+
+In-process broadcaster of live events, e.g. the changes of the results of an
+evaluation to its dashboards. Events reach the subscribers of the same
+process only, so every writer and streamer must share one worker, or a
+shared broker must relay the events.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Optional, Set
+
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# Sent instead of the events a slow subscriber missed, it must start over
+RESYNC_EVENT = "resync"
+
+
+@dataclass(frozen=True)
+class Event:
+    """Event published on a channel."""
+
+    name: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+def dashboard_channel(evaluation_id: int) -> str:
+    """Get the channel of the live dashboard of an evaluation."""
+    return f"evaluation:{evaluation_id}:dashboard"
+
+
+class Subscription:
+    """Events of a channel queued for one subscriber, on its event loop."""
+
+    def __init__(
+        self,
+        broadcaster: "EventBroadcaster",
+        channel: Hashable,
+        maxsize: int = SUBSCRIBER_QUEUE_SIZE,
+    ):
+        """Initialize on the running event loop."""
+        self.broadcaster = broadcaster
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self._queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """Wait for the next event, None when the timeout expires first."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def put(self, event: Event) -> None:
+        """Queue an event, from the event loop of the subscription."""
+        if self._queue.full():
+            # Missed events can't be replayed, replace them with a resync
+            self.clear()
+            event = Event(RESYNC_EVENT)
+        self._queue.put_nowait(event)
+
+    def empty(self) -> bool:
+        """Check whether no event is queued."""
+        return self._queue.empty()
+
+    def clear(self) -> None:
+        """Drop the queued events."""
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self.broadcaster.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        """Use as a context manager closing the subscription."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the subscription."""
+        self.close()
+
+
+class EventBroadcaster:
+    """Publish events to the subscribers of a channel, from any thread."""
+
+    def __init__(self):
+        """Initialize without subscribers."""
+        self._subscriptions: Dict[Hashable, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: Hashable) -> Subscription:
+        """Subscribe to a channel, from a coroutine."""
+        subscription = Subscription(self, channel)
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription."""
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(subscription.channel, None)
+
+    def has_subscribers(self, channel: Optional[Hashable] = None) -> bool:
+        """Check whether a channel, or any channel, has subscribers."""
+        with self._lock:
+            if channel is None:
+                return bool(self._subscriptions)
+            return channel in self._subscriptions
+
+    def publish(
+        self, channel: Hashable, name: str, data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Send an event to every subscriber of a channel, without waiting."""
+        event = Event(name, data or {})
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+            except RuntimeError:
+                # The event loop of the subscriber is closed
+                self.unsubscribe(subscription)
+
+
+broadcaster = EventBroadcaster()
@@ -0,0 +1,171 @@
+"""Idempotency."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+
+from app.core.config import settings
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+@dataclass
+class IdempotencyEntry:
+    """Stored outcome of a request, `status_code` is None while in flight."""
+
+    fingerprint: str
+    expires_at: float
+    status_code: Optional[int] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+
+class IdempotencyStore:
+    """In-process store of idempotency keys with TTL and size based eviction."""
+
+    def __init__(self, ttl: float, max_keys: int):
+        """Initialize with the TTL in seconds and the maximum number of keys."""
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self._entries: "OrderedDict[str, IdempotencyEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, fingerprint: str) -> Tuple[IdempotencyEntry, bool]:
+        """Get the entry of a key, creating an in-flight one if there is none.
+
+        Returns the entry and whether it was created by this call.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry, False
+
+            entry = IdempotencyEntry(fingerprint=fingerprint, expires_at=now + self.ttl)
+            self._entries[key] = entry
+            return entry, True
+
+    def complete(self, key: str, response: Response, body: bytes) -> None:
+        """Store the response of a reserved key for replays."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.status_code = response.status_code
+                entry.headers = dict(response.headers)
+                entry.body = body
+
+    def release(self, key: str) -> None:
+        """Forget a reserved key, so the request can be retried."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every key."""
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired keys, then the oldest ones above max_keys."""
+        # Entries are kept in insertion order, which is also expiry order
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.expires_at > now and len(self._entries) < self.max_keys:
+                break
+            del self._entries[key]
+
+
+idempotency_store = IdempotencyStore(
+    ttl=settings.IDEMPOTENCY_TTL_SECONDS, max_keys=settings.IDEMPOTENCY_MAX_KEYS
+)
+
+
+def _digest(*parts: bytes) -> str:
+    """Hash the given parts."""
+    return hashlib.sha256(b"\0".join(parts)).hexdigest()
+
+
+class IdempotencyMiddleware(BaseHTTPMiddleware):
+    """Answer retried POST requests with the response of the first attempt.
+
+    Requests are matched on the `Idempotency-Key` header, scoped by the
+    Authorization header and the path, and must carry the same body. Server
+    errors are not stored, so those requests can be retried.
+    """
+
+    def __init__(self, app, store: IdempotencyStore = idempotency_store):
+        """Initialize with the store of keys."""
+        super().__init__(app)
+        self.store = store
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        """Replay, reject or execute and store the request."""
+        idempotency_key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if request.method != "POST" or not idempotency_key:
+            return await call_next(request)
+
+        key = _digest(
+            request.headers.get("Authorization", "").encode(),
+            request.url.path.encode(),
+            idempotency_key.encode(),
+        )
+        fingerprint = _digest(await request.body())
+
+        entry, created = self.store.reserve(key, fingerprint)
+        if not created:
+            return self._replay(entry, fingerprint)
+
+        try:
+            response = await call_next(request)
+            body = b"".join([chunk async for chunk in response.body_iterator])
+        except Exception:
+            self.store.release(key)
+            raise
+
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            self.store.release(key)
+        else:
+            self.store.complete(key, response, body)
+
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+        )
+
+    @staticmethod
+    def _replay(entry: IdempotencyEntry, fingerprint: str) -> Response:
+        """Answer a request whose key was already seen."""
+        if entry.fingerprint != fingerprint:
+            return JSONResponse(
+                status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                content={
+                    "detail": "Idempotency-Key was already used with another body."
+                },
+            )
+
+        if entry.status_code is None:
+            return JSONResponse(
+                status_code=HTTPStatus.CONFLICT,
+                content={
+                    "detail": "A request with this Idempotency-Key is in progress."
+                },
+            )
+
+        return Response(
+            content=entry.body,
+            status_code=entry.status_code,
+            headers={**entry.headers, IDEMPOTENT_REPLAYED_HEADER: "true"},
+        )
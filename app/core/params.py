@@ -0,0 +1,24 @@
+"""Params."""
+
+from http import HTTPStatus
+from typing import List, Optional
+
+from fastapi import HTTPException, Query
+
+
+def ids_param(
+    ids: Optional[str] = Query(
+        None, description="Comma separated IDs to fetch in one request, e.g. 1,2,3"
+    ),
+) -> Optional[List[int]]:
+    """Parse the comma separated `ids` query parameter."""
+    if ids is None:
+        return None
+
+    try:
+        return [int(_id) for _id in ids.split(",") if _id.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail="ids must be a comma separated list of integers.",
+        )
@@ -0,0 +1,54 @@
+"""Serialization."""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from starlette.responses import Response
+
+from app.core.config import settings
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core instead of json.dumps."""
+
+    def render(self, content: Any) -> bytes:
+        """Render content to JSON bytes."""
+        return to_json(content)
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(response_type: Any) -> TypeAdapter:
+    """Get a cached TypeAdapter for the response type."""
+    return TypeAdapter(response_type)
+
+
+def serialize(
+    response_type: Any, content: Any, response: Optional[Response] = None
+) -> Any:
+    """Serialize already validated content straight into a JSON response.
+
+    FastAPI validates the returned content against the `response_model` again
+    before encoding it. Returning a response skips that second pass. When the
+    fast path is disabled or the content is already a response (e.g. an error
+    from a use case), the content is returned untouched.
+
+    FastAPI drops the headers set on the injected `response` (e.g. the ETag)
+    once a response is returned, pass it to carry them over.
+    """
+    if not settings.FAST_JSON_RESPONSES or isinstance(content, Response):
+        return content
+
+    fast_response = Response(
+        content=get_type_adapter(response_type).dump_json(content),
+        media_type="application/json",
+    )
+    if response is not None:
+        fast_response.raw_headers.extend(
+            (key, value)
+            for key, value in response.raw_headers
+            if key not in (b"content-length", b"content-type")
+        )
+    return fast_response
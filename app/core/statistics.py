@@ -0,0 +1,78 @@
+"""Statistics.
+
+Rating statistics computed from histograms, i.e. the number of answers per
+rating value. Ratings take few distinct values, so a histogram fetched with
+GROUP BY is a compact and exact summary of any number of answers, and the
+cost here depends on the distinct ratings only.
+"""
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Mapping
+
+# Two-sided 95% confidence, normal approximation of the mean
+Z_95 = 1.96
+
+# Ratings of the evaluation forms
+RATING_SCALE = (1, 2, 3, 4, 5)
+
+
+@dataclass(frozen=True)
+class RatingStatistics:
+    """Summary of a set of ratings."""
+
+    count: int = 0
+    mean: float = 0.0
+    std: float = 0.0
+    median: float = 0.0
+    ci_low: float = 0.0
+    ci_high: float = 0.0
+    distribution: Dict[int, int] = field(default_factory=dict)
+
+
+def merge(histograms: Iterable[Mapping[int, int]]) -> Counter:
+    """Add histograms up, e.g. the ones of the questions of a category."""
+    total = Counter()
+    for histogram in histograms:
+        total.update(histogram)
+    return total
+
+
+def _nth(ratings: list, counts: list, n: int) -> int:
+    """Get the n-th (0-based) rating in ascending order."""
+    for rating, count in zip(ratings, counts):
+        if n < count:
+            return rating
+        n -= count
+    raise IndexError(n)
+
+
+def describe(histogram: Mapping[int, int]) -> RatingStatistics:
+    """Get count, mean, sample std, median and 95% CI of the mean."""
+    ratings = sorted(rating for rating, count in histogram.items() if count)
+    counts = [histogram[rating] for rating in ratings]
+    n = sum(counts)
+    if not n:
+        return RatingStatistics()
+
+    mean = sum(rating * count for rating, count in zip(ratings, counts)) / n
+    variance = (
+        sum(count * (rating - mean) ** 2 for rating, count in zip(ratings, counts))
+        / (n - 1)
+        if n > 1
+        else 0.0
+    )
+    std = math.sqrt(variance)
+    median = (_nth(ratings, counts, (n - 1) // 2) + _nth(ratings, counts, n // 2)) / 2
+    margin = Z_95 * std / math.sqrt(n)
+
+    return RatingStatistics(
+        count=n,
+        mean=round(mean, 2),
+        std=round(std, 2),
+        median=median,
+        ci_low=round(mean - margin, 2),
+        ci_high=round(mean + margin, 2),
+        distribution=dict(zip(ratings, counts)),
+    )
@@ -0,0 +1,54 @@
+"""Text.
+
+Tokenizer of the feedback comments, for the term index behind the themes.
+"""
+
+import re
+from collections import Counter
+from typing import List, Optional
+
+MIN_TERM_LENGTH = 3
+MAX_TERM_LENGTH = 64
+
+# Words made of letters, with their contractions, e.g. "doesn't"
+WORD_PATTERN = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+
+STOP_WORDS = frozenset(
+    """
+    about above after again against all also always and any are aren't
+    because been before being below between both but can can't cannot could
+    couldn't did didn't does doesn't doing don't down during each even ever
+    every few for from further get gets got had hadn't has hasn't have haven't
+    having her here hers herself him himself his how i'm i've into isn't it's
+    its itself just let's like more most much must mustn't myself never nor
+    not now off once only other ought our ours ourselves out over own really
+    same shan't she she's should shouldn't some still such than that that's
+    the their theirs them themselves then there there's these they they're
+    this those through too under until very was wasn't we're we've were
+    weren't what what's when where which while who who's whom why will with
+    won't would wouldn't yet you you're you've your yours yourself yourselves
+    """.split()
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split a comment into lowercase terms, without stop words or short words."""
+    if not text:
+        return []
+
+    terms = []
+    for word in WORD_PATTERN.findall(text.lower().replace("’", "'")):
+        if word in STOP_WORDS:
+            continue
+
+        # Possessives count as the word, e.g. "teacher's" as "teacher"
+        term = word.removesuffix("'s")
+        if MIN_TERM_LENGTH <= len(term) <= MAX_TERM_LENGTH:
+            terms.append(term)
+
+    return terms
+
+
+def count_terms(text: Optional[str]) -> Counter:
+    """Count the occurrences of the terms of a comment."""
+    return Counter(tokenize(text))
@@ -0,0 +1,88 @@
+"""Full Text.
+
+Full-text indexes of the comments of evaluation and question results. The
+database maintains them on every write:
+
+* PostgreSQL: a generated `comment_tsv` tsvector column with a GIN index.
+* SQLite: an external content FTS5 table, `<table>_fts`, kept in sync by
+  triggers.
+
+Neither is mapped on the models, they are created by the migrations and, for
+`create_all`, by the DDL events registered here.
+"""
+
+from typing import Any, List
+
+from sqlalchemy import DDL, Table, event
+
+TEXT_SEARCH_CONFIG = "english"
+TSVECTOR_COLUMN = "comment_tsv"
+
+
+def fts_table_name(table_name: str) -> str:
+    """Get the name of the FTS5 table indexing a table."""
+    return f"{table_name}_fts"
+
+
+def tsvector_index_name(table_name: str) -> str:
+    """Get the name of the GIN index of a table."""
+    return f"ix_{table_name}_{TSVECTOR_COLUMN}"
+
+
+def postgresql_statements(table_name: str) -> List[str]:
+    """Get the statements creating the tsvector column and index of a table."""
+    return [
+        f"ALTER TABLE {table_name} ADD COLUMN {TSVECTOR_COLUMN} tsvector "
+        f"GENERATED ALWAYS AS (to_tsvector('{TEXT_SEARCH_CONFIG}', "
+        "coalesce(comment, ''))) STORED",
+        f"CREATE INDEX {tsvector_index_name(table_name)} ON {table_name} "
+        f"USING gin ({TSVECTOR_COLUMN})",
+    ]
+
+
+def sqlite_statements(table_name: str) -> List[str]:
+    """Get the statements creating the FTS5 table and triggers of a table."""
+    fts = fts_table_name(table_name)
+    insert = f"INSERT INTO {fts}(rowid, comment) VALUES (new.id, new.comment);"
+    delete = (
+        f"INSERT INTO {fts}({fts}, rowid, comment) "
+        "VALUES ('delete', old.id, old.comment);"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5(comment, content='{table_name}', "
+        "content_rowid='id', tokenize='porter unicode61')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table_name} BEGIN {insert} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table_name} BEGIN {delete} END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF comment ON {table_name} "
+        f"BEGIN {delete} {insert} END",
+    ]
+
+
+def index_comments(table: Table) -> None:
+    """Create the full-text index of the comments of a table with the table."""
+    for statement in postgresql_statements(table.name):
+        event.listen(
+            table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+
+    for statement in sqlite_statements(table.name):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {fts_table_name(table.name)}").execute_if(
+            dialect="sqlite"
+        ),
+    )
+
+
+def include_object(
+    obj: Any, name: str, type_: str, reflected: bool, compare_to: Any
+) -> bool:
+    """Keep the full-text columns, indexes and tables out of autogenerate."""
+    if not reflected:
+        return True
+    if type_ in ("column", "index"):
+        return not name.endswith(TSVECTOR_COLUMN)
+    # FTS5 tables come with shadow tables, e.g. question_result_fts_data
+    return not (type_ == "table" and "_fts" in name)
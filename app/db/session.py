@@ -1,13 +1,16 @@
 """Session."""
 
-from typing import Generator
+from typing import Any, Generator
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import ORMExecuteState, raiseload, sessionmaker
 from sqlalchemy_utils import database_exists, create_database
 
 from app.core.config import settings
+from app.repositories.comment_term import maintain_comment_terms
+from app.repositories.dashboard import publish_dashboard_events
+from app.repositories.teacher_score_rollup import maintain_teacher_score_rollups
 
 
 load_dotenv()
@@ -24,6 +27,35 @@ else:
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _raiseload_all(orm_execute_state: ORMExecuteState) -> None:
+    """Add raiseload("*") to top level ORM selects."""
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            raiseload("*", sql_only=True)
+        )
+
+
+def enable_raise_on_lazy_load(target: Any) -> None:
+    """Make relationships raise instead of emitting a query per row.
+
+    Relationships must then be requested with loader options; related records
+    already in the identity map are still returned.
+    """
+    event.listen(target, "do_orm_execute", _raiseload_all)
+
+
+if settings.RAISE_ON_LAZY_LOAD:
+    enable_raise_on_lazy_load(SessionLocal)
+
+maintain_teacher_score_rollups(SessionLocal)
+maintain_comment_terms(SessionLocal)
+publish_dashboard_events(SessionLocal)
+
+
 # Dependency callable for DB
 def get_db() -> Generator:
     """Yield a new database session."""
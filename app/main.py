@@ -1,15 +1,27 @@
 """Main."""
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi_pagination import add_pagination
 from starlette.middleware.cors import CORSMiddleware
 
 from app.controllers.api.v1.endpoints.base import api_controller
+from app.core.config import settings
+from app.core.idempotency import IdempotencyMiddleware
 from app.core.logging_config import setup_logging
+from app.core.serialization import FastJSONResponse
 
 setup_logging()
 
-app = FastAPI(title="Project", version="1")
+app = FastAPI(
+    title="Project",
+    version="1",
+    default_response_class=(
+        FastJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
+    ),
+)
+
+app.add_middleware(IdempotencyMiddleware)
 
 # Allow all origins
 app.add_middleware(
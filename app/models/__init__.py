@@ -1,9 +1,13 @@
 """Models."""
 
 from .item import Item  # noqa
+from .category import Category  # noqa
 from .user import User  # noqa
 from .evaluation import Evaluation  # noqa
 from .question import Question  # noqa
 from .announcement import Announcement  # noqa
 from .evaluation_result import EvaluationResult  # noqa
 from .question_result import QuestionResult  # noqa
+from .evaluation_category_weight import EvaluationCategoryWeight  # noqa
+from .teacher_score_rollup import TeacherScoreRollup  # noqa
+from .comment_term import CommentTerm  # noqa
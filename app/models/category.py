@@ -0,0 +1,17 @@
+"""Category model."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, String, Integer, SmallInteger, DateTime
+
+from app.db.base_class import Base
+
+
+class Category(Base):
+    """Category Class."""
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False, unique=True)
+    display_order = Column(SmallInteger, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
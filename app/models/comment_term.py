@@ -0,0 +1,46 @@
+"""Comment Term model."""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    DateTime,
+    ForeignKey,
+    UniqueConstraint,
+)
+
+from app.db.base_class import Base
+
+
+class CommentTerm(Base):
+    """Comment Term Class.
+
+    Occurrences of a term in the comments of the results of a teacher for an
+    evaluation, and of their answers.
+    """
+
+    __tablename__ = "comment_term"
+    __table_args__ = (
+        UniqueConstraint(
+            "teacher_id",
+            "evaluation_id",
+            "term",
+            name="uq_comment_term_teacher_id_evaluation_id_term",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    teacher_id = Column(
+        Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
+    evaluation_id = Column(
+        Integer,
+        ForeignKey("evaluation.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    term = Column(String(64), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,38 @@
+"""Evaluation Category Weight model."""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    Float,
+    DateTime,
+    ForeignKey,
+    UniqueConstraint,
+)
+
+from app.db.base_class import Base
+
+
+class EvaluationCategoryWeight(Base):
+    """Evaluation Category Weight Class."""
+
+    __tablename__ = "evaluation_category_weight"
+    __table_args__ = (
+        UniqueConstraint(
+            "evaluation_id",
+            "category_id",
+            name="uq_evaluation_category_weight_evaluation_id_category_id",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    evaluation_id = Column(
+        Integer, ForeignKey("evaluation.id", ondelete="CASCADE"), nullable=False
+    )
+    category_id = Column(
+        Integer, ForeignKey("category.id", ondelete="CASCADE"), nullable=False
+    )
+    weight = Column(Float, nullable=False, default=1.0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
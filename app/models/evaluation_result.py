@@ -2,16 +2,41 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    DateTime,
+    ForeignKey,
+    Boolean,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
+from app.db.full_text import index_comments
 
 
 class EvaluationResult(Base):
     """Evaluation Result Class."""
 
     __tablename__ = "evaluation_result"
+    __table_args__ = (
+        # One result per student (admin_id) and evaluation
+        UniqueConstraint(
+            "evaluation_id",
+            "admin_id",
+            name="uq_evaluation_result_evaluation_id_admin_id",
+        ),
+        # Covers the "submitted yet?" lookups of a student without table reads
+        Index(
+            "ix_evaluation_result_evaluation_id_admin_id_is_submitted",
+            "evaluation_id",
+            "admin_id",
+            "is_submitted",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=True)
@@ -31,3 +56,6 @@ class EvaluationResult(Base):
         "User", back_populates="evaluation_results"
     )  # User role must be teacher in FE
     evaluation = relationship("Evaluation", back_populates="evaluation_results")
+
+
+index_comments(EvaluationResult.__table__)
@@ -19,11 +19,20 @@ class Question(Base):
         Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=True
     )
     evaluation_id = Column(
-        Integer, ForeignKey("evaluation.id", ondelete="CASCADE"), nullable=True
+        Integer,
+        ForeignKey("evaluation.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
     )
     student_name = Column(String, nullable=True)
     evaluation_title = Column(String, nullable=True)
     category = Column(String, nullable=True)
+    category_id = Column(
+        Integer,
+        ForeignKey("category.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -2,29 +2,58 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    SmallInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+)
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
+from app.db.full_text import index_comments
 
 
 class QuestionResult(Base):
     """Question Result Class."""
 
     __tablename__ = "question_result"
+    __table_args__ = (
+        # Rating histograms per question, counted from the index alone
+        Index("ix_question_result_question_id_rating", "question_id", "rating"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
+    question_id = Column(
+        Integer,
+        ForeignKey("question.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    # question_text, student_name, evaluation_title and category are copies,
+    # left NULL when they can be read through question_id and student_id
     question_text = Column(String, nullable=True)
-    rating = Column(Integer, nullable=True)
+    rating = Column(SmallInteger, nullable=True)
     comment = Column(String, nullable=True)
     student_id = Column(
         Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=True
     )
-    evaluation_result_id = Column(Integer, nullable=True)
+    evaluation_result_id = Column(Integer, nullable=True, index=True)
     student_name = Column(String, nullable=True)
     evaluation_title = Column(String, nullable=True)
     category = Column(String, nullable=True)
+    category_id = Column(
+        Integer,
+        ForeignKey("category.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     user = relationship("User", back_populates="question_results")
+
+
+index_comments(QuestionResult.__table__)
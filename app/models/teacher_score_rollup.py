@@ -0,0 +1,45 @@
+"""Teacher Score Rollup model."""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    Date,
+    DateTime,
+    ForeignKey,
+    UniqueConstraint,
+)
+
+from app.db.base_class import Base
+
+
+class TeacherScoreRollup(Base):
+    """Teacher Score Rollup Class.
+
+    Sum and count of the ratings of a teacher per category and week, the week
+    starting on `bucket_start` (a Monday, or the 1st of the month for the part
+    of a week in the next month).
+    """
+
+    __tablename__ = "teacher_score_rollup"
+    __table_args__ = (
+        UniqueConstraint(
+            "teacher_id",
+            "category_id",
+            "bucket_start",
+            name="uq_teacher_score_rollup_teacher_id_category_id_bucket_start",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    teacher_id = Column(
+        Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
+    category_id = Column(
+        Integer, ForeignKey("category.id", ondelete="CASCADE"), nullable=False
+    )
+    bucket_start = Column(Date, nullable=False)
+    rating_sum = Column(Integer, nullable=False, default=0)
+    rating_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
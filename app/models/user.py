@@ -2,7 +2,8 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -34,3 +35,22 @@ class User(Base):
         "EvaluationResult", back_populates="user", cascade="all, delete-orphan"
     )
     question_results = relationship("QuestionResult", back_populates="user")
+
+    @hybrid_property
+    def full_name(self) -> str:
+        """Full name as displayed in the evaluation pages, without missing parts."""
+        name = self.first_name or ""
+        for part in (self.middle_name, self.last_name):
+            if part is not None:
+                name += f" {part}"
+        return name.strip(" ")
+
+    @full_name.inplace.expression
+    @classmethod
+    def _full_name_expression(cls):
+        """Full name as a SQL expression, for queries that join users."""
+        return func.trim(
+            func.coalesce(cls.first_name, "")
+            + func.coalesce(" " + cls.middle_name, "")
+            + func.coalesce(" " + cls.last_name, "")
+        )
@@ -1,13 +1,31 @@
 """Base Repository."""
 
 import logging
+from datetime import datetime
 from http import HTTPStatus
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from fastapi.encoders import jsonable_encoder
+from fastapi_pagination import Page
+from fastapi_pagination.ext.sqlalchemy import paginate
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from sqlalchemy import exc
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy import Column, Insert, Row, Select, exc, func, select
+from sqlalchemy.dialects import postgresql, sqlite
 
 from app.db.base_class import Base
 from exceptions.exceptions import DatabaseException, APIException
@@ -18,6 +36,28 @@ ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# Keep IN lists well below the bind parameter limits of the database drivers
+GET_MANY_CHUNK_SIZE = 500
+
+
+def apply_options(query: Query, options: Sequence[ORMOption]) -> Query:
+    """Apply loader options to a query.
+
+    Options are e.g. `selectinload`/`joinedload` for related records or
+    `load_only` to project columns.
+    """
+    return query.options(*options) if options else query
+
+
+def insert_on_conflict(db: Session, model: Type[Base]) -> Insert:
+    """Build an INSERT supporting ON CONFLICT for the dialect of the session.
+
+    PostgreSQL in production, SQLite in tests.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
+
 
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base Repository."""
@@ -32,10 +72,12 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
-    def get_all(self, db: Session) -> List[ModelType]:
+    def get_all(
+        self, db: Session, *, options: Sequence[ORMOption] = ()
+    ) -> List[ModelType]:
         """Retrieve all records, with optional pagination."""
         try:
-            return db.query(self.model).all()
+            return apply_options(db.query(self.model), options).all()
         except Exception as e:
             # Log the exception (you may want to use your logger here)
             logger.error(f"Error fetching all items: {str(e)}")
@@ -44,9 +86,15 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 detail="An error occurred while fetching the items.",
             ) from e
 
-    def get(self, db: Session, _id: int) -> Optional[ModelType]:
+    def get(
+        self, db: Session, _id: int, *, options: Sequence[ORMOption] = ()
+    ) -> Optional[ModelType]:
         """Get record by its ID.."""
-        item = db.query(self.model).filter(self.model.id == _id).first()
+        item = (
+            apply_options(db.query(self.model), options)
+            .filter(self.model.id == _id)
+            .first()
+        )
 
         if item is None:
             raise APIException(
@@ -54,6 +102,106 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             )
         return item
 
+    def get_many(
+        self,
+        db: Session,
+        ids: Iterable[int],
+        chunk_size: int = GET_MANY_CHUNK_SIZE,
+        *,
+        options: Sequence[ORMOption] = (),
+    ) -> List[ModelType]:
+        """Get records by their IDs with one IN query per chunk.
+
+        Records are returned in the order of the requested IDs, duplicates and
+        missing IDs are skipped.
+        """
+        ids = list(dict.fromkeys(ids))
+        try:
+            items = []
+            for start in range(0, len(ids), chunk_size):
+                items.extend(
+                    apply_options(db.query(self.model), options)
+                    .filter(self.model.id.in_(ids[start : start + chunk_size]))
+                    .all()
+                )
+        except Exception as e:
+            logger.error(f"Error fetching items by ids: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the items.",
+            ) from e
+
+        items_by_id = {item.id: item for item in items}
+        return [items_by_id[_id] for _id in ids if _id in items_by_id]
+
+    def select_columns(self, fields: Iterable[str]) -> Select:
+        """Select the table columns of the model among the given field names.
+
+        Pass the `model_fields` of the target `*Out` schema; fields which are
+        not columns are skipped.
+        """
+        columns: Dict[str, Column] = self.model.__table__.columns
+        return select(*[columns[field] for field in fields if field in columns])
+
+    @staticmethod
+    def get_rows(db: Session, query: Select) -> List[Row]:
+        """Execute a column select and return plain rows.
+
+        Rows skip ORM hydration and the identity map, and validate into
+        `from_attributes` schemas directly.
+        """
+        try:
+            return list(db.execute(query).all())
+        except Exception as e:
+            logger.error(f"Error fetching rows: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the items.",
+            ) from e
+
+    @staticmethod
+    def paginate_rows(
+        db: Session,
+        query: Select,
+        transformer: Optional[Callable[[Sequence[Row]], Sequence[Row]]] = None,
+    ) -> Page:
+        """Execute a column select one page at a time, with LIMIT/OFFSET and COUNT.
+
+        Uses the pagination params of the current request. The rows of the page
+        go through `transformer` if given, e.g. to complete them.
+        """
+        try:
+            return paginate(db, query, transformer=transformer)
+        except exc.SQLAlchemyError as e:
+            logger.error(f"Error fetching page: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the items.",
+            ) from e
+
+    def get_all_rows(
+        self, db: Session, fields: Iterable[str], *criterion: Any
+    ) -> List[Row]:
+        """Retrieve only the given fields of the filtered records, as rows."""
+        return self.get_rows(db, self.select_columns(fields).filter(*criterion))
+
+    def get_version(
+        self, db: Session, *criterion: Any
+    ) -> Tuple[Optional[datetime], int]:
+        """Get max(updated_at) and count of the filtered records, without rows."""
+        try:
+            return tuple(
+                db.query(func.max(self.model.updated_at), func.count(self.model.id))
+                .filter(*criterion)
+                .one()
+            )
+        except Exception as e:
+            logger.error(f"Error fetching version: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the version.",
+            ) from e
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """Create record."""
         try:
@@ -0,0 +1,41 @@
+"""Category Repository."""
+
+from typing import List, Optional, TypeVar, cast
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.models import Category
+from app.repositories.base import BaseRepository
+from app.schemas import CategoryIn, CategoryUpdate
+
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+
+
+class CategoryRepository(BaseRepository[Category, CategoryIn, CategoryUpdate]):
+    """Category Repository Class."""
+
+    @staticmethod
+    def get_all_ordered(db: Session) -> List[Category]:
+        """Get all categories in display order."""
+        response = cast(
+            List[Category],
+            db.query(Category).order_by(Category.display_order, Category.id).all(),
+        )
+
+        return response
+
+    @staticmethod
+    def get_id_by_name(db: Session, name: str) -> Optional[int]:
+        """Get the ID of a category by its name."""
+        return db.query(Category.id).filter(Category.name == name).scalar()
+
+    @classmethod
+    def with_category_id(cls, db: Session, obj_in: SchemaType) -> SchemaType:
+        """Fill category_id from the category name when only the name is given."""
+        if obj_in.category_id is not None or not obj_in.category:
+            return obj_in
+
+        return obj_in.model_copy(
+            update={"category_id": cls.get_id_by_name(db, obj_in.category)}
+        )
@@ -0,0 +1,181 @@
+"""Comment Search.
+
+Full-text search over the comments of evaluation and question results, on
+the indexes of app/db/full_text.py. Matches of both tables are ranked
+together, best first, with a highlighted snippet of their comment.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
+
+from fastapi_pagination import Page
+from sqlalchemy import (
+    Row,
+    Select,
+    Subquery,
+    column,
+    false,
+    func,
+    literal,
+    literal_column,
+    null,
+    select,
+    table,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from app.db.full_text import TEXT_SEARCH_CONFIG, TSVECTOR_COLUMN, fts_table_name
+from app.models import EvaluationResult, QuestionResult
+from app.repositories.base import BaseRepository
+
+SNIPPET_START = "<mark>"
+SNIPPET_STOP = "</mark>"
+SNIPPET_ELLIPSIS = "…"
+SNIPPET_WORDS = 16
+
+CommentModel = Type[Union[EvaluationResult, QuestionResult]]
+COMMENT_MODELS = (EvaluationResult, QuestionResult)
+
+
+def _evaluation_result_id(model: CommentModel) -> Any:
+    """Get the column of the evaluation result a comment belongs to."""
+    if model is QuestionResult:
+        return QuestionResult.evaluation_result_id
+    return EvaluationResult.id
+
+
+def _fts5_query(text: str) -> str:
+    """Quote every word of a search, so FTS5 syntax is matched as plain text."""
+    return " ".join('"{}"'.format(word.replace('"', '""')) for word in text.split())
+
+
+def _postgresql_matches(
+    model: CommentModel, text: str, ids: Optional[Sequence[int]] = None
+) -> Select:
+    """Select the comments of a table matching a web search, on its tsvector.
+
+    The snippet is only highlighted for the comments of `ids` if given, as
+    ts_headline() parses the whole comment.
+    """
+    query = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, text)
+    document = literal_column(f"{model.__tablename__}.{TSVECTOR_COLUMN}")
+    snippet = null()
+    criterion = [document.op("@@")(query)]
+    if ids is not None:
+        snippet = func.ts_headline(
+            TEXT_SEARCH_CONFIG,
+            model.comment,
+            query,
+            f"StartSel={SNIPPET_START}, StopSel={SNIPPET_STOP}, "
+            f"MaxWords={SNIPPET_WORDS}, MinWords={SNIPPET_WORDS // 2}",
+        )
+        criterion.append(model.id.in_(ids))
+
+    return select(
+        literal(model.__tablename__).label("source"),
+        model.id,
+        _evaluation_result_id(model).label("evaluation_result_id"),
+        func.ts_rank(document, query).label("rank"),
+        snippet.label("snippet"),
+    ).where(*criterion)
+
+
+def _sqlite_matches(model: CommentModel, text: str) -> Select:
+    """Select the comments of a table matching all the words, on its FTS5 table."""
+    fts_name = fts_table_name(model.__tablename__)
+    fts = table(fts_name, column("rowid"))
+    fts_query = _fts5_query(text)
+    return (
+        select(
+            literal(model.__tablename__).label("source"),
+            model.id,
+            _evaluation_result_id(model).label("evaluation_result_id"),
+            # bm25() is lower for better matches
+            (-func.bm25(literal_column(fts_name))).label("rank"),
+            func.snippet(
+                literal_column(fts_name),
+                0,
+                SNIPPET_START,
+                SNIPPET_STOP,
+                SNIPPET_ELLIPSIS,
+                SNIPPET_WORDS,
+            ).label("snippet"),
+        )
+        .select_from(fts)
+        .join(model, model.id == fts.c.rowid)
+        .where(
+            literal_column(fts_name).op("MATCH")(fts_query) if fts_query else false()
+        )
+    )
+
+
+def comment_matches(
+    db: Session, text: str, ids: Optional[Dict[str, Sequence[int]]] = None
+) -> Subquery:
+    """Select the comments of both tables matching a search, for the dialect.
+
+    With `ids` by table name on PostgreSQL, only those comments are selected,
+    with a highlighted snippet. FTS5 highlights every match while matching.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        matches = [_sqlite_matches(model, text) for model in COMMENT_MODELS]
+    else:
+        matches = [
+            _postgresql_matches(
+                model, text, None if ids is None else ids[model.__tablename__]
+            )
+            for model in COMMENT_MODELS
+            if ids is None or model.__tablename__ in ids
+        ]
+    return union_all(*matches).subquery()
+
+
+def _select_comments(matches: Subquery, *criterion: Any) -> Select:
+    """Select the matches with their evaluation, best match first."""
+    return (
+        select(
+            matches.c.source,
+            matches.c.id,
+            matches.c.evaluation_result_id,
+            EvaluationResult.evaluation_id,
+            EvaluationResult.teacher_id,
+            matches.c.rank,
+            matches.c.snippet,
+        )
+        .join(EvaluationResult, EvaluationResult.id == matches.c.evaluation_result_id)
+        .where(*criterion)
+        .order_by(matches.c.rank.desc(), matches.c.source, matches.c.id)
+    )
+
+
+def search_comments(db: Session, text: str, *criterion: Any) -> Page:
+    """Get a page of the comments matching a search, best match first.
+
+    Criterion apply to the EvaluationResult of the comment, e.g.
+    `EvaluationResult.teacher_id == teacher_id`. On PostgreSQL, the rows of
+    the page are selected again by ID with their snippet, so ts_headline()
+    runs for the page only.
+    """
+    query = _select_comments(comment_matches(db, text), *criterion)
+    if db.get_bind().dialect.name == "sqlite":
+        return BaseRepository.paginate_rows(db, query)
+
+    def with_snippets(rows: Sequence[Row]) -> List[Row]:
+        """Get the rows of the page with their highlighted snippet."""
+        if not rows:
+            return []
+
+        ids: Dict[str, List[int]] = defaultdict(list)
+        for row in rows:
+            ids[row.source].append(row.id)
+        highlighted = {
+            (row.source, row.id): row
+            for row in BaseRepository.get_rows(
+                db, _select_comments(comment_matches(db, text, ids))
+            )
+        }
+        # A comment changed since the page was read keeps no snippet
+        return [highlighted.get((row.source, row.id), row) for row in rows]
+
+    return BaseRepository.paginate_rows(db, query, transformer=with_snippets)
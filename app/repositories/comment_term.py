@@ -0,0 +1,239 @@
+"""Comment Term Repository."""
+
+import logging
+from collections import Counter
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import Row, delete, event, func, insert, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.text import count_terms
+from app.models import CommentTerm, EvaluationResult, QuestionResult
+from app.repositories.base import BaseRepository, insert_on_conflict
+from app.repositories.flush import flushed_changes, load_deleted, track_previous_values
+from exceptions.exceptions import DatabaseException
+
+logger = logging.getLogger(__name__)
+
+# Fields of results and answers that decide the terms they count in
+RESULT_FIELDS = ("comment", "teacher_id", "evaluation_id")
+ANSWER_FIELDS = ("comment", "evaluation_result_id")
+
+REBUILD_CHUNK_SIZE = 5000
+
+TermKey = Tuple[int, int, str]
+# (sign, teacher_id, evaluation_id, comment)
+SignedComment = Tuple[int, Optional[int], Optional[int], Optional[str]]
+
+
+def term_deltas(comments: Iterable[SignedComment]) -> Counter:
+    """Count the terms of comments per teacher and evaluation, times their sign."""
+    deltas = Counter()
+    for sign, teacher_id, evaluation_id, comment in comments:
+        if teacher_id is None or evaluation_id is None:
+            continue
+
+        for term, count in count_terms(comment).items():
+            deltas[(teacher_id, evaluation_id, term)] += sign * count
+
+    return deltas
+
+
+def count_comment_terms(comments: List[Tuple[int, int, Optional[str]]]) -> Counter:
+    """Count the terms of (teacher_id, evaluation_id, comment) rows.
+
+    Top level, so process pools can run it.
+    """
+    return term_deltas((1, *comment) for comment in comments)
+
+
+def _load_deleted_comments(
+    session: Session, flush_context: Any, instances: Any
+) -> None:
+    """Load the tracked fields of expired results and answers before deletion."""
+    load_deleted(session, EvaluationResult, RESULT_FIELDS)
+    load_deleted(session, QuestionResult, ANSWER_FIELDS)
+
+
+def _update_comment_terms(session: Session, flush_context: Any) -> None:
+    """Apply the comments written by a flush to the terms, in its transaction."""
+    comments = [
+        (sign, fields["teacher_id"], fields["evaluation_id"], fields["comment"])
+        for sign, fields in flushed_changes(session, EvaluationResult, RESULT_FIELDS)
+        if fields["comment"]
+    ]
+
+    answers = [
+        (sign, fields)
+        for sign, fields in flushed_changes(session, QuestionResult, ANSWER_FIELDS)
+        if fields["comment"]
+    ]
+    if answers:
+        results = {
+            row.id: row
+            for row in session.connection().execute(
+                select(
+                    EvaluationResult.id,
+                    EvaluationResult.teacher_id,
+                    EvaluationResult.evaluation_id,
+                ).where(
+                    EvaluationResult.id.in_(
+                        {fields["evaluation_result_id"] for _, fields in answers}
+                    )
+                )
+            )
+        }
+        for sign, fields in answers:
+            result = results.get(fields["evaluation_result_id"])
+            if result is not None:
+                comments.append(
+                    (sign, result.teacher_id, result.evaluation_id, fields["comment"])
+                )
+
+    if comments:
+        CommentTermRepository.add(session, term_deltas(comments))
+
+
+def maintain_comment_terms(target: Any) -> None:
+    """Keep the terms up to date with every comment written by the sessions.
+
+    Answers of a result moved to another teacher or evaluation are only
+    caught up by a rebuild.
+    """
+    track_previous_values(EvaluationResult, RESULT_FIELDS)
+    track_previous_values(QuestionResult, ANSWER_FIELDS)
+    event.listen(target, "before_flush", _load_deleted_comments)
+    event.listen(target, "after_flush", _update_comment_terms)
+
+
+class CommentTermRepository(BaseRepository[CommentTerm, BaseModel, BaseModel]):
+    """Comment Term Repository Class."""
+
+    @staticmethod
+    def add(db: Session, deltas: Dict[TermKey, int]) -> None:
+        """Add count deltas to the terms, creating missing ones.
+
+        Runs on the connection of the session, without committing.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "teacher_id": teacher_id,
+                "evaluation_id": evaluation_id,
+                "term": term,
+                "count": delta,
+                "updated_at": now,
+            }
+            for (teacher_id, evaluation_id, term), delta in deltas.items()
+            if delta
+        ]
+        if not rows:
+            return
+
+        statement = insert_on_conflict(db, CommentTerm)
+        db.connection().execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    CommentTerm.teacher_id,
+                    CommentTerm.evaluation_id,
+                    CommentTerm.term,
+                ],
+                set_={
+                    "count": CommentTerm.count + statement.excluded.count,
+                    "updated_at": statement.excluded.updated_at,
+                },
+            ),
+            rows,
+        )
+
+    @staticmethod
+    def get_top_term_rows(db: Session, *criterion: Any, limit: int) -> List[Row]:
+        """Get the most frequent (term, count) of the filtered terms.
+
+        Criterion apply to CommentTerm, e.g. `CommentTerm.teacher_id ==
+        teacher_id`; counts are summed over the evaluations of a teacher.
+        """
+        count = func.sum(CommentTerm.count)
+        query = (
+            select(CommentTerm.term, count.label("count"))
+            .where(*criterion)
+            .group_by(CommentTerm.term)
+            .having(count > 0)
+            .order_by(count.desc(), CommentTerm.term)
+            .limit(limit)
+        )
+
+        return BaseRepository.get_rows(db, query)
+
+    @staticmethod
+    def iter_comment_chunks(
+        db: Session, chunk_size: int = REBUILD_CHUNK_SIZE
+    ) -> Iterator[List[Tuple[int, int, str]]]:
+        """Stream the (teacher_id, evaluation_id, comment) of results and answers.
+
+        Rows are fetched `chunk_size` at a time through a server-side cursor.
+        """
+        result_comments = select(
+            EvaluationResult.teacher_id,
+            EvaluationResult.evaluation_id,
+            EvaluationResult.comment,
+        ).where(EvaluationResult.comment.is_not(None))
+        answer_comments = (
+            select(
+                EvaluationResult.teacher_id,
+                EvaluationResult.evaluation_id,
+                QuestionResult.comment,
+            )
+            .join(
+                EvaluationResult,
+                EvaluationResult.id == QuestionResult.evaluation_result_id,
+            )
+            .where(QuestionResult.comment.is_not(None))
+        )
+
+        rows = db.execute(
+            union_all(result_comments, answer_comments),
+            execution_options={"yield_per": chunk_size},
+        )
+        for partition in rows.partitions():
+            yield [tuple(row) for row in partition]
+
+    @staticmethod
+    def rebuild(db: Session, counts: Dict[TermKey, int]) -> int:
+        """Replace every term with the given counts, in one transaction.
+
+        Returns the number of terms.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "teacher_id": teacher_id,
+                "evaluation_id": evaluation_id,
+                "term": term,
+                "count": count,
+                "updated_at": now,
+            }
+            for (teacher_id, evaluation_id, term), count in counts.items()
+            if count > 0
+        ]
+
+        try:
+            db.execute(delete(CommentTerm))
+            for start in range(0, len(rows), REBUILD_CHUNK_SIZE):
+                db.execute(
+                    insert(CommentTerm), rows[start : start + REBUILD_CHUNK_SIZE]
+                )
+            db.commit()
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error rebuilding comment terms: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred during the rebuild.",
+            ) from e
+
+        return len(rows)
@@ -0,0 +1,208 @@
+"""Dashboard.
+
+Deltas of the results and answers written by a session, published to the
+live dashboards of their evaluations once the transaction commits.
+"""
+
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.core.events import broadcaster, dashboard_channel
+from app.models import EvaluationResult, Question, QuestionResult
+from app.repositories.flush import (
+    Change,
+    flushed_changes,
+    load_deleted,
+    track_previous_values,
+)
+
+# Fields of results and answers that decide the counts and averages they count in
+RESULT_FIELDS = ("evaluation_id", "teacher_id", "admin_id", "is_submitted")
+ANSWER_FIELDS = ("rating", "category_id", "question_id", "evaluation_result_id")
+
+# Session.info key of the events waiting for the commit
+PENDING_EVENTS = "dashboard_events"
+
+RESULTS_EVENT = "results"
+RATINGS_EVENT = "ratings"
+
+# (evaluation_id, event name, data)
+DashboardEvent = Tuple[int, str, Dict[str, Any]]
+
+
+def result_fields(result: Any) -> Dict[str, Any]:
+    """Get the dashboard fields of a result object or row."""
+    return {key: getattr(result, key) for key in RESULT_FIELDS}
+
+
+def result_events(changes: Iterable[Change]) -> List[DashboardEvent]:
+    """Sum result changes into the count deltas of their evaluations.
+
+    Students whose result turned submitted are listed as submissions.
+    """
+    totals = Counter()
+    submitted = Counter()
+    submissions: Dict[int, Counter] = defaultdict(Counter)
+    for sign, fields in changes:
+        evaluation_id = fields["evaluation_id"]
+        if evaluation_id is None:
+            continue
+
+        totals[evaluation_id] += sign
+        if fields["is_submitted"]:
+            submitted[evaluation_id] += sign
+            student = (fields["admin_id"], fields["teacher_id"])
+            submissions[evaluation_id][student] += sign
+
+    events = []
+    for evaluation_id in totals:
+        if not totals[evaluation_id] and not submitted[evaluation_id]:
+            continue
+
+        data = {
+            "total": totals[evaluation_id],
+            "submitted": submitted[evaluation_id],
+            "submissions": [
+                {"admin_id": admin_id, "teacher_id": teacher_id}
+                for (admin_id, teacher_id), count in submissions[evaluation_id].items()
+                if count > 0
+            ],
+        }
+        events.append((evaluation_id, RESULTS_EVENT, data))
+
+    return events
+
+
+def rating_events(
+    changes: Iterable[Tuple[int, int, Any, int]],
+) -> List[DashboardEvent]:
+    """Sum (sign, evaluation_id, category_id, rating) changes per category."""
+    deltas: Dict[int, Dict[Any, List[int]]] = defaultdict(dict)
+    for sign, evaluation_id, category_id, rating in changes:
+        if evaluation_id is None or rating is None:
+            continue
+
+        delta = deltas[evaluation_id].setdefault(category_id, [0, 0])
+        delta[0] += sign * rating
+        delta[1] += sign
+
+    events = []
+    for evaluation_id, categories in deltas.items():
+        data = {
+            "categories": [
+                {
+                    "category_id": category_id,
+                    "rating_sum": rating_sum,
+                    "rating_count": rating_count,
+                }
+                for category_id, (rating_sum, rating_count) in categories.items()
+                if rating_sum or rating_count
+            ]
+        }
+        if data["categories"]:
+            events.append((evaluation_id, RATINGS_EVENT, data))
+
+    return events
+
+
+def _answer_changes(
+    session: Session, changes: List[Change]
+) -> List[Tuple[int, int, Any, int]]:
+    """Resolve the evaluation and category of answer changes, in one query each."""
+    connection = session.connection()
+    result_ids = {fields["evaluation_result_id"] for _, fields in changes}
+    evaluation_ids = dict(
+        connection.execute(
+            select(EvaluationResult.id, EvaluationResult.evaluation_id).where(
+                EvaluationResult.id.in_(result_ids)
+            )
+        ).all()
+    )
+
+    # Answers referencing a question leave their category to the question
+    question_ids = {
+        fields["question_id"]
+        for _, fields in changes
+        if fields["category_id"] is None and fields["question_id"] is not None
+    }
+    category_ids = {}
+    if question_ids:
+        category_ids = dict(
+            connection.execute(
+                select(Question.id, Question.category_id).where(
+                    Question.id.in_(question_ids)
+                )
+            ).all()
+        )
+
+    return [
+        (
+            sign,
+            evaluation_ids.get(fields["evaluation_result_id"]),
+            fields["category_id"]
+            if fields["category_id"] is not None
+            else category_ids.get(fields["question_id"]),
+            fields["rating"],
+        )
+        for sign, fields in changes
+    ]
+
+
+def queue_events(session: Session, events: Iterable[DashboardEvent]) -> None:
+    """Queue events, to publish when the session commits."""
+    pending = session.info.setdefault(PENDING_EVENTS, [])
+    for evaluation_id, name, data in events:
+        pending.append((dashboard_channel(evaluation_id), name, data))
+
+
+def _load_deleted_results(session: Session, flush_context: Any, instances: Any) -> None:
+    """Load the tracked fields of expired results and answers before deletion."""
+    load_deleted(session, EvaluationResult, RESULT_FIELDS)
+    load_deleted(session, QuestionResult, ANSWER_FIELDS)
+
+
+def _queue_flushed_events(session: Session, flush_context: Any) -> None:
+    """Queue the deltas of the results and answers written by a flush."""
+    events = result_events(flushed_changes(session, EvaluationResult, RESULT_FIELDS))
+    answers = [
+        (sign, fields)
+        for sign, fields in flushed_changes(session, QuestionResult, ANSWER_FIELDS)
+        if fields["rating"] is not None
+    ]
+    if answers:
+        events.extend(rating_events(_answer_changes(session, answers)))
+
+    queue_events(session, events)
+
+
+def _publish_events(session: Session) -> None:
+    """Publish the events of the committed transaction to the watched dashboards.
+
+    Subscribers are checked on commit, not on flush, so a dashboard watched
+    from in between still receives the write its snapshot may have missed.
+    """
+    for channel, name, data in session.info.pop(PENDING_EVENTS, []):
+        if broadcaster.has_subscribers(channel):
+            broadcaster.publish(channel, name, data)
+
+
+def _discard_events(session: Session) -> None:
+    """Drop the events of the rolled back transaction."""
+    session.info.pop(PENDING_EVENTS, None)
+
+
+def publish_dashboard_events(target: Any) -> None:
+    """Publish the deltas of every result and answer the sessions commit.
+
+    Bulk statements queue their own events, rows written by database cascades
+    are only caught up by a resync.
+    """
+    track_previous_values(EvaluationResult, RESULT_FIELDS)
+    track_previous_values(QuestionResult, ANSWER_FIELDS)
+    event.listen(target, "before_flush", _load_deleted_results)
+    event.listen(target, "after_flush", _queue_flushed_events)
+    event.listen(target, "after_commit", _publish_events)
+    event.listen(target, "after_rollback", _discard_events)
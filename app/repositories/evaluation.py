@@ -1,24 +1,236 @@
 """Evaluation Repository."""
 
-from typing import List, cast
+import logging
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Iterable, List, Optional, Sequence, cast
 
-from sqlalchemy.orm import Session
+from fastapi_pagination import Page
+from sqlalchemy import Row, func, insert, literal, select
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
-from app.models import Evaluation
-from app.repositories.base import BaseRepository
+from app.models import (
+    Evaluation,
+    EvaluationCategoryWeight,
+    EvaluationResult,
+    Question,
+    User,
+)
+from app.repositories.base import BaseRepository, apply_options
 from app.schemas import EvaluationUpdate, EvaluationIn
+from exceptions.exceptions import APIException, DatabaseException
+
+logger = logging.getLogger(__name__)
 
 
 class EvaluationRepository(BaseRepository[Evaluation, EvaluationIn, EvaluationUpdate]):
     """Evaluation Repository Class."""
 
     @staticmethod
-    def get_all_by_teacher_id(db: Session, *, teacher_id: int) -> List[Evaluation]:
+    def get_all_by_teacher_id(
+        db: Session, *, teacher_id: int, options: Sequence[ORMOption] = ()
+    ) -> List[Evaluation]:
         """Get by teacher_id."""
         response = cast(
             List[Evaluation],
-            db.query(Evaluation).filter(Evaluation.teacher_id == teacher_id).all(),
+            apply_options(db.query(Evaluation), options)
+            .filter(Evaluation.teacher_id == teacher_id)
+            .all(),
         )
-        print(response)
-        print(response)
+
         return response
+
+    def get_all_rows_with_teacher_name(
+        self, db: Session, fields: Iterable[str], *criterion: Any
+    ) -> List[Row]:
+        """Retrieve the given fields of the filtered records and teacher_name."""
+        query = (
+            self.select_columns(fields)
+            .add_columns(User.full_name.label("teacher_name"))
+            .outerjoin(User, User.id == Evaluation.teacher_id)
+            .filter(*criterion)
+        )
+
+        return self.get_rows(db, query)
+
+    def paginate_pending_rows(
+        self, db: Session, fields: Iterable[str], *, admin_id: int
+    ) -> Page:
+        """Get a page of the enabled evaluations not submitted by admin_id yet.
+
+        Computed with a NOT EXISTS anti-join over the student's submitted
+        results, which is answered from the (evaluation_id, admin_id,
+        is_submitted) index.
+        """
+        submitted = select(EvaluationResult.id).where(
+            EvaluationResult.evaluation_id == Evaluation.id,
+            EvaluationResult.admin_id == admin_id,
+            EvaluationResult.is_submitted.is_(True),
+        )
+        query = (
+            self.select_columns(fields)
+            .add_columns(User.full_name.label("teacher_name"))
+            .outerjoin(User, User.id == Evaluation.teacher_id)
+            .where(~submitted.exists(), Evaluation.is_disabled.is_not(True))
+            .order_by(Evaluation.id)
+        )
+
+        return self.paginate_rows(db, query)
+
+    @staticmethod
+    def get_form(db: Session, *, _id: int, admin_id: int) -> Evaluation:
+        """Get evaluation with its teacher, questions and the results of admin_id.
+
+        The relationships are eager loaded, so the whole form costs three queries
+        no matter how many questions it has.
+        """
+        evaluation = (
+            apply_options(
+                db.query(Evaluation),
+                [
+                    joinedload(Evaluation.user),
+                    selectinload(Evaluation.questions),
+                    selectinload(
+                        Evaluation.evaluation_results.and_(
+                            EvaluationResult.admin_id == admin_id
+                        )
+                    ),
+                ],
+            )
+            .filter(Evaluation.id == _id)
+            .first()
+        )
+
+        if evaluation is None:
+            raise APIException(
+                status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+            )
+        return evaluation
+
+    def clone(
+        self,
+        db: Session,
+        *,
+        _id: int,
+        teacher_ids: Iterable[int],
+        title: Optional[str] = None,
+    ) -> List[Evaluation]:
+        """Copy an evaluation, its questions and weights to each of the teachers.
+
+        Evaluations, questions and category weights are copied with one
+        INSERT ... SELECT each, in a single transaction. Unknown teacher ids
+        are skipped.
+        """
+        self.get(db, _id)
+
+        now = datetime.utcnow()
+        teacher_ids = list(dict.fromkeys(teacher_ids))
+
+        try:
+            evaluations = (
+                select(
+                    func.coalesce(
+                        literal(title, Evaluation.title.type), Evaluation.title
+                    ),
+                    User.id,
+                    Evaluation.admin_id,
+                    Evaluation.category,
+                    Evaluation.comment,
+                    Evaluation.is_disabled,
+                    literal(now),
+                    literal(now),
+                )
+                .select_from(Evaluation)
+                .join(User, User.id.in_(teacher_ids))
+                .where(Evaluation.id == _id)
+                .order_by(User.id)
+            )
+            new_ids = (
+                db.execute(
+                    insert(Evaluation)
+                    .from_select(
+                        [
+                            Evaluation.title,
+                            Evaluation.teacher_id,
+                            Evaluation.admin_id,
+                            Evaluation.category,
+                            Evaluation.comment,
+                            Evaluation.is_disabled,
+                            Evaluation.created_at,
+                            Evaluation.updated_at,
+                        ],
+                        evaluations,
+                    )
+                    .returning(Evaluation.id)
+                )
+                .scalars()
+                .all()
+            )
+
+            questions = (
+                select(
+                    Question.question_text,
+                    Question.category,
+                    Question.category_id,
+                    Evaluation.id,
+                    Evaluation.title,
+                    literal(now),
+                    literal(now),
+                )
+                .select_from(Question)
+                .join(Evaluation, Evaluation.id.in_(new_ids))
+                .where(Question.evaluation_id == _id)
+                .order_by(Evaluation.id, Question.id)
+            )
+            db.execute(
+                insert(Question).from_select(
+                    [
+                        Question.question_text,
+                        Question.category,
+                        Question.category_id,
+                        Question.evaluation_id,
+                        Question.evaluation_title,
+                        Question.created_at,
+                        Question.updated_at,
+                    ],
+                    questions,
+                )
+            )
+
+            weights = (
+                select(
+                    Evaluation.id,
+                    EvaluationCategoryWeight.category_id,
+                    EvaluationCategoryWeight.weight,
+                    literal(now),
+                    literal(now),
+                )
+                .select_from(EvaluationCategoryWeight)
+                .join(Evaluation, Evaluation.id.in_(new_ids))
+                .where(EvaluationCategoryWeight.evaluation_id == _id)
+            )
+            db.execute(
+                insert(EvaluationCategoryWeight).from_select(
+                    [
+                        EvaluationCategoryWeight.evaluation_id,
+                        EvaluationCategoryWeight.category_id,
+                        EvaluationCategoryWeight.weight,
+                        EvaluationCategoryWeight.created_at,
+                        EvaluationCategoryWeight.updated_at,
+                    ],
+                    weights,
+                )
+            )
+
+            db.commit()
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error cloning evaluation: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred during the clone.",
+            ) from e
+
+        return self.get_many(db, new_ids)
@@ -0,0 +1,78 @@
+"""Evaluation Category Weight Repository."""
+
+import logging
+from http import HTTPStatus
+from typing import Iterable, List, cast
+
+from sqlalchemy import delete, exc
+from sqlalchemy.orm import Session
+
+from app.models import EvaluationCategoryWeight
+from app.repositories.base import BaseRepository
+from app.schemas import EvaluationCategoryWeightIn
+from exceptions.exceptions import DatabaseException
+
+logger = logging.getLogger(__name__)
+
+
+class EvaluationCategoryWeightRepository(
+    BaseRepository[
+        EvaluationCategoryWeight, EvaluationCategoryWeightIn, EvaluationCategoryWeightIn
+    ]
+):
+    """Evaluation Category Weight Repository Class."""
+
+    @staticmethod
+    def get_all_by_evaluation_id(
+        db: Session, *, evaluation_id: int
+    ) -> List[EvaluationCategoryWeight]:
+        """Get by evaluation_id."""
+        response = cast(
+            List[EvaluationCategoryWeight],
+            db.query(EvaluationCategoryWeight)
+            .filter(EvaluationCategoryWeight.evaluation_id == evaluation_id)
+            .order_by(EvaluationCategoryWeight.category_id)
+            .all(),
+        )
+
+        return response
+
+    def replace(
+        self,
+        db: Session,
+        *,
+        evaluation_id: int,
+        weights: Iterable[EvaluationCategoryWeightIn],
+    ) -> List[EvaluationCategoryWeight]:
+        """Replace the category weights of an evaluation in one transaction."""
+        try:
+            db.execute(
+                delete(EvaluationCategoryWeight).where(
+                    EvaluationCategoryWeight.evaluation_id == evaluation_id
+                )
+            )
+            db.add_all(
+                [
+                    EvaluationCategoryWeight(
+                        evaluation_id=evaluation_id, **weight.model_dump()
+                    )
+                    for weight in weights
+                ]
+            )
+            db.commit()
+
+        except exc.IntegrityError as e:
+            db.rollback()
+            raise DatabaseException(
+                status_code=HTTPStatus.CONFLICT, detail=e.orig.args[0]
+            ) from e
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error replacing category weights: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred during the update.",
+            ) from e
+
+        return self.get_all_by_evaluation_id(db, evaluation_id=evaluation_id)
@@ -1,12 +1,34 @@
 """Evaluation Result Repository."""
 
-from typing import List, cast
+import logging
+from datetime import datetime
+from http import HTTPStatus
+from typing import Iterable, Iterator, List, Optional, Sequence, cast
 
-from sqlalchemy.orm import Session
+from fastapi_pagination import Page
+from sqlalchemy import Numeric, Row, RowMapping, and_, func, literal, select, update
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm.interfaces import ORMOption
 
-from app.models import EvaluationResult
-from app.repositories.base import BaseRepository
+from app.models import Evaluation, EvaluationResult, Question, QuestionResult, User
+from app.repositories.base import BaseRepository, apply_options, insert_on_conflict
+from app.repositories.comment_term import CommentTermRepository, term_deltas
+from app.repositories.dashboard import (
+    RESULTS_EVENT,
+    queue_events,
+    result_events,
+    result_fields,
+)
+from app.repositories.scoring import teacher_rankings
+from app.repositories.teacher_score_rollup import (
+    TeacherScoreRollupRepository,
+    flipped_result_deltas,
+)
 from app.schemas import EvaluationResultUpdate, EvaluationResultIn
+from app.schemas.user import UserRoleEnum
+from exceptions.exceptions import APIException, DatabaseException
+
+logger = logging.getLogger(__name__)
 
 
 class EvaluationResultRepository(
@@ -16,12 +38,16 @@ class EvaluationResultRepository(
 
     @staticmethod
     def get_all_by_evaluation_and_admin_id(
-        db: Session, *, evaluation_id: int, admin_id: int
+        db: Session,
+        *,
+        evaluation_id: int,
+        admin_id: int,
+        options: Sequence[ORMOption] = (),
     ) -> List["EvaluationResult"]:
         """Get evaluation results filtered by both evaluation_id and admin_id."""
         response = cast(
             List[EvaluationResult],
-            db.query(EvaluationResult)
+            apply_options(db.query(EvaluationResult), options)
             .filter(
                 EvaluationResult.evaluation_id == evaluation_id,
                 EvaluationResult.admin_id == admin_id,  # AND condition
@@ -33,12 +59,12 @@ class EvaluationResultRepository(
 
     @staticmethod
     def get_all_by_evaluation_id(
-        db: Session, *, evaluation_id: int
+        db: Session, *, evaluation_id: int, options: Sequence[ORMOption] = ()
     ) -> List[EvaluationResult]:
         """Get by evaluation_id."""
         response = cast(
             List[EvaluationResult],
-            db.query(EvaluationResult)
+            apply_options(db.query(EvaluationResult), options)
             .filter(EvaluationResult.evaluation_id == evaluation_id)
             .all(),
         )
@@ -48,14 +74,375 @@ class EvaluationResultRepository(
 
     @staticmethod
     def get_all_by_teacher_id(
-        db: Session, *, teacher_id: int
+        db: Session, *, teacher_id: int, options: Sequence[ORMOption] = ()
     ) -> List[EvaluationResult]:
         """Get by teacher_id."""
         response = cast(
             List[EvaluationResult],
-            db.query(EvaluationResult)
+            apply_options(db.query(EvaluationResult), options)
             .filter(EvaluationResult.teacher_id == teacher_id)
             .all(),
         )
 
         return response
+
+    @staticmethod
+    def stream_export_rows(
+        db: Session, *, evaluation_id: int, yield_per: int = 1000
+    ) -> Iterator[RowMapping]:
+        """Stream the results of an evaluation joined with names and answers.
+
+        Rows are fetched `yield_per` at a time through a server-side cursor, so
+        memory stays constant regardless of the export size.
+        """
+        teacher = aliased(User)
+        student = aliased(User)
+
+        query = (
+            select(
+                EvaluationResult.id.label("evaluation_result_id"),
+                EvaluationResult.evaluation_id,
+                EvaluationResult.title,
+                EvaluationResult.teacher_id,
+                teacher.full_name.label("teacher_name"),
+                EvaluationResult.admin_id.label("student_id"),
+                student.full_name.label("student_name"),
+                EvaluationResult.is_submitted,
+                EvaluationResult.comment,
+                EvaluationResult.created_at,
+                QuestionResult.id.label("question_result_id"),
+                func.coalesce(QuestionResult.category, Question.category).label(
+                    "category"
+                ),
+                func.coalesce(
+                    QuestionResult.question_text, Question.question_text
+                ).label("question_text"),
+                QuestionResult.rating,
+                QuestionResult.comment.label("question_comment"),
+            )
+            .outerjoin(teacher, teacher.id == EvaluationResult.teacher_id)
+            .outerjoin(student, student.id == EvaluationResult.admin_id)
+            .outerjoin(
+                QuestionResult,
+                QuestionResult.evaluation_result_id == EvaluationResult.id,
+            )
+            .outerjoin(Question, Question.id == QuestionResult.question_id)
+            .where(EvaluationResult.evaluation_id == evaluation_id)
+            .order_by(EvaluationResult.id, QuestionResult.id)
+            .execution_options(yield_per=yield_per)
+        )
+
+        yield from db.execute(query).mappings()
+
+    def create(self, db: Session, *, obj_in: EvaluationResultIn) -> EvaluationResult:
+        """Create record, or fill in the pending result of an assigned student.
+
+        Assignment creates a result per student ahead of the submission, which
+        is then upserted instead of conflicting on (evaluation_id, admin_id).
+        """
+        if obj_in.evaluation_id is not None and obj_in.admin_id is not None:
+            pending = db.scalar(
+                select(EvaluationResult.id).where(
+                    EvaluationResult.evaluation_id == obj_in.evaluation_id,
+                    EvaluationResult.admin_id == obj_in.admin_id,
+                    EvaluationResult.is_submitted.is_not(True),
+                )
+            )
+            if pending is not None:
+                return self.upsert(db, obj_in=obj_in)
+
+        return super().create(db, obj_in=obj_in)
+
+    @staticmethod
+    def assign_students(db: Session, *, evaluation_id: int, admin_id: int) -> int:
+        """Create a pending result for every student of admin_id.
+
+        One INSERT ... SELECT over the students, existing results are left
+        untouched by ON CONFLICT DO NOTHING, so assigning again is a no-op.
+        The dashboard delta is queued in the same transaction, the statement
+        being out of reach of the flush listeners. Returns the number of
+        created results.
+        """
+        now = datetime.utcnow()
+
+        students = (
+            select(
+                Evaluation.title,
+                Evaluation.teacher_id,
+                Evaluation.id,
+                User.id,
+                literal(False),
+                literal(now),
+                literal(now),
+            )
+            .select_from(Evaluation)
+            .join(
+                User,
+                and_(
+                    User.admin_id == admin_id,
+                    User.role == UserRoleEnum.student.value,
+                ),
+            )
+            .where(Evaluation.id == evaluation_id)
+        )
+        query = (
+            insert_on_conflict(db, EvaluationResult)
+            .from_select(
+                [
+                    EvaluationResult.title,
+                    EvaluationResult.teacher_id,
+                    EvaluationResult.evaluation_id,
+                    EvaluationResult.admin_id,
+                    EvaluationResult.is_submitted,
+                    EvaluationResult.created_at,
+                    EvaluationResult.updated_at,
+                ],
+                students,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    EvaluationResult.evaluation_id,
+                    EvaluationResult.admin_id,
+                ]
+            )
+        )
+
+        try:
+            assigned = db.execute(query).rowcount
+            if assigned:
+                queue_events(
+                    db,
+                    [
+                        (
+                            evaluation_id,
+                            RESULTS_EVENT,
+                            {"total": assigned, "submitted": 0, "submissions": []},
+                        )
+                    ],
+                )
+            db.commit()
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error assigning evaluation: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred during the assignment.",
+            ) from e
+
+        return assigned
+
+    def get_pending_rows(
+        self, db: Session, fields: Iterable[str], *, evaluation_id: int
+    ) -> List[Row]:
+        """Get the results of an evaluation not submitted yet, with names."""
+        teacher = aliased(User)
+        student = aliased(User)
+
+        query = (
+            self.select_columns(fields)
+            .add_columns(
+                teacher.full_name.label("teacher_name"),
+                student.full_name.label("student_name"),
+            )
+            .outerjoin(teacher, teacher.id == EvaluationResult.teacher_id)
+            .outerjoin(student, student.id == EvaluationResult.admin_id)
+            .where(
+                EvaluationResult.evaluation_id == evaluation_id,
+                EvaluationResult.is_submitted.is_not(True),
+            )
+            .order_by(EvaluationResult.id)
+        )
+
+        return self.get_rows(db, query)
+
+    def get_participation_rows(self, db: Session) -> List[Row]:
+        """Get total and submitted result counts per evaluation.
+
+        One GROUP BY over evaluation_result with COUNT(*) FILTER (WHERE
+        is_submitted), joined with the evaluation title and teacher name.
+        """
+        query = (
+            select(
+                Evaluation.id.label("evaluation_id"),
+                Evaluation.title,
+                Evaluation.teacher_id,
+                User.full_name.label("teacher_name"),
+                func.count(EvaluationResult.id).label("total"),
+                func.count(EvaluationResult.id)
+                .filter(EvaluationResult.is_submitted.is_(True))
+                .label("submitted"),
+            )
+            .join(Evaluation, Evaluation.id == EvaluationResult.evaluation_id)
+            .outerjoin(User, User.id == Evaluation.teacher_id)
+            .group_by(
+                Evaluation.id,
+                Evaluation.title,
+                Evaluation.teacher_id,
+                User.first_name,
+                User.middle_name,
+                User.last_name,
+            )
+            .order_by(Evaluation.id)
+        )
+
+        return self.get_rows(db, query)
+
+    def get_counts_row(self, db: Session, *, evaluation_id: int) -> Row:
+        """Get the total and submitted result counts of an evaluation."""
+        query = select(
+            func.count(EvaluationResult.id).label("total"),
+            func.count(EvaluationResult.id)
+            .filter(EvaluationResult.is_submitted.is_(True))
+            .label("submitted"),
+        ).where(EvaluationResult.evaluation_id == evaluation_id)
+
+        return self.get_rows(db, query)[0]
+
+    def paginate_ranking_rows(
+        self,
+        db: Session,
+        *,
+        admin_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+    ) -> Page:
+        """Get a page of teachers ranked on their submitted results, best first.
+
+        Averages, ranks and percentiles are computed by the database for every
+        teacher, then LIMIT/OFFSET keep the page. Results are the ones of the
+        evaluations of admin_id if given, and averages the ones in category_id.
+        """
+        criterion = [EvaluationResult.is_submitted.is_(True)]
+        if admin_id is not None:
+            criterion.append(
+                EvaluationResult.evaluation_id.in_(
+                    select(Evaluation.id).where(Evaluation.admin_id == admin_id)
+                )
+            )
+
+        rankings = teacher_rankings(*criterion, category_id=category_id).subquery()
+        query = (
+            select(
+                rankings.c.teacher_id,
+                User.full_name.label("teacher_name"),
+                rankings.c.results,
+                func.round(rankings.c.average.cast(Numeric), 2).label("average"),
+                rankings.c.rank,
+                func.round((rankings.c.percent_rank * 100).cast(Numeric), 2).label(
+                    "percentile"
+                ),
+            )
+            .outerjoin(User, User.id == rankings.c.teacher_id)
+            .order_by(rankings.c.rank, rankings.c.teacher_id)
+        )
+
+        return self.paginate_rows(db, query)
+
+    @staticmethod
+    def upsert(db: Session, *, obj_in: EvaluationResultIn) -> EvaluationResult:
+        """Create the result of a student for an evaluation, or update it.
+
+        An INSERT ... ON CONFLICT (evaluation_id, admin_id) DO NOTHING, then
+        the UPDATE of the existing row read with SELECT ... FOR UPDATE, so
+        retried submissions neither duplicate rows nor race a read: the
+        previous values the deltas are taken from are the ones replaced. The
+        terms of the comment are counted, the answers of a result turning
+        submitted (or no longer) rolled up and the dashboard deltas queued in
+        the same transaction, the statements being out of reach of the flush
+        listeners.
+        """
+        values = obj_in.model_dump(exclude_unset=True, exclude={"created_at"})
+        if values.get("evaluation_id") is None or values.get("admin_id") is None:
+            raise APIException(
+                status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                detail="evaluation_id and admin_id are required to upsert.",
+            )
+
+        values["updated_at"] = datetime.utcnow()
+        query = (
+            insert_on_conflict(db, EvaluationResult)
+            .values(**values)
+            .on_conflict_do_nothing(
+                index_elements=[
+                    EvaluationResult.evaluation_id,
+                    EvaluationResult.admin_id,
+                ]
+            )
+            .returning(EvaluationResult)
+        )
+
+        try:
+            previous = None
+            evaluation_result = db.scalars(
+                query, execution_options={"populate_existing": True}
+            ).one_or_none()
+            if evaluation_result is None:
+                # Concurrent upserts of the same result wait for this lock
+                previous = db.execute(
+                    select(
+                        EvaluationResult.id,
+                        EvaluationResult.teacher_id,
+                        EvaluationResult.evaluation_id,
+                        EvaluationResult.comment,
+                        EvaluationResult.admin_id,
+                        EvaluationResult.is_submitted,
+                    )
+                    .where(
+                        EvaluationResult.evaluation_id == values["evaluation_id"],
+                        EvaluationResult.admin_id == values["admin_id"],
+                    )
+                    .with_for_update()
+                ).one()
+                evaluation_result = db.scalars(
+                    update(EvaluationResult)
+                    .where(EvaluationResult.id == previous.id)
+                    .values(
+                        {
+                            key: value
+                            for key, value in values.items()
+                            if key not in ("evaluation_id", "admin_id")
+                        }
+                    )
+                    .returning(EvaluationResult),
+                    execution_options={"populate_existing": True},
+                ).one()
+            comments = [
+                (
+                    1,
+                    evaluation_result.teacher_id,
+                    evaluation_result.evaluation_id,
+                    evaluation_result.comment,
+                )
+            ]
+            changes = [(1, result_fields(evaluation_result))]
+            if previous is not None:
+                comments.append(
+                    (-1, previous.teacher_id, previous.evaluation_id, previous.comment)
+                )
+                changes.append((-1, result_fields(previous)))
+                # Taken from the locked row, so concurrent submits flip once
+                flip = bool(evaluation_result.is_submitted) - bool(
+                    previous.is_submitted
+                )
+                teacher_id = (
+                    evaluation_result.teacher_id if flip > 0 else previous.teacher_id
+                )
+                TeacherScoreRollupRepository.add(
+                    db,
+                    flipped_result_deltas(
+                        db, {previous.id: flip}, {previous.id: teacher_id}
+                    ),
+                )
+            CommentTermRepository.add(db, term_deltas(comments))
+            queue_events(db, result_events(changes))
+            db.commit()
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error upserting evaluation result: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred during the upsert.",
+            ) from e
+
+        return evaluation_result
@@ -0,0 +1,82 @@
+"""Flush.
+
+Rows written by a flush, for the listeners keeping derived tables up to date
+in the same transaction. A change counts as the removal of the previous
+fields (-1) and the addition of the current ones (+1).
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, attributes
+
+from app.db.base_class import Base
+
+Change = Tuple[int, Dict[str, Any]]
+
+
+def _load_previous_value(
+    target: Any, value: Any, oldvalue: Any, initiator: Any
+) -> None:
+    """Nothing to do, registered to load the previous value before a change."""
+
+
+def track_previous_values(model: Type[Base], fields: Iterable[str]) -> None:
+    """Make changes of expired objects load the value they replace."""
+    for key in fields:
+        attribute = getattr(model, key)
+        if not event.contains(attribute, "set", _load_previous_value):
+            event.listen(attribute, "set", _load_previous_value, active_history=True)
+
+
+def load_deleted(session: Session, model: Type[Base], fields: Iterable[str]) -> None:
+    """Load the fields of expired deleted objects, before their rows go away.
+
+    Call it from a before_flush listener.
+    """
+    for obj in session.deleted:
+        if isinstance(obj, model):
+            for key in fields:
+                getattr(obj, key)
+
+
+def _current_fields(obj: Base, fields: Iterable[str]) -> Dict[str, Any]:
+    """Get the fields of an object."""
+    return {key: getattr(obj, key) for key in fields}
+
+
+def _previous_fields(obj: Base, fields: Iterable[str]) -> Dict[str, Any]:
+    """Get the fields of an object as they were before the flush."""
+    previous = {}
+    for key in fields:
+        history = attributes.get_history(obj, key)
+        previous[key] = history.deleted[0] if history.deleted else getattr(obj, key)
+    return previous
+
+
+def flushed_changes(
+    session: Session, model: Type[Base], fields: Iterable[str]
+) -> List[Change]:
+    """Get the (sign, fields) of the objects of a model written by a flush.
+
+    Call it from an after_flush listener. Updated objects only count when one
+    of the fields changed.
+    """
+    fields = tuple(fields)
+    changes = []
+    for obj in session.new:
+        if isinstance(obj, model):
+            changes.append((1, _current_fields(obj, fields)))
+
+    for obj in session.deleted:
+        if isinstance(obj, model):
+            changes.append((-1, _previous_fields(obj, fields)))
+
+    for obj in session.dirty:
+        if isinstance(obj, model) and any(
+            attributes.get_history(obj, key).has_changes() for key in fields
+        ):
+            changes.append((-1, _previous_fields(obj, fields)))
+            changes.append((1, _current_fields(obj, fields)))
+
+    return changes
@@ -0,0 +1,60 @@
+"""Batch Loader."""
+
+from http import HTTPStatus
+from typing import Dict, Generic, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.repositories.base import BaseRepository, ModelType
+from exceptions.exceptions import APIException
+
+
+class BatchLoader(Generic[ModelType]):
+    """Request-scoped loader that batches and memoizes lookups by ID.
+
+    IDs are queued with `prime` and fetched together with one `IN` query the
+    first time any of them is loaded. Results, including misses, are kept for
+    the life of the loader, so create one per request (i.e. per use case).
+    """
+
+    def __init__(self, db: Session, repository: BaseRepository):
+        """Initialize with db and the repository of the loaded model."""
+        self.db = db
+        self.repository = repository
+        self._cache: Dict[int, Optional[ModelType]] = {}
+        self._pending: Dict[int, None] = {}
+
+    def prime(self, ids: Iterable[Optional[int]]) -> None:
+        """Queue IDs to be fetched with the next batch."""
+        for _id in ids:
+            if _id is not None and _id not in self._cache:
+                self._pending[_id] = None
+
+    def load(self, _id: int) -> ModelType:
+        """Get record by its ID, fetching every queued ID at once on a miss."""
+        if _id not in self._cache:
+            self.prime([_id])
+            self._dispatch()
+
+        item = self._cache.get(_id)
+        if item is None:
+            raise APIException(
+                status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+            )
+        return item
+
+    def load_many(self, ids: Iterable[int]) -> List[ModelType]:
+        """Get records by their IDs, with at most one batch for the misses."""
+        ids = list(ids)
+        self.prime(ids)
+        return [self.load(_id) for _id in ids]
+
+    def _dispatch(self) -> None:
+        """Fetch the queued IDs and remember the misses too."""
+        ids = list(self._pending)
+        self._pending.clear()
+
+        items = self.repository.get_many(self.db, ids)
+
+        self._cache.update(dict.fromkeys(ids))
+        self._cache.update({item.id: item for item in items})
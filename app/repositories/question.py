@@ -1,11 +1,86 @@
 """Question Repository."""
 
-from app.models import Question
+import logging
+from http import HTTPStatus
+from typing import Any, Dict, List, Union, cast
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.models import Question, QuestionResult
 from app.repositories.base import BaseRepository
+from app.repositories.category import CategoryRepository
 from app.schemas import QuestionIn, QuestionUpdate
+from exceptions.exceptions import DatabaseException
+
+logger = logging.getLogger(__name__)
 
 
 class QuestionRepository(BaseRepository[Question, QuestionIn, QuestionUpdate]):
     """Question Repository Class."""
 
-    pass
+    def create(self, db: Session, *, obj_in: QuestionIn) -> Question:
+        """Create record, with the category_id of its category."""
+        return super().create(
+            db, obj_in=CategoryRepository.with_category_id(db, obj_in)
+        )
+
+    @staticmethod
+    def update(
+        db: Session,
+        *,
+        db_obj: Question,
+        obj_in: Union[QuestionUpdate, Dict[str, Any]],
+    ) -> Question:
+        """Update record, with the category_id of its category."""
+        if not isinstance(obj_in, dict):
+            obj_in = CategoryRepository.with_category_id(db, obj_in)
+        return BaseRepository.update(db, db_obj=db_obj, obj_in=obj_in)
+
+    @staticmethod
+    def get_all_by_evaluation_id(db: Session, *, evaluation_id: int) -> List[Question]:
+        """Get by evaluation_id."""
+        response = cast(
+            List[Question],
+            db.query(Question)
+            .filter(Question.evaluation_id == evaluation_id)
+            .order_by(Question.id)
+            .all(),
+        )
+
+        return response
+
+    def delete(self, db: Session, *, _id: int) -> Question:
+        """Delete a question, copying its text and category into its answers.
+
+        Compact answers read the text from the question, which is gone after.
+        """
+        try:
+            db.execute(
+                update(QuestionResult)
+                .where(
+                    QuestionResult.question_id == _id,
+                    Question.id == QuestionResult.question_id,
+                )
+                .values(
+                    question_text=func.coalesce(
+                        QuestionResult.question_text, Question.question_text
+                    ),
+                    evaluation_title=func.coalesce(
+                        QuestionResult.evaluation_title, Question.evaluation_title
+                    ),
+                    category=func.coalesce(QuestionResult.category, Question.category),
+                    category_id=func.coalesce(
+                        QuestionResult.category_id, Question.category_id
+                    ),
+                )
+            )
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error copying question into answers: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred during the deletion.",
+            ) from e
+
+        return super().delete(db, _id=_id)
@@ -1,17 +1,97 @@
 """Question Result Repository."""
-from typing import List, cast
+from http import HTTPStatus
+from typing import Any, Dict, Iterable, List, Union, cast
 
+from sqlalchemy import Column, Row, Select, func, select
 from sqlalchemy.orm import Session
 
-from app.models import QuestionResult
+from app.models import EvaluationResult, Question, QuestionResult, User
 from app.repositories.base import BaseRepository
+from app.repositories.category import CategoryRepository
 from app.schemas import QuestionResultIn, QuestionResultUpdate
+from exceptions.exceptions import APIException
+
+# Copies which compact rows leave NULL, read back from the question or student
+QUESTION_FIELDS = ("question_text", "evaluation_title", "category", "category_id")
+STUDENT_FIELDS = ("student_name",)
+
+
+def compact(
+    obj_in: Union[QuestionResultIn, QuestionResultUpdate],
+) -> Union[QuestionResultIn, QuestionResultUpdate]:
+    """Drop the copies of the question and student names which are referenced."""
+    fields = []
+    if obj_in.question_id is not None:
+        fields.extend(QUESTION_FIELDS)
+    if obj_in.student_id is not None:
+        fields.extend(STUDENT_FIELDS)
+
+    return obj_in.model_copy(update=dict.fromkeys(fields)) if fields else obj_in
 
 
 class QuestionResultRepository(
     BaseRepository[QuestionResult, QuestionResultIn, QuestionResultUpdate]
 ):
-    """Question Result Repository Class."""
+    """Question Result Repository Class.
+
+    Answers referencing a question by `question_id` store only the rating and
+    comment, the question text, title, category and student name are joined
+    in by `select_columns`.
+    """
+
+    def select_columns(self, fields: Iterable[str]) -> Select:
+        """Select the given fields, reading the compact copies through joins."""
+        columns: Dict[str, Column] = self.model.__table__.columns
+        sources: Dict[str, Any] = {
+            "question_text": Question.question_text,
+            "evaluation_title": Question.evaluation_title,
+            "category": Question.category,
+            "category_id": Question.category_id,
+            "student_name": User.full_name,
+        }
+
+        return (
+            select(
+                *[
+                    func.coalesce(columns[field], sources[field]).label(field)
+                    if field in sources
+                    else columns[field]
+                    for field in fields
+                    if field in columns
+                ]
+            )
+            .select_from(QuestionResult)
+            .outerjoin(Question, Question.id == QuestionResult.question_id)
+            .outerjoin(User, User.id == QuestionResult.student_id)
+        )
+
+    def get_row(self, db: Session, fields: Iterable[str], *, _id: int) -> Row:
+        """Get the given fields of a record by its ID, as a row."""
+        rows = self.get_all_rows(db, fields, QuestionResult.id == _id)
+
+        if not rows:
+            raise APIException(
+                status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+            )
+        return rows[0]
+
+    def create(self, db: Session, *, obj_in: QuestionResultIn) -> QuestionResult:
+        """Create record, compact when it references its question."""
+        return super().create(
+            db, obj_in=CategoryRepository.with_category_id(db, compact(obj_in))
+        )
+
+    @staticmethod
+    def update(
+        db: Session,
+        *,
+        db_obj: QuestionResult,
+        obj_in: Union[QuestionResultUpdate, Dict[str, Any]],
+    ) -> QuestionResult:
+        """Update record, compact when it references its question."""
+        if not isinstance(obj_in, dict):
+            obj_in = CategoryRepository.with_category_id(db, compact(obj_in))
+        return BaseRepository.update(db, db_obj=db_obj, obj_in=obj_in)
 
     @staticmethod
     def get_all_by_evaluation_result_id(
@@ -26,3 +106,110 @@ class QuestionResultRepository(
         )
 
         return response
+
+    def get_all_rows_by_evaluation_result_ids(
+        self,
+        db: Session,
+        fields: Iterable[str],
+        *,
+        evaluation_result_ids: Iterable[int],
+    ) -> List[Row]:
+        """Get the given fields by a list of evaluation_result_id with one IN query."""
+        evaluation_result_ids = list(evaluation_result_ids)
+        if not evaluation_result_ids:
+            return []
+
+        return self.get_rows(
+            db,
+            self.select_columns(fields)
+            .filter(QuestionResult.evaluation_result_id.in_(evaluation_result_ids))
+            .order_by(QuestionResult.id),
+        )
+
+    @staticmethod
+    def get_category_average_rows(
+        db: Session, *, evaluation_result_ids: Iterable[int]
+    ) -> List[Row]:
+        """Get the average rating per evaluation result and category ID.
+
+        Rows are (evaluation_result_id, category_id, average), grouped in SQL.
+        """
+        evaluation_result_ids = list(evaluation_result_ids)
+        if not evaluation_result_ids:
+            return []
+
+        category_id = func.coalesce(QuestionResult.category_id, Question.category_id)
+        return BaseRepository.get_rows(
+            db,
+            select(
+                QuestionResult.evaluation_result_id,
+                category_id.label("category_id"),
+                func.avg(QuestionResult.rating).label("average"),
+            )
+            .select_from(QuestionResult)
+            .outerjoin(Question, Question.id == QuestionResult.question_id)
+            .where(QuestionResult.evaluation_result_id.in_(evaluation_result_ids))
+            .group_by(QuestionResult.evaluation_result_id, category_id),
+        )
+
+    @staticmethod
+    def get_category_rating_rows(db: Session, *criterion: Any) -> List[Row]:
+        """Get the rating sum and count per category of the filtered results.
+
+        Rows are (category_id, rating_sum, rating_count), the sums the live
+        dashboards add their deltas to. Criterion apply to EvaluationResult.
+        """
+        category_id = func.coalesce(QuestionResult.category_id, Question.category_id)
+        return BaseRepository.get_rows(
+            db,
+            select(
+                category_id.label("category_id"),
+                func.sum(QuestionResult.rating).label("rating_sum"),
+                func.count(QuestionResult.rating).label("rating_count"),
+            )
+            .join(
+                EvaluationResult,
+                EvaluationResult.id == QuestionResult.evaluation_result_id,
+            )
+            .outerjoin(Question, Question.id == QuestionResult.question_id)
+            .where(QuestionResult.rating.is_not(None), *criterion)
+            .group_by(category_id)
+            .order_by(category_id),
+        )
+
+    @staticmethod
+    def get_rating_histogram_rows(db: Session, *criterion: Any) -> List[Row]:
+        """Count the answers per question and rating of the filtered results.
+
+        Rows are (question_id, question_text, category_id, rating, count), one
+        columnar query whatever the number of answers. Criterion apply to
+        EvaluationResult.
+        """
+        question_text = func.coalesce(
+            QuestionResult.question_text, Question.question_text
+        )
+        category_id = func.coalesce(QuestionResult.category_id, Question.category_id)
+
+        return BaseRepository.get_rows(
+            db,
+            select(
+                QuestionResult.question_id,
+                question_text.label("question_text"),
+                category_id.label("category_id"),
+                QuestionResult.rating,
+                func.count().label("count"),
+            )
+            .join(
+                EvaluationResult,
+                EvaluationResult.id == QuestionResult.evaluation_result_id,
+            )
+            .outerjoin(Question, Question.id == QuestionResult.question_id)
+            .where(QuestionResult.rating.is_not(None), *criterion)
+            .group_by(
+                QuestionResult.question_id,
+                question_text,
+                category_id,
+                QuestionResult.rating,
+            )
+            .order_by(QuestionResult.question_id, question_text),
+        )
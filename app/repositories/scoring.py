@@ -0,0 +1,140 @@
+"""Scoring.
+
+Weighted scores of evaluation results, computed for any number of results
+with one SQL statement. The score of a result is the mean of its category
+averages, weighted by the category weights of its evaluation::
+
+    score = sum(weight * average) / sum(weight)
+
+The categories scored for an evaluation are the ones of its questions and
+of its weights. A category without a configured weight weighs
+DEFAULT_WEIGHT, a category without answers averages 0.
+
+Teachers are ranked on the mean score of their results, or on the mean
+average of their results in one category.
+"""
+
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Select, and_, func, select, union
+from sqlalchemy.orm import Session
+
+from app.models import (
+    EvaluationCategoryWeight,
+    EvaluationResult,
+    Question,
+    QuestionResult,
+)
+from app.repositories.base import BaseRepository
+
+DEFAULT_WEIGHT = 1.0
+
+
+def category_averages(*criterion: Any) -> Select:
+    """Select the average rating per category of the filtered evaluation results."""
+    category_id = func.coalesce(QuestionResult.category_id, Question.category_id)
+    return (
+        select(
+            QuestionResult.evaluation_result_id,
+            category_id.label("category_id"),
+            func.avg(QuestionResult.rating).label("average"),
+        )
+        .join(
+            EvaluationResult,
+            EvaluationResult.id == QuestionResult.evaluation_result_id,
+        )
+        .outerjoin(Question, Question.id == QuestionResult.question_id)
+        .where(*criterion)
+        .group_by(QuestionResult.evaluation_result_id, category_id)
+    )
+
+
+def scored_categories() -> Select:
+    """Select the (evaluation_id, category_id) pairs which are scored."""
+    return union(
+        select(Question.evaluation_id, Question.category_id).where(
+            Question.category_id.is_not(None)
+        ),
+        select(
+            EvaluationCategoryWeight.evaluation_id,
+            EvaluationCategoryWeight.category_id,
+        ),
+    )
+
+
+def weighted_scores(*criterion: Any) -> Select:
+    """Select the weighted score of each filtered evaluation result.
+
+    Criterion apply to EvaluationResult, e.g. `EvaluationResult.teacher_id ==
+    teacher_id`. Results without scored categories are left out.
+    """
+    averages = category_averages(*criterion).subquery()
+    categories = scored_categories().subquery()
+    weight = func.coalesce(EvaluationCategoryWeight.weight, DEFAULT_WEIGHT)
+
+    return (
+        select(
+            EvaluationResult.id.label("evaluation_result_id"),
+            func.coalesce(
+                func.sum(weight * func.coalesce(averages.c.average, 0))
+                / func.nullif(func.sum(weight), 0),
+                0,
+            ).label("score"),
+        )
+        .join(categories, categories.c.evaluation_id == EvaluationResult.evaluation_id)
+        .outerjoin(
+            EvaluationCategoryWeight,
+            and_(
+                EvaluationCategoryWeight.evaluation_id == categories.c.evaluation_id,
+                EvaluationCategoryWeight.category_id == categories.c.category_id,
+            ),
+        )
+        .outerjoin(
+            averages,
+            and_(
+                averages.c.evaluation_result_id == EvaluationResult.id,
+                averages.c.category_id == categories.c.category_id,
+            ),
+        )
+        .where(*criterion)
+        .group_by(EvaluationResult.id)
+    )
+
+
+def teacher_rankings(*criterion: Any, category_id: Optional[int] = None) -> Select:
+    """Select the average of each teacher with its rank and percent rank.
+
+    Criterion apply to EvaluationResult. Ranks are computed with RANK() and
+    PERCENT_RANK() windows over the averages, in the same statement: rank 1
+    is the best average, percent rank 0 the lowest and 1 the highest.
+    """
+    if category_id is None:
+        scores = weighted_scores(*criterion).subquery()
+        score = scores.c.score
+        score_criterion = ()
+    else:
+        scores = category_averages(*criterion).subquery()
+        score = scores.c.average
+        score_criterion = (scores.c.category_id == category_id,)
+
+    average = func.avg(score)
+    return (
+        select(
+            EvaluationResult.teacher_id,
+            func.count(EvaluationResult.id).label("results"),
+            average.label("average"),
+            func.rank().over(order_by=average.desc()).label("rank"),
+            func.percent_rank().over(order_by=average).label("percent_rank"),
+        )
+        .join(scores, scores.c.evaluation_result_id == EvaluationResult.id)
+        .where(EvaluationResult.teacher_id.is_not(None), *score_criterion)
+        .group_by(EvaluationResult.teacher_id)
+    )
+
+
+def get_weighted_scores(db: Session, *criterion: Any) -> Dict[int, float]:
+    """Get the weighted scores of the filtered evaluation results by their ID."""
+    return {
+        row.evaluation_result_id: float(row.score)
+        for row in BaseRepository.get_rows(db, weighted_scores(*criterion))
+    }
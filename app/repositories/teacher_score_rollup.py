@@ -0,0 +1,334 @@
+"""Teacher Score Rollup Repository."""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from pydantic import BaseModel
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import EvaluationResult, Question, QuestionResult, TeacherScoreRollup
+from app.repositories.base import BaseRepository, insert_on_conflict
+from app.repositories.flush import flushed_changes, load_deleted, track_previous_values
+from exceptions.exceptions import DatabaseException
+
+logger = logging.getLogger(__name__)
+
+# Fields of an answer that decide the rollup it counts in
+TRACKED_FIELDS = (
+    "rating",
+    "evaluation_result_id",
+    "question_id",
+    "category_id",
+    "created_at",
+)
+# Fields of a result that decide whether its answers count
+RESULT_FIELDS = ("teacher_id", "is_submitted")
+
+RollupKey = Tuple[int, int, date]
+
+
+def week_start(moment: datetime) -> date:
+    """Get the Monday of the week of a moment."""
+    day = moment.date() if isinstance(moment, datetime) else moment
+    return day - timedelta(days=day.weekday())
+
+
+def rollup_start(moment: datetime) -> date:
+    """Get the start of the rollup of a moment.
+
+    The Monday of its week, or the 1st of its month when the week started in
+    the previous month: weeks are split at month boundaries, so that months
+    and terms sum whole rollups.
+    """
+    day = moment.date() if isinstance(moment, datetime) else moment
+    return max(week_start(day), day.replace(day=1))
+
+
+def _rollup_start_expression(db: Session, column: Any) -> Any:
+    """Get the start of the rollup of a column, as a SQL expression."""
+    if db.get_bind().dialect.name == "sqlite":
+        return func.max(
+            func.date(column, "-6 days", "weekday 1"),
+            func.date(column, "start of month"),
+        )
+    return func.greatest(
+        func.date_trunc("week", column), func.date_trunc("month", column)
+    ).cast(TeacherScoreRollup.bucket_start.type)
+
+
+def _load_deleted_answers(session: Session, flush_context: Any, instances: Any) -> None:
+    """Load the tracked fields of expired answers and results before deletion."""
+    load_deleted(session, QuestionResult, TRACKED_FIELDS)
+    load_deleted(session, EvaluationResult, ("id", *RESULT_FIELDS))
+
+
+def _add_delta(
+    deltas: Dict[RollupKey, List[int]],
+    sign: int,
+    teacher_id: Optional[int],
+    category_id: Optional[int],
+    created_at: datetime,
+    rating: int,
+) -> None:
+    """Add a signed rating to the delta of its rollup."""
+    if teacher_id is None or category_id is None:
+        return
+
+    delta = deltas[(teacher_id, category_id, rollup_start(created_at))]
+    delta[0] += sign * rating
+    delta[1] += sign
+
+
+def flipped_result_deltas(
+    db: Session, flips: Dict[int, int], teacher_ids: Dict[int, Optional[int]]
+) -> Dict[RollupKey, List[int]]:
+    """Get the deltas of the answers of results turned submitted or not.
+
+    `flips` maps result ids to +1 when submitted, -1 when no longer.
+    """
+    deltas: Dict[RollupKey, List[int]] = defaultdict(lambda: [0, 0])
+    flips = {result_id: flip for result_id, flip in flips.items() if flip}
+    if not flips:
+        return deltas
+
+    category_id = func.coalesce(QuestionResult.category_id, Question.category_id)
+    answers = db.connection().execute(
+        select(
+            QuestionResult.evaluation_result_id,
+            category_id.label("category_id"),
+            QuestionResult.created_at,
+            QuestionResult.rating,
+        )
+        .outerjoin(Question, Question.id == QuestionResult.question_id)
+        .where(
+            QuestionResult.evaluation_result_id.in_(flips),
+            QuestionResult.rating.is_not(None),
+            QuestionResult.created_at.is_not(None),
+        )
+    )
+    for answer in answers:
+        _add_delta(
+            deltas,
+            flips[answer.evaluation_result_id],
+            teacher_ids.get(answer.evaluation_result_id),
+            answer.category_id,
+            answer.created_at,
+            answer.rating,
+        )
+
+    return deltas
+
+
+def _update_rollups(session: Session, flush_context: Any) -> None:
+    """Apply the answers written by a flush to the rollups, in its transaction.
+
+    Answers count while their result is submitted: changed answers count as
+    of the result before the flush, and a result turning submitted (or no
+    longer) adds (removes) every answer it has after the flush.
+    """
+    was_submitted: Dict[int, bool] = {}
+    flips: Dict[int, int] = defaultdict(int)
+    teacher_ids: Dict[int, Optional[int]] = {}
+    for sign, fields in flushed_changes(
+        session, EvaluationResult, ("id", *RESULT_FIELDS)
+    ):
+        # The previous fields of a changed result come first
+        was_submitted.setdefault(
+            fields["id"], sign < 0 and bool(fields["is_submitted"])
+        )
+        teacher_ids.setdefault(fields["id"], fields["teacher_id"])
+        flips[fields["id"]] += sign * bool(fields["is_submitted"])
+
+    changes = [
+        (sign, fields)
+        for sign, fields in flushed_changes(session, QuestionResult, TRACKED_FIELDS)
+        if fields["rating"] is not None and fields["created_at"] is not None
+    ]
+    if not changes and not any(flips.values()):
+        return
+
+    connection = session.connection()
+    result_ids = {
+        fields["evaluation_result_id"] for _, fields in changes
+    } - was_submitted.keys()
+    if result_ids:
+        for result in connection.execute(
+            select(
+                EvaluationResult.id,
+                EvaluationResult.teacher_id,
+                EvaluationResult.is_submitted,
+            ).where(EvaluationResult.id.in_(result_ids))
+        ):
+            teacher_ids[result.id] = result.teacher_id
+            was_submitted[result.id] = bool(result.is_submitted)
+
+    question_ids = {fields["question_id"] for _, fields in changes}
+    category_ids = {}
+    if question_ids:
+        category_ids = dict(
+            connection.execute(
+                select(Question.id, Question.category_id).where(
+                    Question.id.in_(question_ids)
+                )
+            ).all()
+        )
+
+    deltas = flipped_result_deltas(session, flips, teacher_ids)
+    for sign, fields in changes:
+        if not was_submitted.get(fields["evaluation_result_id"]):
+            continue
+
+        _add_delta(
+            deltas,
+            sign,
+            teacher_ids.get(fields["evaluation_result_id"]),
+            fields["category_id"] or category_ids.get(fields["question_id"]),
+            fields["created_at"],
+            fields["rating"],
+        )
+
+    TeacherScoreRollupRepository.add(session, deltas)
+
+
+def maintain_teacher_score_rollups(target: Any) -> None:
+    """Keep the rollups up to date with every submitted answer of the sessions.
+
+    Answers moved to another teacher or category by a change of their
+    evaluation result or question are only caught up by a rebuild.
+    """
+    track_previous_values(QuestionResult, TRACKED_FIELDS)
+    track_previous_values(EvaluationResult, RESULT_FIELDS)
+    event.listen(target, "before_flush", _load_deleted_answers)
+    event.listen(target, "after_flush", _update_rollups)
+
+
+class TeacherScoreRollupRepository(
+    BaseRepository[TeacherScoreRollup, BaseModel, BaseModel]
+):
+    """Teacher Score Rollup Repository Class."""
+
+    @staticmethod
+    def add(db: Session, deltas: Dict[RollupKey, List[int]]) -> None:
+        """Add (sum, count) deltas to the rollups, creating missing ones.
+
+        Runs on the connection of the session, without committing.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "teacher_id": teacher_id,
+                "category_id": category_id,
+                "bucket_start": bucket_start,
+                "rating_sum": delta[0],
+                "rating_count": delta[1],
+                "updated_at": now,
+            }
+            for (teacher_id, category_id, bucket_start), delta in deltas.items()
+            if any(delta)
+        ]
+        if not rows:
+            return
+
+        statement = insert_on_conflict(db, TeacherScoreRollup)
+        db.connection().execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    TeacherScoreRollup.teacher_id,
+                    TeacherScoreRollup.category_id,
+                    TeacherScoreRollup.bucket_start,
+                ],
+                set_={
+                    "rating_sum": TeacherScoreRollup.rating_sum
+                    + statement.excluded.rating_sum,
+                    "rating_count": TeacherScoreRollup.rating_count
+                    + statement.excluded.rating_count,
+                    "updated_at": statement.excluded.updated_at,
+                },
+            ),
+            rows,
+        )
+
+    @staticmethod
+    def get_all_by_teacher_id(
+        db: Session, *, teacher_id: int, category_id: Optional[int] = None
+    ) -> List[TeacherScoreRollup]:
+        """Get by teacher_id, and category_id if given, oldest bucket first."""
+        query = db.query(TeacherScoreRollup).filter(
+            TeacherScoreRollup.teacher_id == teacher_id,
+            TeacherScoreRollup.rating_count > 0,
+        )
+        if category_id is not None:
+            query = query.filter(TeacherScoreRollup.category_id == category_id)
+
+        response = cast(
+            List[TeacherScoreRollup],
+            query.order_by(
+                TeacherScoreRollup.bucket_start, TeacherScoreRollup.category_id
+            ).all(),
+        )
+
+        return response
+
+    @staticmethod
+    def rebuild(db: Session) -> int:
+        """Recompute every rollup from the submitted answers, in one INSERT ... SELECT.
+
+        Returns the number of rollups.
+        """
+        bucket_start = _rollup_start_expression(db, QuestionResult.created_at)
+        category_id = func.coalesce(QuestionResult.category_id, Question.category_id)
+        rollups = (
+            select(
+                EvaluationResult.teacher_id,
+                category_id,
+                bucket_start,
+                func.sum(QuestionResult.rating),
+                func.count(QuestionResult.rating),
+                func.current_timestamp(),
+            )
+            .select_from(QuestionResult)
+            .join(
+                EvaluationResult,
+                EvaluationResult.id == QuestionResult.evaluation_result_id,
+            )
+            .outerjoin(Question, Question.id == QuestionResult.question_id)
+            .where(
+                QuestionResult.rating.is_not(None),
+                QuestionResult.created_at.is_not(None),
+                EvaluationResult.teacher_id.is_not(None),
+                EvaluationResult.is_submitted.is_(True),
+                category_id.is_not(None),
+            )
+            .group_by(EvaluationResult.teacher_id, category_id, bucket_start)
+        )
+
+        try:
+            db.execute(delete(TeacherScoreRollup))
+            count = db.execute(
+                insert(TeacherScoreRollup).from_select(
+                    [
+                        TeacherScoreRollup.teacher_id,
+                        TeacherScoreRollup.category_id,
+                        TeacherScoreRollup.bucket_start,
+                        TeacherScoreRollup.rating_sum,
+                        TeacherScoreRollup.rating_count,
+                        TeacherScoreRollup.updated_at,
+                    ],
+                    rollups,
+                )
+            ).rowcount
+            db.commit()
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error rebuilding teacher score rollups: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred during the rebuild.",
+            ) from e
+
+        return count
@@ -23,6 +23,9 @@ from .evaluation import (
     EvaluationUpdate,  # noqa: F401
     EvaluationsOut,  # noqa: F401
     EvaluationDetailedOut,  # noqa: F401
+    EvaluationFormOut,  # noqa: F401
+    EvaluationCloneIn,  # noqa: F401
+    RatingHistogramOut,  # noqa: F401
 )
 
 from .question import (
@@ -46,9 +49,38 @@ from .evaluation_result import (
     EvaluationDetailedResultOut,  # noqa: F401
     EvaluationResultIn,  # noqa: F401
     EvaluationResultOut,  # noqa: F401
+    ExportFormatEnum,  # noqa: F401
+    EvaluationAssignmentOut,  # noqa: F401
+    EvaluationParticipationOut,  # noqa: F401
+    TeacherParticipationOut,  # noqa: F401
+    ParticipationReportOut,  # noqa: F401
+    RatingStatisticsOut,  # noqa: F401
+    CategoryStatisticsOut,  # noqa: F401
+    QuestionStatisticsOut,  # noqa: F401
+    TeacherReportOut,  # noqa: F401
+    TeacherRankOut,  # noqa: F401
+    CommentSearchOut,  # noqa: F401
+    ThemeOut,  # noqa: F401
+    TrendBucketEnum,  # noqa: F401
+    TrendPointOut,  # noqa: F401
+    CategoryTrendOut,  # noqa: F401
+    TeacherTrendOut,  # noqa: F401
+    DashboardCountsOut,  # noqa: F401
+    DashboardCategoryOut,  # noqa: F401
+    DashboardSubmissionOut,  # noqa: F401
+    DashboardSnapshotOut,  # noqa: F401
 )
 from .question_result import (
     QuestionResultOut,  # noqa: F401
     QuestionResultUpdate,  # noqa: F401
     QuestionResultIn,  # noqa: F401
 )
+from .category import (
+    CategoryIn,  # noqa: F401
+    CategoryOut,  # noqa: F401
+    CategoryUpdate,  # noqa: F401
+)
+from .evaluation_category_weight import (
+    EvaluationCategoryWeightIn,  # noqa: F401
+    EvaluationCategoryWeightOut,  # noqa: F401
+)
@@ -0,0 +1,34 @@
+"""Category Schema."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CategoryBase(BaseModel):
+    """Category Base Class."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str | None = None
+    display_order: int | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class CategoryIn(CategoryBase):
+    """Category In Class."""
+
+    pass
+
+
+class CategoryUpdate(CategoryBase):
+    """Category Update Class."""
+
+    pass
+
+
+class CategoryOut(CategoryBase):
+    """Category Out Class."""
+
+    id: int
@@ -1,8 +1,13 @@
 """Evaluation Schema."""
 
 from datetime import datetime
+from typing import List
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+from .evaluation_result import EvaluationResultOut
+from .question import QuestionOut
+from .question_result import QuestionResultOut
 
 
 class EvaluationBase(BaseModel):
@@ -51,3 +56,37 @@ class EvaluationsOut(EvaluationBase):
 
     id: int
     teacher_name: str | None = None
+
+
+class EvaluationCloneIn(BaseModel):
+    """Evaluation Clone In Class."""
+
+    teacher_ids: List[int] = Field(min_length=1)
+    title: str | None = None
+
+
+class EvaluationFormOut(BaseModel):
+    """Evaluation Form Out Class.
+
+    Everything the evaluation form needs, with the caller's prior answers.
+    """
+
+    evaluation: EvaluationDetailedOut
+    questions: List[QuestionOut]
+    evaluation_results: List[EvaluationResultOut]
+    question_results: List[QuestionResultOut]
+
+
+class RatingHistogramOut(BaseModel):
+    """Rating Histogram Out Class.
+
+    `counts[i][j]` is the number of answers to the i-th question with the j-th
+    rating, `responses[i]` their total.
+    """
+
+    evaluation_id: int
+    ratings: List[int]
+    question_ids: List[int | None]
+    question_texts: List[str | None]
+    responses: List[int]
+    counts: List[List[int]]
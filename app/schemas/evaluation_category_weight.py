@@ -0,0 +1,29 @@
+"""Evaluation Category Weight Schema."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class EvaluationCategoryWeightBase(BaseModel):
+    """Evaluation Category Weight Base Class."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    category_id: int
+    weight: float = Field(default=1.0, ge=0)
+
+
+class EvaluationCategoryWeightIn(EvaluationCategoryWeightBase):
+    """Evaluation Category Weight In Class."""
+
+    pass
+
+
+class EvaluationCategoryWeightOut(EvaluationCategoryWeightBase):
+    """Evaluation Category Weight Out Class."""
+
+    id: int
+    evaluation_id: int
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
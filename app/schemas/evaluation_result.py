@@ -1,10 +1,27 @@
 """Evaluation Result Schema."""
 
-from datetime import datetime
+from datetime import date, datetime
+from enum import Enum
+from typing import Dict, List
 
 from pydantic import BaseModel, ConfigDict
 
 
+class ExportFormatEnum(str, Enum):
+    """Evaluation result export formats."""
+
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+class TrendBucketEnum(str, Enum):
+    """Teacher score trend buckets."""
+
+    week = "week"
+    month = "month"
+    term = "term"
+
+
 class EvaluationResultBase(BaseModel):
     """Evaluation Base Class."""
 
@@ -57,3 +74,178 @@ class EvaluationsResultOut(EvaluationResultBase):
     id: int
     teacher_name: str | None = None
     student_name: str | None = None
+
+
+class EvaluationAssignmentOut(BaseModel):
+    """Evaluation Assignment Out Class."""
+
+    evaluation_id: int
+    admin_id: int
+    assigned: int
+
+
+class ParticipationOut(BaseModel):
+    """Participation Out Class."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    total: int
+    submitted: int
+    pending: int
+    completion: float
+
+
+class EvaluationParticipationOut(ParticipationOut):
+    """Evaluation Participation Out Class."""
+
+    evaluation_id: int
+    title: str | None = None
+    teacher_id: int | None = None
+    teacher_name: str | None = None
+
+
+class TeacherParticipationOut(ParticipationOut):
+    """Teacher Participation Out Class."""
+
+    teacher_id: int | None = None
+    teacher_name: str | None = None
+
+
+class ParticipationReportOut(BaseModel):
+    """Participation Report Out Class."""
+
+    evaluations: List[EvaluationParticipationOut]
+    teachers: List[TeacherParticipationOut]
+
+
+class RatingStatisticsOut(BaseModel):
+    """Rating Statistics Out Class."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    count: int
+    mean: float
+    std: float
+    median: float
+    ci_low: float
+    ci_high: float
+    distribution: Dict[int, int]
+
+
+class CategoryStatisticsOut(RatingStatisticsOut):
+    """Category Statistics Out Class."""
+
+    category_id: int | None = None
+    category: str | None = None
+
+
+class QuestionStatisticsOut(RatingStatisticsOut):
+    """Question Statistics Out Class."""
+
+    question_id: int | None = None
+    question_text: str | None = None
+    category_id: int | None = None
+
+
+class TeacherReportOut(BaseModel):
+    """Teacher Report Out Class."""
+
+    teacher_id: int
+    teacher_name: str | None = None
+    results: int
+    score: float
+    overall: RatingStatisticsOut
+    categories: List[CategoryStatisticsOut]
+    questions: List[QuestionStatisticsOut]
+
+
+class TeacherRankOut(BaseModel):
+    """Teacher Rank Out Class."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    teacher_id: int
+    teacher_name: str | None = None
+    results: int
+    average: float
+    rank: int
+    percentile: float
+
+
+class CommentSearchOut(BaseModel):
+    """Comment Search Out Class."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    source: str
+    id: int
+    evaluation_result_id: int
+    evaluation_id: int | None = None
+    teacher_id: int | None = None
+    rank: float
+    snippet: str | None = None
+
+
+class ThemeOut(BaseModel):
+    """Theme Out Class."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    term: str
+    count: int
+
+
+class TrendPointOut(BaseModel):
+    """Trend Point Out Class."""
+
+    bucket_start: date
+    average: float
+    count: int
+
+
+class CategoryTrendOut(BaseModel):
+    """Category Trend Out Class."""
+
+    category_id: int
+    category: str | None = None
+    points: List[TrendPointOut]
+
+
+class TeacherTrendOut(BaseModel):
+    """Teacher Trend Out Class."""
+
+    teacher_id: int
+    bucket: TrendBucketEnum
+    categories: List[CategoryTrendOut]
+
+
+class DashboardCountsOut(BaseModel):
+    """Dashboard Counts Out Class."""
+
+    evaluation_id: int
+    total: int
+    submitted: int
+    pending: int
+    completion: float
+
+
+class DashboardCategoryOut(BaseModel):
+    """Dashboard Category Out Class."""
+
+    category_id: int | None = None
+    average: float | None = None
+    count: int
+
+
+class DashboardSubmissionOut(BaseModel):
+    """Dashboard Submission Out Class."""
+
+    evaluation_id: int
+    admin_id: int | None = None
+    teacher_id: int | None = None
+
+
+class DashboardSnapshotOut(DashboardCountsOut):
+    """Dashboard Snapshot Out Class."""
+
+    categories: List[DashboardCategoryOut]
@@ -14,6 +14,7 @@ class QuestionBase(BaseModel):
     rating: int | None = None
     comment: str | None = None
     category: str | None = None
+    category_id: int | None = None
     student_id: int | None = None
     evaluation_id: int | None = None
     student_name: str | None = None
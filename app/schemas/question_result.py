@@ -10,6 +10,7 @@ class QuestionResultBase(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    question_id: int | None = None
     question_text: str | None = None
     rating: int | None = None
     comment: str | None = None
@@ -18,6 +19,7 @@ class QuestionResultBase(BaseModel):
     student_name: str | None = None
     evaluation_title: str | None = None
     category: str | None = None
+    category_id: int | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
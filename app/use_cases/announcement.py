@@ -1,15 +1,17 @@
 """Announcement Use Case."""
 
 import logging
-from typing import Union
+from typing import Optional, Union
 
 from fastapi_pagination import paginate, Page
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
 from app import schemas
+from app.core.etag import compute_etag
 from app.models import Announcement, User
 from app.repositories.announcement import AnnouncementRepository
+from app.repositories.loader import BatchLoader
 from app.repositories.user import UserRepository
 from exceptions.exceptions import DatabaseException, APIException
 
@@ -24,6 +26,39 @@ class AnnouncementUseCase:
         self.db = db
         self.announcement_repository = AnnouncementRepository(Announcement)
         self.user_repository = UserRepository(User)
+        self.user_loader = BatchLoader(self.db, self.user_repository)
+
+    def get_announcements_etag(self, *parts: str) -> Optional[str]:
+        """Get the ETag of the announcements list, including the author names."""
+        try:
+            announcements_version = self.announcement_repository.get_version(self.db)
+            users_version = self.user_repository.get_version(self.db)
+
+        except DatabaseException as e:
+            logger.error(
+                "Database error occurred while fetching announcements version: "
+                f"{e.detail}"
+            )
+            return None
+
+        return compute_etag(*announcements_version, *users_version, *parts)
+
+    def get_announcement_etag(self, _id: int) -> Optional[str]:
+        """Get the ETag of an announcement record."""
+        try:
+            updated_at, count = self.announcement_repository.get_version(
+                self.db, Announcement.id == _id
+            )
+
+        except DatabaseException as e:
+            logger.error(
+                "Database error occurred while fetching announcement version: "
+                f"{e.detail}"
+            )
+            return None
+
+        # Let the regular path answer with 404 for missing records
+        return compute_etag(_id, updated_at) if count else None
 
     def get_announcements(self) -> Union[Page[schemas.AnnouncementsOut], JSONResponse]:
         """Get all announcements record."""
@@ -31,8 +66,12 @@ class AnnouncementUseCase:
             response = []
             announcements = self.announcement_repository.get_all(self.db)
 
+            self.user_loader.prime(
+                announcement.admin_id for announcement in announcements
+            )
+
             for announcement in announcements:
-                user = self.user_repository.get(self.db, announcement.admin_id)
+                user = self.user_loader.load(announcement.admin_id)
 
                 announcement_dict = {
                     key: value
@@ -40,7 +79,7 @@ class AnnouncementUseCase:
                     if not key.startswith("_")
                 }
 
-                full_name = f"{user.first_name} {user.middle_name} {user.last_name}"
+                full_name = user.full_name
                 announcement_dict.update(
                     {"name": full_name, "role": user.role.capitalize()}
                 )
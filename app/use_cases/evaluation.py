@@ -1,15 +1,28 @@
 """Evaluation Use Case."""
 
 import logging
-from typing import Union
+from typing import Any, List, Optional, Union
 
 from fastapi_pagination import paginate, Page
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
 from app import schemas
-from app.models import Evaluation, User
+from app.core import statistics
+from app.core.etag import compute_etag
+from app.models import (
+    Evaluation,
+    EvaluationCategoryWeight,
+    EvaluationResult,
+    QuestionResult,
+    User,
+)
 from app.repositories.evaluation import EvaluationRepository
+from app.repositories.evaluation_category_weight import (
+    EvaluationCategoryWeightRepository,
+)
+from app.repositories.loader import BatchLoader
+from app.repositories.question_result import QuestionResultRepository
 from app.repositories.user import UserRepository
 from exceptions.exceptions import DatabaseException, APIException
 
@@ -24,16 +37,80 @@ class EvaluationUseCase:
         self.db = db
         self.evaluation_repository = EvaluationRepository(Evaluation)
         self.user_repository = UserRepository(User)
+        self.user_loader = BatchLoader(self.db, self.user_repository)
+        self.question_result_repository = QuestionResultRepository(QuestionResult)
+        self.evaluation_category_weight_repository = EvaluationCategoryWeightRepository(
+            EvaluationCategoryWeight
+        )
+
+    def get_evaluations_etag(self, *parts: str) -> Optional[str]:
+        """Get the ETag of the evaluations list, including the teacher names."""
+        try:
+            evaluations_version = self.evaluation_repository.get_version(self.db)
+            users_version = self.user_repository.get_version(self.db)
+
+        except DatabaseException as e:
+            logger.error(
+                "Database error occurred while fetching evaluations version: "
+                f"{e.detail}"
+            )
+            return None
+
+        return compute_etag(*evaluations_version, *users_version, *parts)
+
+    def get_evaluations_by_teacher_id_etag(
+        self, teacher_id: int, *parts: str
+    ) -> Optional[str]:
+        """Get the ETag of the evaluations list of a teacher."""
+        try:
+            evaluations_version = self.evaluation_repository.get_version(
+                self.db, Evaluation.teacher_id == teacher_id
+            )
+            users_version = self.user_repository.get_version(
+                self.db, User.id == teacher_id
+            )
+
+        except DatabaseException as e:
+            logger.error(
+                "Database error occurred while fetching evaluations version: "
+                f"{e.detail}"
+            )
+            return None
+
+        return compute_etag(teacher_id, *evaluations_version, *users_version, *parts)
+
+    def get_evaluation_etag(self, _id: int) -> Optional[str]:
+        """Get the ETag of an evaluation record."""
+        try:
+            updated_at, count = self.evaluation_repository.get_version(
+                self.db, Evaluation.id == _id
+            )
+
+        except DatabaseException as e:
+            logger.error(
+                f"Database error occurred while fetching evaluation version: {e.detail}"
+            )
+            return None
+
+        # Let the regular path answer with 404 for missing records
+        return compute_etag(_id, updated_at) if count else None
+
+    def get_evaluations(
+        self, ids: Optional[List[int]] = None
+    ) -> Union[Page[schemas.EvaluationsOut], JSONResponse]:
+        """Get all evaluations record, or only the evaluations of the given ids."""
+        if ids is None:
+            return self._get_evaluation_rows()
 
-    def get_evaluations(self) -> Union[Page[schemas.EvaluationsOut], JSONResponse]:
-        """Get all evaluations record."""
         try:
             response = []
 
-            evaluations = self.evaluation_repository.get_all(self.db)
+            evaluations = self.evaluation_repository.get_many(self.db, ids)
+
+            self.user_loader.prime(evaluation.teacher_id for evaluation in evaluations)
 
             for evaluation in evaluations:
-                user = self.user_repository.get(self.db, evaluation.teacher_id)
+                user = self.user_loader.load(evaluation.teacher_id)
 
                 evaluation_dict = {
                     key: value
@@ -41,7 +118,7 @@ class EvaluationUseCase:
                     if not key.startswith("_")
                 }
 
-                full_name = f"{user.first_name} {user.middle_name} {user.last_name}"
+                full_name = user.full_name
                 evaluation_dict.update({"teacher_name": full_name})
 
                 response.append(evaluation_dict)
@@ -58,26 +135,32 @@ class EvaluationUseCase:
         self, teacher_id: int
     ) -> Union[Page[schemas.EvaluationsOut], JSONResponse]:
         """Get all evaluations record."""
-        try:
-            response = []
+        return self._get_evaluation_rows(Evaluation.teacher_id == teacher_id)
 
-            evaluations = self.evaluation_repository.get_all_by_teacher_id(
-                self.db, teacher_id=teacher_id
+    def get_pending_evaluations(
+        self, admin_id: int
+    ) -> Union[Page[schemas.EvaluationsOut], JSONResponse]:
+        """Get the evaluations not submitted by a student yet, paginated in SQL."""
+        try:
+            return self.evaluation_repository.paginate_pending_rows(
+                self.db, schemas.EvaluationsOut.model_fields, admin_id=admin_id
             )
 
-            for evaluation in evaluations:
-                user = self.user_repository.get(self.db, evaluation.teacher_id)
-
-                evaluation_dict = {
-                    key: value
-                    for key, value in vars(evaluation).items()
-                    if not key.startswith("_")
-                }
-
-                full_name = f"{user.first_name} {user.middle_name} {user.last_name}"
-                evaluation_dict.update({"teacher_name": full_name})
+        except DatabaseException as e:
+            logger.error(
+                "Database error occurred while fetching pending evaluations: "
+                f"{e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-                response.append(evaluation_dict)
+    def _get_evaluation_rows(
+        self, *criterion: Any
+    ) -> Union[Page[schemas.EvaluationsOut], JSONResponse]:
+        """Get evaluations with teacher names as plain rows, without ORM objects."""
+        try:
+            rows = self.evaluation_repository.get_all_rows_with_teacher_name(
+                self.db, schemas.EvaluationsOut.model_fields, *criterion
+            )
 
         except DatabaseException as e:
             logger.error(
@@ -85,7 +168,7 @@ class EvaluationUseCase:
             )
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-        return paginate(response)
+        return paginate(rows)
 
     def get_evaluation(self, _id: int) -> Union[schemas.EvaluationOut, JSONResponse]:
         """Get evaluation record."""
@@ -100,6 +183,80 @@ class EvaluationUseCase:
             )
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
+    def get_evaluation_form(
+        self, _id: int, admin_id: int
+    ) -> Union[schemas.EvaluationFormOut, JSONResponse]:
+        """Get evaluation, questions and prior answers of admin_id at once."""
+        try:
+            evaluation = self.evaluation_repository.get_form(
+                self.db, _id=_id, admin_id=admin_id
+            )
+            question_results = (
+                self.question_result_repository.get_all_rows_by_evaluation_result_ids(
+                    self.db,
+                    schemas.QuestionResultOut.model_fields,
+                    evaluation_result_ids=[
+                        evaluation_result.id
+                        for evaluation_result in evaluation.evaluation_results
+                    ],
+                )
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(
+                f"Database error occurred while fetching evaluation form: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        user = evaluation.user
+        evaluation_out = schemas.EvaluationDetailedOut.model_validate(evaluation)
+        if user is not None:
+            evaluation_out.teacher_name = user.full_name
+
+        return schemas.EvaluationFormOut(
+            evaluation=evaluation_out,
+            questions=sorted(evaluation.questions, key=lambda question: question.id),
+            evaluation_results=evaluation.evaluation_results,
+            question_results=question_results,
+        )
+
+    def get_rating_histogram(
+        self, _id: int
+    ) -> Union[schemas.RatingHistogramOut, JSONResponse]:
+        """Get the number of answers per question and rating of an evaluation."""
+        try:
+            self.evaluation_repository.get(self.db, _id)
+
+            rows = self.question_result_repository.get_rating_histogram_rows(
+                self.db, EvaluationResult.evaluation_id == _id
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(
+                f"Database error occurred while fetching rating histogram: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        ratings = sorted(set(statistics.RATING_SCALE) | {row.rating for row in rows})
+        columns = {rating: column for column, rating in enumerate(ratings)}
+
+        # Rows come ordered by question, with one row per rating
+        counts = {}
+        for row in rows:
+            question_counts = counts.setdefault(
+                (row.question_id, row.question_text), [0] * len(ratings)
+            )
+            question_counts[columns[row.rating]] = row.count
+
+        return schemas.RatingHistogramOut(
+            evaluation_id=_id,
+            ratings=ratings,
+            question_ids=[question_id for question_id, _ in counts],
+            question_texts=[question_text for _, question_text in counts],
+            responses=[sum(question_counts) for question_counts in counts.values()],
+            counts=list(counts.values()),
+        )
+
     def create_evaluation(
         self,
         *,
@@ -113,7 +270,7 @@ class EvaluationUseCase:
                 evaluation.__dict__.copy()
             )  # Create a copy of the dictionary
             evaluation_dict.pop("_sa_instance_state", None)
-            full_name = f"{user.first_name} {user.middle_name} {user.last_name}"
+            full_name = user.full_name
             evaluation_dict.update({"teacher_name": full_name})
 
             return schemas.EvaluationDetailedOut(**evaluation_dict)
@@ -124,6 +281,72 @@ class EvaluationUseCase:
             )
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
+    def clone_evaluation(
+        self, *, _id: int, obj_in: schemas.EvaluationCloneIn
+    ) -> Union[List[schemas.EvaluationOut], JSONResponse]:
+        """Clone evaluation record and its questions to the given teachers."""
+        try:
+            evaluations = self.evaluation_repository.clone(
+                self.db, _id=_id, teacher_ids=obj_in.teacher_ids, title=obj_in.title
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(
+                f"Database error occurred while cloning evaluation: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return [
+            schemas.EvaluationOut.model_validate(evaluation)
+            for evaluation in evaluations
+        ]
+
+    def get_category_weights(
+        self, _id: int
+    ) -> Union[List[schemas.EvaluationCategoryWeightOut], JSONResponse]:
+        """Get the category weights used to score the results of an evaluation."""
+        try:
+            self.evaluation_repository.get(self.db, _id)
+
+            weights = (
+                self.evaluation_category_weight_repository.get_all_by_evaluation_id(
+                    self.db, evaluation_id=_id
+                )
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(
+                f"Database error occurred while fetching category weights: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return [
+            schemas.EvaluationCategoryWeightOut.model_validate(weight)
+            for weight in weights
+        ]
+
+    def update_category_weights(
+        self, *, _id: int, obj_in: List[schemas.EvaluationCategoryWeightIn]
+    ) -> Union[List[schemas.EvaluationCategoryWeightOut], JSONResponse]:
+        """Replace the category weights of an evaluation."""
+        try:
+            self.evaluation_repository.get(self.db, _id)
+
+            weights = self.evaluation_category_weight_repository.replace(
+                self.db, evaluation_id=_id, weights=obj_in
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(
+                f"Database error occurred while updating category weights: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return [
+            schemas.EvaluationCategoryWeightOut.model_validate(weight)
+            for weight in weights
+        ]
+
     def update_evaluation(
         self,
         *,
@@ -143,7 +366,7 @@ class EvaluationUseCase:
                 update_evaluation.__dict__.copy()
             )  # Create a copy of the dictionary
             evaluation_dict.pop("_sa_instance_state", None)
-            full_name = f"{user.first_name} {user.middle_name} {user.last_name}"
+            full_name = user.full_name
             evaluation_dict.update({"teacher_name": full_name})
 
             return schemas.EvaluationDetailedOut(**evaluation_dict)
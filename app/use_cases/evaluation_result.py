@@ -1,21 +1,201 @@
 """Evaluation Result Use Case."""
 
+import csv
+import io
+import json
 import logging
-from typing import Union
-
+import time
+from collections import defaultdict
+from dataclasses import asdict
+from datetime import date
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from fastapi.encoders import jsonable_encoder
 from fastapi_pagination import paginate, Page
 from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, StreamingResponse
 
 from app import schemas
-from app.models import EvaluationResult, User, QuestionResult
+from app.core import statistics
+from app.core.config import settings
+from app.core.events import RESYNC_EVENT, Event, broadcaster, dashboard_channel
+from app.models import (
+    Category,
+    CommentTerm,
+    Evaluation,
+    EvaluationResult,
+    User,
+    QuestionResult,
+    TeacherScoreRollup,
+)
+from app.repositories.category import CategoryRepository
+from app.repositories.comment_search import search_comments
+from app.repositories.comment_term import CommentTermRepository
+from app.repositories.dashboard import RATINGS_EVENT, RESULTS_EVENT
+from app.repositories.evaluation import EvaluationRepository
 from app.repositories.evaluation_result import EvaluationResultRepository
+from app.repositories.loader import BatchLoader
 from app.repositories.question_result import QuestionResultRepository
+from app.repositories.scoring import get_weighted_scores
+from app.repositories.teacher_score_rollup import (
+    TeacherScoreRollupRepository,
+    week_start,
+)
 from app.repositories.user import UserRepository
 from exceptions.exceptions import DatabaseException, APIException
 
 logger = logging.getLogger(__name__)
 
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Categories reported as average_1..4 by the teacher results
+REPORT_CATEGORY_COUNT = 4
+
+
+def _iter_csv(rows: Iterable[dict]) -> Iterator[str]:
+    """Encode rows as CSV, yielding chunks of about EXPORT_CHUNK_SIZE."""
+    buffer = io.StringIO()
+    writer = None
+
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row.keys()))
+            writer.writeheader()
+        writer.writerow(row)
+
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _iter_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    """Encode rows as newline delimited JSON."""
+    for row in rows:
+        yield json.dumps(dict(row), default=str) + "\n"
+
+
+def _bucket_start(rollup_start: date, bucket: schemas.TrendBucketEnum) -> date:
+    """Get the start of the week, month or term a rollup falls in."""
+    if bucket == schemas.TrendBucketEnum.month:
+        return rollup_start.replace(day=1)
+
+    if bucket == schemas.TrendBucketEnum.term:
+        months = sorted(settings.TERM_START_MONTHS)
+        started = [month for month in months if month <= rollup_start.month]
+        if started:
+            return date(rollup_start.year, started[-1], 1)
+        return date(rollup_start.year - 1, months[-1], 1)
+
+    return week_start(rollup_start)
+
+
+def _completion(total: int, submitted: int) -> float:
+    """Percentage of submitted results."""
+    return round(submitted * 100 / total, 2) if total else 0.0
+
+
+def _sse(name: str, payload: Any) -> str:
+    """Encode a server-sent event."""
+    return f"event: {name}\ndata: {json.dumps(jsonable_encoder(payload))}\n\n"
+
+
+class LiveDashboard:
+    """Counts and category averages of an evaluation, kept up by deltas."""
+
+    def __init__(
+        self,
+        evaluation_id: int,
+        *,
+        total: int = 0,
+        submitted: int = 0,
+        ratings: Optional[Dict[Optional[int], List[int]]] = None,
+    ):
+        """Initialize with the counts and [rating_sum, rating_count] per category."""
+        self.evaluation_id = evaluation_id
+        self.total = total
+        self.submitted = submitted
+        self.ratings = ratings or {}
+
+    def counts(self) -> schemas.DashboardCountsOut:
+        """Get the result counts."""
+        return schemas.DashboardCountsOut(
+            evaluation_id=self.evaluation_id,
+            total=self.total,
+            submitted=self.submitted,
+            pending=self.total - self.submitted,
+            completion=_completion(self.total, self.submitted),
+        )
+
+    def categories(
+        self, category_ids: Optional[Iterable[Optional[int]]] = None
+    ) -> List[schemas.DashboardCategoryOut]:
+        """Get the average rating of the given categories, or of all of them."""
+        if category_ids is None:
+            category_ids = self.ratings
+
+        categories = []
+        for category_id in category_ids:
+            rating_sum, rating_count = self.ratings.get(category_id, (0, 0))
+            categories.append(
+                schemas.DashboardCategoryOut(
+                    category_id=category_id,
+                    average=round(rating_sum / rating_count, 2)
+                    if rating_count
+                    else None,
+                    count=rating_count,
+                )
+            )
+        return categories
+
+    def snapshot(self) -> schemas.DashboardSnapshotOut:
+        """Get the counts and every category average."""
+        return schemas.DashboardSnapshotOut(
+            **self.counts().model_dump(), categories=self.categories()
+        )
+
+    def apply(self, event: Event) -> List[Tuple[str, Any]]:
+        """Add the deltas of an event, returning the (name, payload) to push."""
+        if event.name == RESULTS_EVENT:
+            self.total += event.data["total"]
+            self.submitted += event.data["submitted"]
+            messages: List[Tuple[str, Any]] = [
+                (
+                    "submission",
+                    schemas.DashboardSubmissionOut(
+                        evaluation_id=self.evaluation_id, **submission
+                    ),
+                )
+                for submission in event.data["submissions"]
+            ]
+            messages.append(("counts", self.counts()))
+            return messages
+
+        if event.name == RATINGS_EVENT:
+            category_ids = []
+            for delta in event.data["categories"]:
+                rating = self.ratings.setdefault(delta["category_id"], [0, 0])
+                rating[0] += delta["rating_sum"]
+                rating[1] += delta["rating_count"]
+                category_ids.append(delta["category_id"])
+            return [("categories", self.categories(category_ids))]
+
+        return []
+
 
 class EvaluationResultUseCase:
     """Evaluation Result Use Case Class."""
@@ -24,8 +204,15 @@ class EvaluationResultUseCase:
         """Initialize with db."""
         self.db = db
         self.evaluation_result_repository = EvaluationResultRepository(EvaluationResult)
+        self.evaluation_repository = EvaluationRepository(Evaluation)
+        self.category_repository = CategoryRepository(Category)
         self.question_result_repository = QuestionResultRepository(QuestionResult)
         self.user_repository = UserRepository(User)
+        self.teacher_score_rollup_repository = TeacherScoreRollupRepository(
+            TeacherScoreRollup
+        )
+        self.comment_term_repository = CommentTermRepository(CommentTerm)
+        self.user_loader = BatchLoader(self.db, self.user_repository)
 
     def get_evaluation_results(
         self,
@@ -37,8 +224,11 @@ class EvaluationResultUseCase:
             evaluation_results = self.evaluation_result_repository.get_all(self.db)
 
             for evaluation in evaluation_results:
-                user = self.user_repository.get(self.db, evaluation.teacher_id)
-                user_student = self.user_repository.get(self.db, evaluation.admin_id)
+                self.user_loader.prime([evaluation.teacher_id, evaluation.admin_id])
+
+            for evaluation in evaluation_results:
+                user = self.user_loader.load(evaluation.teacher_id)
+                user_student = self.user_loader.load(evaluation.admin_id)
 
                 evaluation_dict = {
                     key: value
@@ -46,12 +236,8 @@ class EvaluationResultUseCase:
                     if not key.startswith("_")
                 }
 
-                full_name = f"{user.first_name} {user.middle_name} {user.last_name}"
-                full_name_student = (
-                    f"{user_student.first_name} "
-                    f"{user_student.middle_name} "
-                    f"{user_student.last_name}"
-                )
+                full_name = user.full_name
+                full_name_student = user_student.full_name
                 evaluation_dict.update(
                     {"teacher_name": full_name, "student_name": full_name_student}
                 )
@@ -80,8 +266,11 @@ class EvaluationResultUseCase:
             )
 
             for evaluation in evaluation_results:
-                user = self.user_repository.get(self.db, evaluation.teacher_id)
-                user_student = self.user_repository.get(self.db, evaluation.admin_id)
+                self.user_loader.prime([evaluation.teacher_id, evaluation.admin_id])
+
+            for evaluation in evaluation_results:
+                user = self.user_loader.load(evaluation.teacher_id)
+                user_student = self.user_loader.load(evaluation.admin_id)
 
                 evaluation_dict = {
                     key: value
@@ -89,12 +278,8 @@ class EvaluationResultUseCase:
                     if not key.startswith("_")
                 }
 
-                full_name = f"{user.first_name} {user.middle_name} {user.last_name}"
-                full_name_student = (
-                    f"{user_student.first_name} "
-                    f"{user_student.middle_name} "
-                    f"{user_student.last_name}"
-                )
+                full_name = user.full_name
+                full_name_student = user_student.full_name
                 evaluation_dict.update(
                     {"teacher_name": full_name, "student_name": full_name_student}
                 )
@@ -123,8 +308,11 @@ class EvaluationResultUseCase:
             )
 
             for evaluation in evaluation_results:
-                user = self.user_repository.get(self.db, evaluation.teacher_id)
-                user_student = self.user_repository.get(self.db, evaluation.admin_id)
+                self.user_loader.prime([evaluation.teacher_id, evaluation.admin_id])
+
+            for evaluation in evaluation_results:
+                user = self.user_loader.load(evaluation.teacher_id)
+                user_student = self.user_loader.load(evaluation.admin_id)
 
                 evaluation_dict = {
                     key: value
@@ -132,12 +320,8 @@ class EvaluationResultUseCase:
                     if not key.startswith("_")
                 }
 
-                full_name = f"{user.first_name} {user.middle_name} {user.last_name}"
-                full_name_student = (
-                    f"{user_student.first_name} "
-                    f"{user_student.middle_name} "
-                    f"{user_student.last_name}"
-                )
+                full_name = user.full_name
+                full_name_student = user_student.full_name
                 evaluation_dict.update(
                     {"teacher_name": full_name, "student_name": full_name_student}
                 )
@@ -167,26 +351,39 @@ class EvaluationResultUseCase:
                 )
             )
 
-            for evaluation in evaluation_results:
-                user = self.user_repository.get(self.db, evaluation.teacher_id)
-                user_student = self.user_repository.get(self.db, evaluation.admin_id)
-                question_results = self.question_result_repository.get_all_by_evaluation_result_id(
-                    self.db, evaluation_result_id=evaluation.id
+            categories = self.category_repository.get_all_ordered(self.db)[
+                :REPORT_CATEGORY_COUNT
+            ]
+            averages = {
+                (row.evaluation_result_id, row.category_id): row.average
+                for row in self.question_result_repository.get_category_average_rows(
+                    self.db,
+                    evaluation_result_ids=[
+                        evaluation.id for evaluation in evaluation_results
+                    ],
                 )
+            }
 
+            scores = get_weighted_scores(
+                self.db, EvaluationResult.teacher_id == teacher_id
+            )
 
-                ratings_1 = [qr.rating for qr in question_results if qr.category == 'Personal & Professional Characteristics']
-                ratings_2 = [qr.rating for qr in question_results if qr.category == 'Classroom Teaching']
-                ratings_3 = [qr.rating for qr in question_results if qr.category == 'Classroom Management and Control']
-                ratings_4 = [qr.rating for qr in question_results if qr.category == 'Lesson Plans']
-                average_rating_1 = round(sum(ratings_1) / len(ratings_1), 2) if ratings_1 else 0
-                average_rating_2 = round(sum(ratings_2) / len(ratings_2), 2) if ratings_2 else 0
-                average_rating_3 = round(sum(ratings_3) / len(ratings_3), 2) if ratings_3 else 0
-                average_rating_4 = round(sum(ratings_4) / len(ratings_4), 2) if ratings_4 else 0
-                average_rating = round((average_rating_1 + average_rating_2 + average_rating_3 + average_rating_4) / 4, 2)
-
-
+            for evaluation in evaluation_results:
+                self.user_loader.prime([evaluation.teacher_id, evaluation.admin_id])
 
+            for evaluation in evaluation_results:
+                user = self.user_loader.load(evaluation.teacher_id)
+                user_student = self.user_loader.load(evaluation.admin_id)
+
+                # average_1..4 follow the display order of the categories
+                category_averages = [
+                    round(averages.get((evaluation.id, category.id)) or 0, 2)
+                    for category in categories
+                ]
+                category_averages += [0] * (
+                    REPORT_CATEGORY_COUNT - len(category_averages)
+                )
+                average_rating = round(scores.get(evaluation.id, 0), 2)
 
                 evaluation_dict = {
                     key: value
@@ -194,20 +391,18 @@ class EvaluationResultUseCase:
                     if not key.startswith("_")
                 }
 
-                full_name = f"{user.first_name} {user.middle_name} {user.last_name}"
-                full_name_student = (
-                    f"{user_student.first_name} "
-                    f"{user_student.middle_name} "
-                    f"{user_student.last_name}"
-                )
+                full_name = user.full_name
+                full_name_student = user_student.full_name
                 evaluation_dict.update(
                     {
                         "teacher_name": full_name,
                         "student_name": full_name_student,
-                        "average_1": average_rating_1,
-                        "average_2": average_rating_2,
-                        "average_3": average_rating_3,
-                        "average_4": average_rating_4,
+                        **{
+                            f"average_{position}": category_average
+                            for position, category_average in enumerate(
+                                category_averages, start=1
+                            )
+                        },
                         "average": average_rating,
                         "comment": evaluation.comment
                     }
@@ -224,6 +419,296 @@ class EvaluationResultUseCase:
         return paginate(response)
 
 
+    def get_pending_evaluation_results(
+        self, evaluation_id: int
+    ) -> Union[Page[schemas.EvaluationsResultOut], JSONResponse]:
+        """Get the evaluation results of an evaluation not submitted yet."""
+        try:
+            rows = self.evaluation_result_repository.get_pending_rows(
+                self.db,
+                schemas.EvaluationsResultOut.model_fields,
+                evaluation_id=evaluation_id,
+            )
+
+        except DatabaseException as e:
+            logger.error(
+                "Database error occurred while fetching pending evaluation results: "
+                f"{e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return paginate(rows)
+
+    def assign_evaluation(
+        self, *, evaluation_id: int, admin_id: int
+    ) -> Union[schemas.EvaluationAssignmentOut, JSONResponse]:
+        """Create pending evaluation results for every student of admin_id."""
+        try:
+            self.evaluation_repository.get(self.db, evaluation_id)
+
+            assigned = self.evaluation_result_repository.assign_students(
+                self.db, evaluation_id=evaluation_id, admin_id=admin_id
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(
+                f"Database error occurred while assigning evaluation: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return schemas.EvaluationAssignmentOut(
+            evaluation_id=evaluation_id, admin_id=admin_id, assigned=assigned
+        )
+
+    def get_participation(
+        self,
+    ) -> Union[schemas.ParticipationReportOut, JSONResponse]:
+        """Get submitted vs pending counts per evaluation and per teacher."""
+        try:
+            rows = self.evaluation_result_repository.get_participation_rows(self.db)
+
+        except DatabaseException as e:
+            logger.error(
+                f"Database error occurred while fetching participation: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        evaluations = []
+        teachers = {}
+        for row in rows:
+            evaluations.append(
+                schemas.EvaluationParticipationOut(
+                    evaluation_id=row.evaluation_id,
+                    title=row.title,
+                    teacher_id=row.teacher_id,
+                    teacher_name=row.teacher_name,
+                    total=row.total,
+                    submitted=row.submitted,
+                    pending=row.total - row.submitted,
+                    completion=_completion(row.total, row.submitted),
+                )
+            )
+
+            # Roll the evaluations up per teacher, rows are few after GROUP BY
+            teacher = teachers.setdefault(
+                row.teacher_id,
+                {"teacher_name": row.teacher_name, "total": 0, "submitted": 0},
+            )
+            teacher["total"] += row.total
+            teacher["submitted"] += row.submitted
+
+        return schemas.ParticipationReportOut(
+            evaluations=evaluations,
+            teachers=[
+                schemas.TeacherParticipationOut(
+                    teacher_id=teacher_id,
+                    teacher_name=teacher["teacher_name"],
+                    total=teacher["total"],
+                    submitted=teacher["submitted"],
+                    pending=teacher["total"] - teacher["submitted"],
+                    completion=_completion(teacher["total"], teacher["submitted"]),
+                )
+                for teacher_id, teacher in teachers.items()
+            ],
+        )
+
+    def get_teacher_report(
+        self, teacher_id: int
+    ) -> Union[schemas.TeacherReportOut, JSONResponse]:
+        """Get rating statistics of a teacher per category and per question."""
+        try:
+            teacher = self.user_repository.get(self.db, teacher_id)
+            categories = self.category_repository.get_all_ordered(self.db)
+            rows = self.question_result_repository.get_rating_histogram_rows(
+                self.db, EvaluationResult.teacher_id == teacher_id
+            )
+            scores = get_weighted_scores(
+                self.db,
+                EvaluationResult.teacher_id == teacher_id,
+                EvaluationResult.is_submitted.is_(True),
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(
+                f"Database error occurred while fetching teacher report: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        # Rows come ordered by question, with one row per rating
+        questions = {}
+        for row in rows:
+            question = questions.setdefault(
+                (row.question_id, row.question_text),
+                {"category_id": row.category_id, "histogram": {}},
+            )
+            question["histogram"][row.rating] = row.count
+
+        histograms_by_category = defaultdict(list)
+        for question in questions.values():
+            histograms_by_category[question["category_id"]].append(
+                question["histogram"]
+            )
+
+        category_names = {category.id: category.name for category in categories}
+        category_ids = [
+            category.id
+            for category in categories
+            if category.id in histograms_by_category
+        ]
+        if None in histograms_by_category:
+            category_ids.append(None)
+
+        return schemas.TeacherReportOut(
+            teacher_id=teacher_id,
+            teacher_name=teacher.full_name,
+            results=len(scores),
+            score=round(sum(scores.values()) / len(scores), 2) if scores else 0,
+            overall=asdict(
+                statistics.describe(
+                    statistics.merge(
+                        question["histogram"] for question in questions.values()
+                    )
+                )
+            ),
+            categories=[
+                schemas.CategoryStatisticsOut(
+                    category_id=category_id,
+                    category=category_names.get(category_id),
+                    **asdict(
+                        statistics.describe(
+                            statistics.merge(histograms_by_category[category_id])
+                        )
+                    ),
+                )
+                for category_id in category_ids
+            ],
+            questions=[
+                schemas.QuestionStatisticsOut(
+                    question_id=question_id,
+                    question_text=question_text,
+                    category_id=question["category_id"],
+                    **asdict(statistics.describe(question["histogram"])),
+                )
+                for (question_id, question_text), question in questions.items()
+            ],
+        )
+
+    def get_teacher_rankings(
+        self, admin_id: int | None = None, category_id: int | None = None
+    ) -> Union[Page[schemas.TeacherRankOut], JSONResponse]:
+        """Get teachers ranked by average, with percentiles, paginated in SQL."""
+        try:
+            return self.evaluation_result_repository.paginate_ranking_rows(
+                self.db, admin_id=admin_id, category_id=category_id
+            )
+
+        except DatabaseException as e:
+            logger.error(
+                f"Database error occurred while fetching teacher rankings: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+    def search_comments(
+        self,
+        text: str,
+        evaluation_id: int | None = None,
+        teacher_id: int | None = None,
+    ) -> Union[Page[schemas.CommentSearchOut], JSONResponse]:
+        """Search the comments of results and answers, paginated in SQL."""
+        criterion = []
+        if evaluation_id is not None:
+            criterion.append(EvaluationResult.evaluation_id == evaluation_id)
+        if teacher_id is not None:
+            criterion.append(EvaluationResult.teacher_id == teacher_id)
+
+        try:
+            return search_comments(self.db, text, *criterion)
+
+        except DatabaseException as e:
+            logger.error(
+                f"Database error occurred while searching comments: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+    def get_themes(
+        self,
+        teacher_id: int | None = None,
+        evaluation_id: int | None = None,
+        limit: int = 10,
+    ) -> Union[List[schemas.ThemeOut], JSONResponse]:
+        """Get the most frequent terms of the comments, from the term index."""
+        criterion = []
+        if teacher_id is not None:
+            criterion.append(CommentTerm.teacher_id == teacher_id)
+        if evaluation_id is not None:
+            criterion.append(CommentTerm.evaluation_id == evaluation_id)
+
+        try:
+            rows = self.comment_term_repository.get_top_term_rows(
+                self.db, *criterion, limit=limit
+            )
+
+        except DatabaseException as e:
+            logger.error(f"Database error occurred while fetching themes: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return [schemas.ThemeOut.model_validate(row) for row in rows]
+
+    def get_teacher_trend(
+        self,
+        teacher_id: int,
+        bucket: schemas.TrendBucketEnum = schemas.TrendBucketEnum.week,
+        category_id: int | None = None,
+    ) -> Union[schemas.TeacherTrendOut, JSONResponse]:
+        """Get the average rating of a teacher per category over time.
+
+        Reads the weekly rollups only, weeks, months and terms are summed from
+        them, weeks being split at month boundaries.
+        """
+        try:
+            categories = self.category_repository.get_all_ordered(self.db)
+            rollups = self.teacher_score_rollup_repository.get_all_by_teacher_id(
+                self.db, teacher_id=teacher_id, category_id=category_id
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(
+                f"Database error occurred while fetching teacher trend: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        # Rollups come ordered by week, so points are too
+        points = defaultdict(dict)
+        for rollup in rollups:
+            point = points[rollup.category_id].setdefault(
+                _bucket_start(rollup.bucket_start, bucket), [0, 0]
+            )
+            point[0] += rollup.rating_sum
+            point[1] += rollup.rating_count
+
+        return schemas.TeacherTrendOut(
+            teacher_id=teacher_id,
+            bucket=bucket,
+            categories=[
+                schemas.CategoryTrendOut(
+                    category_id=category.id,
+                    category=category.name,
+                    points=[
+                        schemas.TrendPointOut(
+                            bucket_start=bucket_start,
+                            average=round(rating_sum / rating_count, 2),
+                            count=rating_count,
+                        )
+                        for bucket_start, (rating_sum, rating_count) in points[
+                            category.id
+                        ].items()
+                    ],
+                )
+                for category in categories
+                if category.id in points
+            ],
+        )
+
     def get_evaluation_result(
         self, _id: int
     ) -> Union[schemas.EvaluationResultOut, JSONResponse]:
@@ -243,23 +728,33 @@ class EvaluationResultUseCase:
         self,
         *,
         obj_in: schemas.EvaluationResultIn,
+        upsert: bool = False,
     ) -> Union[schemas.EvaluationDetailedResultOut, JSONResponse]:
-        """Create evaluation result record."""
+        """Create evaluation result record.
+
+        With `upsert`, the existing result of the student for the evaluation is
+        updated instead.
+        """
         try:
-            evaluation_result = self.evaluation_result_repository.create(
-                db=self.db, obj_in=obj_in
-            )
+            if upsert:
+                evaluation_result = self.evaluation_result_repository.upsert(
+                    self.db, obj_in=obj_in
+                )
+            else:
+                evaluation_result = self.evaluation_result_repository.create(
+                    db=self.db, obj_in=obj_in
+                )
             user = self.user_repository.get(self.db, evaluation_result.teacher_id)
             evaluation_result_dict = (
                 evaluation_result.__dict__.copy()
             )  # Create a copy of the dictionary
             evaluation_result_dict.pop("_sa_instance_state", None)
-            full_name = f"{user.first_name} {user.middle_name} {user.last_name}"
+            full_name = user.full_name
             evaluation_result_dict.update({"teacher_name": full_name})
 
             return schemas.EvaluationDetailedResultOut(**evaluation_result_dict)
 
-        except DatabaseException as e:
+        except (DatabaseException, APIException) as e:
             logger.error(
                 f"Database error occurred while creating evaluation result: {e.detail}"
             )
@@ -284,7 +779,7 @@ class EvaluationResultUseCase:
                 update_evaluation.__dict__.copy()
             )  # Create a copy of the dictionary
             evaluation_dict.pop("_sa_instance_state", None)
-            full_name = f"{user.first_name} {user.middle_name} {user.last_name}"
+            full_name = user.full_name
             evaluation_dict.update({"teacher_name": full_name})
 
             return schemas.EvaluationDetailedResultOut(**evaluation_dict)
@@ -311,3 +806,120 @@ class EvaluationResultUseCase:
                 f"Database error occurred while deleting evaluation result: {e.detail}"
             )
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+    def export_evaluation_results(
+        self, *, evaluation_id: int, export_format: schemas.ExportFormatEnum
+    ) -> StreamingResponse:
+        """Stream all results of an evaluation as CSV or NDJSON."""
+        if export_format == schemas.ExportFormatEnum.csv:
+            encode, media_type = _iter_csv, "text/csv"
+        else:
+            encode, media_type = _iter_ndjson, "application/x-ndjson"
+
+        def stream() -> Iterator[str]:
+            # The request scoped session is closed before the body is sent, so
+            # the generator runs the query itself and releases the connection.
+            try:
+                rows = self.evaluation_result_repository.stream_export_rows(
+                    self.db, evaluation_id=evaluation_id
+                )
+                yield from encode(rows)
+
+            except Exception as e:
+                logger.error(
+                    f"Database error occurred while exporting evaluation results: {e}"
+                )
+                raise
+
+            finally:
+                self.db.close()
+
+        filename = f"evaluation-{evaluation_id}-results.{export_format.value}"
+        return StreamingResponse(
+            stream(),
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
+    def load_dashboard(self, evaluation_id: int) -> LiveDashboard:
+        """Read the counts and category rating sums of an evaluation.
+
+        The session is closed afterwards, streams hold no connection.
+        """
+        try:
+            counts = self.evaluation_result_repository.get_counts_row(
+                self.db, evaluation_id=evaluation_id
+            )
+            rows = self.question_result_repository.get_category_rating_rows(
+                self.db, EvaluationResult.evaluation_id == evaluation_id
+            )
+
+        finally:
+            self.db.close()
+
+        return LiveDashboard(
+            evaluation_id,
+            total=counts.total,
+            submitted=counts.submitted,
+            ratings={
+                row.category_id: [row.rating_sum, row.rating_count] for row in rows
+            },
+        )
+
+    def stream_dashboard(self, *, evaluation_id: int) -> StreamingResponse:
+        """Stream the live counts and category averages of an evaluation.
+
+        Server-sent events: a `snapshot`, then the `counts`, `categories` and
+        `submission` changed by every committed write, computed from deltas.
+        A new `snapshot` every DASHBOARD_RESYNC_SECONDS corrects the writes
+        counted twice when published as their snapshot loaded.
+        """
+
+        async def stream() -> AsyncIterator[str]:
+            # Subscribed before the snapshot loads and subscribers checked on
+            # commit, so every write the snapshot misses is received
+            with broadcaster.subscribe(
+                dashboard_channel(evaluation_id)
+            ) as subscription:
+                event = Event(RESYNC_EVENT)
+                while True:
+                    if event is None:
+                        yield ": keepalive\n\n"
+                    elif event.name == RESYNC_EVENT:
+                        # Writes published while the snapshot loads may be in it
+                        # or not, so it loads again while some are, a few times
+                        for _ in range(settings.DASHBOARD_SNAPSHOT_ATTEMPTS):
+                            subscription.clear()
+                            try:
+                                dashboard = await run_in_threadpool(
+                                    self.load_dashboard, evaluation_id
+                                )
+                            except DatabaseException as e:
+                                logger.error(
+                                    "Database error occurred while loading "
+                                    f"dashboard: {e.detail}"
+                                )
+                                raise
+                            if subscription.empty():
+                                break
+                        yield _sse("snapshot", dashboard.snapshot())
+                        resync_at = time.monotonic() + settings.DASHBOARD_RESYNC_SECONDS
+                    else:
+                        for name, payload in dashboard.apply(event):
+                            yield _sse(name, payload)
+
+                    event = await subscription.get(
+                        timeout=min(
+                            settings.DASHBOARD_KEEPALIVE_SECONDS,
+                            max(resync_at - time.monotonic(), 0),
+                        )
+                    )
+                    if time.monotonic() >= resync_at:
+                        # The new snapshot includes the received write
+                        event = Event(RESYNC_EVENT)
+
+        return StreamingResponse(
+            stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
@@ -1,7 +1,7 @@
 """Question Use Case."""
 
 import logging
-from typing import Union
+from typing import List, Optional, Union
 
 from fastapi_pagination import paginate, Page
 from sqlalchemy.orm import Session
@@ -23,10 +23,35 @@ class QuestionUseCase:
         self.db = db
         self.question_repository = QuestionRepository(Question)
 
-    def get_questions(self) -> Union[Page[schemas.QuestionOut], JSONResponse]:
-        """Get all questions record."""
+    def get_questions(
+        self, ids: Optional[List[int]] = None
+    ) -> Union[Page[schemas.QuestionOut], JSONResponse]:
+        """Get all questions record, or only the questions of the given ids."""
         try:
-            questions = self.question_repository.get_all(self.db)
+            questions = (
+                self.question_repository.get_many(self.db, ids)
+                if ids is not None
+                else self.question_repository.get_all_rows(
+                    self.db, schemas.QuestionOut.model_fields
+                )
+            )
+
+        except DatabaseException as e:
+            logger.error(
+                f"Database error occurred while fetching questions: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return paginate(questions)
+
+    def get_questions_by_evaluation_id(
+        self, evaluation_id: int
+    ) -> Union[Page[schemas.QuestionOut], JSONResponse]:
+        """Get all questions record of an evaluation."""
+        try:
+            questions = self.question_repository.get_all_by_evaluation_id(
+                self.db, evaluation_id=evaluation_id
+            )
 
         except DatabaseException as e:
             logger.error(
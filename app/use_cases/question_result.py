@@ -28,8 +28,9 @@ class QuestionResultUseCase:
     ) -> Union[Page[schemas.QuestionResultOut], JSONResponse]:
         """Get all question results record."""
         try:
-            question_results = self.question_result_repository.get_all(self.db)
-            
+            question_results = self.question_result_repository.get_all_rows(
+                self.db, schemas.QuestionResultOut.model_fields
+            )
 
         except DatabaseException as e:
             logger.error(
@@ -44,7 +45,9 @@ class QuestionResultUseCase:
     ) -> Union[schemas.QuestionResultOut, JSONResponse]:
         """Get question result record."""
         try:
-            question_result = self.question_result_repository.get(self.db, _id)
+            question_result = self.question_result_repository.get_row(
+                self.db, schemas.QuestionResultOut.model_fields, _id=_id
+            )
 
             return schemas.QuestionResultOut.model_validate(question_result)
 
@@ -64,9 +67,12 @@ class QuestionResultUseCase:
             question_result = self.question_result_repository.create(
                 db=self.db, obj_in=obj_in
             )
-            return schemas.QuestionResultOut.model_validate(question_result)
+            question_result_row = self.question_result_repository.get_row(
+                self.db, schemas.QuestionResultOut.model_fields, _id=question_result.id
+            )
+            return schemas.QuestionResultOut.model_validate(question_result_row)
 
-        except DatabaseException as e:
+        except (DatabaseException, APIException) as e:
             logger.error(
                 f"Database error occurred while creating question result: {e.detail}"
             )
@@ -82,9 +88,12 @@ class QuestionResultUseCase:
         try:
             question_result = self.question_result_repository.get(db=self.db, _id=_id)
 
-            update_question_result = self.question_result_repository.update(
+            self.question_result_repository.update(
                 db=self.db, obj_in=obj_in, db_obj=question_result
             )
+            update_question_result = self.question_result_repository.get_row(
+                self.db, schemas.QuestionResultOut.model_fields, _id=_id
+            )
             return schemas.QuestionResultOut.model_validate(update_question_result)
 
         except (DatabaseException, APIException) as e:
@@ -98,9 +107,11 @@ class QuestionResultUseCase:
     ) -> Union[schemas.QuestionResultOut, JSONResponse]:
         """Delete question result record."""
         try:
-            question_result_delete = self.question_result_repository.delete(
-                db=self.db, _id=_id
+            # Read the joined copies before the record is gone
+            question_result_delete = self.question_result_repository.get_row(
+                self.db, schemas.QuestionResultOut.model_fields, _id=_id
             )
+            self.question_result_repository.delete(db=self.db, _id=_id)
 
             return schemas.QuestionResultOut.model_validate(question_result_delete)
 
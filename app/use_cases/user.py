@@ -1,7 +1,7 @@
 """User Use Case."""
 
 import logging
-from typing import Union
+from typing import List, Optional, Union
 
 from fastapi_pagination import paginate, Page
 from sqlalchemy.orm import Session
@@ -24,10 +24,18 @@ class UserUseCase:
         self.db = db
         self.user_repository = UserRepository(User)
 
-    def get_users(self) -> Union[Page[schemas.UserOut], JSONResponse]:
-        """Get all users record."""
+    def get_users(
+        self, ids: Optional[List[int]] = None
+    ) -> Union[Page[schemas.UserOut], JSONResponse]:
+        """Get all users record, or only the users of the given ids."""
         try:
-            users = self.user_repository.get_all(self.db)
+            users = (
+                self.user_repository.get_many(self.db, ids)
+                if ids is not None
+                else self.user_repository.get_all_rows(
+                    self.db, schemas.UserOut.model_fields
+                )
+            )
 
         except DatabaseException as e:
             logger.error(f"Database error occurred while fetching users: {e.detail}")
@@ -1,13 +1,18 @@
 """Conftest."""
 
 from datetime import datetime
+from itertools import count
+from typing import Any, Optional
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
 from app import schemas
-from app.models import User, Evaluation
+from app.db.base_class import Base
+from app.db.session import enable_raise_on_lazy_load
+from app.models import User, Evaluation, EvaluationResult
 from app.schemas.user import UserRoleEnum
 
 
@@ -17,6 +22,81 @@ def mock_session():
     return MagicMock(spec=Session)
 
 
+@pytest.fixture()
+def strict_session():
+    """Fixture that returns an in-memory session which raises on lazy loads."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    enable_raise_on_lazy_load(session)
+
+    yield session
+
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture()
+def make_evaluation(strict_session):
+    """Fixture that returns a factory of evaluations flushed in strict_session.
+
+    A new teacher is added for the evaluation unless `teacher_id` is given.
+    """
+    numbers = count(1)
+
+    def make(teacher_id: Optional[int] = None, **fields: Any) -> Evaluation:
+        number = next(numbers)
+        if teacher_id is None:
+            teacher = User(
+                username=f"teacher {number}",
+                email=f"t{number}@yahoo.com",
+                role="teacher",
+            )
+            strict_session.add(teacher)
+            strict_session.flush()
+            teacher_id = teacher.id
+
+        evaluation = Evaluation(
+            title=f"evaluation {number}", teacher_id=teacher_id, **fields
+        )
+        strict_session.add(evaluation)
+        strict_session.flush()
+
+        return evaluation
+
+    return make
+
+
+@pytest.fixture()
+def make_evaluation_result(strict_session, make_evaluation):
+    """Fixture that returns a factory of results flushed in strict_session.
+
+    Results are of a new evaluation unless `evaluation_id` is given, for the
+    teacher of their evaluation and with admin_id 1 by default.
+    """
+
+    def make(evaluation_id: Optional[int] = None, **fields: Any) -> EvaluationResult:
+        if evaluation_id is None:
+            evaluation = make_evaluation()
+        else:
+            evaluation = strict_session.get(Evaluation, evaluation_id)
+
+        result = EvaluationResult(
+            **{
+                "evaluation_id": evaluation.id,
+                "teacher_id": evaluation.teacher_id,
+                "admin_id": 1,
+                **fields,
+            }
+        )
+        strict_session.add(result)
+        strict_session.flush()
+
+        return result
+
+    return make
+
+
 ################################################ Auth
 
 
@@ -386,3 +466,111 @@ def announcements_out():
         "size": 10,
         "pages": None,
     }
+
+
+################################################ Evaluation Result
+
+
+@pytest.fixture()
+def evaluation_result_export_rows():
+    """Fixture that returns evaluation result export rows."""
+    return [
+        {"evaluation_result_id": 1, "student_name": "John Doe Doe", "rating": 5},
+        {"evaluation_result_id": 1, "student_name": "John Doe Doe", "rating": 4},
+    ]
+
+
+################################################ Question
+
+
+@pytest.fixture()
+def questions_out():
+    """Fixture that returns a paginated list of questions in dictionary."""
+    return {
+        "items": [
+            {
+                "id": 1,
+                "question_text": "question 1",
+                "rating": None,
+                "comment": None,
+                "category": "Classroom Teaching",
+                "category_id": 2,
+                "student_id": None,
+                "evaluation_id": 1,
+                "student_name": None,
+                "evaluation_title": "evaluation 1",
+                "created_at": "2024-12-10T09:17:55.330000",
+                "updated_at": "2024-12-10T09:17:55.330000",
+            },
+        ],
+        "total": 1,
+        "page": 1,
+        "size": 50,
+        "pages": 1,
+    }
+
+
+@pytest.fixture()
+def evaluation_form_out():
+    """Fixture that returns an evaluation form in dictionary."""
+    return {
+        "evaluation": {
+            "id": 1,
+            "title": "evaluation 1",
+            "teacher_id": 1,
+            "teacher_name": "John Doe Doe",
+            "admin_id": 1,
+            "is_submitted": False,
+            "is_disabled": False,
+            "category": None,
+            "comment": None,
+            "created_at": "2024-12-10T09:17:55.330000",
+            "updated_at": "2024-12-10T09:17:55.330000",
+        },
+        "questions": [
+            {
+                "id": 1,
+                "question_text": "question 1",
+                "rating": None,
+                "comment": None,
+                "category": "Classroom Teaching",
+                "category_id": 2,
+                "student_id": None,
+                "evaluation_id": 1,
+                "student_name": None,
+                "evaluation_title": "evaluation 1",
+                "created_at": "2024-12-10T09:17:55.330000",
+                "updated_at": "2024-12-10T09:17:55.330000",
+            },
+        ],
+        "evaluation_results": [
+            {
+                "id": 1,
+                "title": "evaluation 1",
+                "teacher_id": 1,
+                "evaluation_id": 1,
+                "admin_id": 2,
+                "is_submitted": True,
+                "created_at": "2024-12-10T09:17:55.330000",
+                "updated_at": "2024-12-10T09:17:55.330000",
+                "comment": None,
+            },
+        ],
+        "question_results": [
+            {
+                "id": 1,
+                "question_id": 1,
+                "question_text": "question 1",
+                "rating": 5,
+                "comment": None,
+                "student_id": None,
+                "evaluation_result_id": 1,
+                "student_name": None,
+                "evaluation_title": "evaluation 1",
+                "category": "Classroom Teaching",
+                "category_id": 2,
+                "created_at": "2024-12-10T09:17:55.330000",
+                "updated_at": "2024-12-10T09:17:55.330000",
+            },
+        ],
+    }
@@ -3,6 +3,9 @@
 from http import HTTPStatus
 from unittest.mock import patch
 
+from fastapi_pagination import Page
+
+from app import schemas
 from app.core.config import settings
 from tests.controllers.api.v1.endpoints import test_client
 
@@ -110,3 +113,209 @@ def test_update_evaluation(
 
     assert response.json() == evaluation_detailed_out
     assert response.status_code == HTTPStatus.OK
+
+
+@patch("app.controllers.api.v1.endpoints.evaluation.EvaluationUseCase", spec=True)
+def test_get_evaluation_not_modified(m_evaluation_uc):
+    """Test get evaluation answers 304 when the ETag matches."""
+    m_evaluation_uc_instance = m_evaluation_uc.return_value
+    m_evaluation_uc_instance.get_evaluation_etag.return_value = 'W/"etag"'
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation/1",
+        headers={"Authorization": "Bearer TEST_TOKEN", "If-None-Match": 'W/"etag"'},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == 'W/"etag"'
+    m_evaluation_uc_instance.get_evaluation.assert_not_called()
+
+
+@patch("app.controllers.api.v1.endpoints.evaluation.EvaluationUseCase", spec=True)
+def test_get_evaluations_etag(m_evaluation_uc, evaluations_out):
+    """Test get all evaluations returns the ETag when it does not match."""
+    m_evaluation_uc_instance = m_evaluation_uc.return_value
+    m_evaluation_uc_instance.get_evaluations_etag.return_value = 'W/"etag"'
+    m_evaluation_uc_instance.get_evaluations.return_value = evaluations_out
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation",
+        headers={"Authorization": "Bearer TEST_TOKEN", "If-None-Match": 'W/"old"'},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["ETag"] == 'W/"etag"'
+    m_evaluation_uc_instance.get_evaluations.assert_called_once()
+
+
+@patch("app.core.serialization.settings.FAST_JSON_RESPONSES", True)
+@patch("app.controllers.api.v1.endpoints.evaluation.EvaluationUseCase", spec=True)
+def test_get_evaluations_etag_fast_json(m_evaluation_uc, evaluations_out):
+    """Test the fast JSON serialization path keeps the ETag of a page."""
+    evaluations = Page[schemas.EvaluationsOut].model_validate(evaluations_out)
+    m_evaluation_uc_instance = m_evaluation_uc.return_value
+    m_evaluation_uc_instance.get_evaluations_etag.return_value = 'W/"etag"'
+    m_evaluation_uc_instance.get_evaluations.return_value = evaluations
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation",
+        headers={"Authorization": "Bearer TEST_TOKEN", "If-None-Match": 'W/"old"'},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["ETag"] == 'W/"etag"'
+    assert response.json() == evaluations.model_dump(mode="json")
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation",
+        headers={"Authorization": "Bearer TEST_TOKEN", "If-None-Match": 'W/"etag"'},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    m_evaluation_uc_instance.get_evaluations.assert_called_once()
+
+
+@patch("app.core.serialization.settings.FAST_JSON_RESPONSES", True)
+@patch("app.controllers.api.v1.endpoints.evaluation.EvaluationUseCase", spec=True)
+def test_create_evaluation_fast_json(
+    m_evaluation_uc,
+    evaluation_db_in,
+    evaluation_detailed_db_out,
+):
+    """Test create evaluation through the fast JSON serialization path."""
+    m_evaluation_uc_instance = m_evaluation_uc.return_value
+    m_evaluation_uc_instance.create_evaluation.return_value = evaluation_detailed_db_out
+
+    response = test_client.post(
+        f"{settings.API_PREFIX}/evaluation",
+        json=evaluation_db_in.model_dump(mode="json"),
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    assert response.json() == evaluation_detailed_db_out.model_dump(mode="json")
+    assert response.status_code == HTTPStatus.OK
+
+
+@patch("app.controllers.api.v1.endpoints.evaluation.EvaluationUseCase", spec=True)
+def test_get_form(m_evaluation_uc, evaluation_form_out):
+    """Test get evaluation form of a student."""
+    m_evaluation_uc_instance = m_evaluation_uc.return_value
+    m_evaluation_uc_instance.get_evaluation_form.return_value = evaluation_form_out
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation/1/form",
+        params={"admin_id": 2},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_uc_instance.get_evaluation_form.assert_called_once_with(
+        _id=1, admin_id=2
+    )
+    assert response.json() == evaluation_form_out
+    assert response.status_code == HTTPStatus.OK
+
+
+@patch("app.controllers.api.v1.endpoints.evaluation.EvaluationUseCase", spec=True)
+def test_clone_evaluation(m_evaluation_uc, evaluation_form_out):
+    """Test clone evaluation to teachers."""
+    evaluation_out = {
+        key: value
+        for key, value in evaluation_form_out["evaluation"].items()
+        if key != "teacher_name"
+    }
+    m_evaluation_uc_instance = m_evaluation_uc.return_value
+    m_evaluation_uc_instance.clone_evaluation.return_value = [evaluation_out]
+
+    response = test_client.post(
+        f"{settings.API_PREFIX}/evaluation/1/clone",
+        json={"teacher_ids": [1]},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    assert response.json() == [evaluation_out]
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_clone_evaluation_without_teachers():
+    """Test clone evaluation requires at least one teacher."""
+    response = test_client.post(
+        f"{settings.API_PREFIX}/evaluation/1/clone",
+        json={"teacher_ids": []},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@patch("app.controllers.api.v1.endpoints.evaluation.EvaluationUseCase", spec=True)
+def test_get_pending(m_evaluation_uc, evaluations_out):
+    """Test get pending evaluations is not shadowed by the detail route."""
+    m_evaluation_uc_instance = m_evaluation_uc.return_value
+    m_evaluation_uc_instance.get_pending_evaluations.return_value = evaluations_out
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation/pending",
+        params={"admin_id": 7},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_uc_instance.get_pending_evaluations.assert_called_once_with(admin_id=7)
+    m_evaluation_uc_instance.get_evaluation.assert_not_called()
+    assert response.status_code == HTTPStatus.OK
+
+
+@patch("app.controllers.api.v1.endpoints.evaluation.EvaluationUseCase", spec=True)
+def test_update_weights(m_evaluation_uc):
+    """Test replace the category weights of an evaluation."""
+    weights_out = [{"id": 1, "evaluation_id": 1, "category_id": 2, "weight": 2.5}]
+    m_evaluation_uc_instance = m_evaluation_uc.return_value
+    m_evaluation_uc_instance.update_category_weights.return_value = weights_out
+
+    response = test_client.put(
+        f"{settings.API_PREFIX}/evaluation/1/weights",
+        json=[{"category_id": 2, "weight": 2.5}],
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_uc_instance.update_category_weights.assert_called_once_with(
+        _id=1, obj_in=[schemas.EvaluationCategoryWeightIn(category_id=2, weight=2.5)]
+    )
+    assert response.json() == [
+        {**weights_out[0], "created_at": None, "updated_at": None}
+    ]
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_update_weights_negative():
+    """Test category weights can not be negative."""
+    response = test_client.put(
+        f"{settings.API_PREFIX}/evaluation/1/weights",
+        json=[{"category_id": 2, "weight": -1}],
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@patch("app.controllers.api.v1.endpoints.evaluation.EvaluationUseCase", spec=True)
+def test_get_histogram(m_evaluation_uc):
+    """Test get the rating histogram of an evaluation."""
+    histogram_out = {
+        "evaluation_id": 1,
+        "ratings": [1, 2, 3, 4, 5],
+        "question_ids": [1],
+        "question_texts": ["question 1"],
+        "responses": [3],
+        "counts": [[0, 0, 1, 0, 2]],
+    }
+    m_evaluation_uc_instance = m_evaluation_uc.return_value
+    m_evaluation_uc_instance.get_rating_histogram.return_value = histogram_out
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation/1/histogram",
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_uc_instance.get_rating_histogram.assert_called_once_with(_id=1)
+    assert response.json() == histogram_out
+    assert response.status_code == HTTPStatus.OK
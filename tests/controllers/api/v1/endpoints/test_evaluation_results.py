@@ -0,0 +1,437 @@
+"""Evaluation result endpoint unit tests."""
+
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from starlette.responses import StreamingResponse
+
+from app import schemas
+from app.core.config import settings
+from app.core.idempotency import IdempotencyStore, idempotency_store
+from app.db.base_class import Base
+from app.db.session import get_db
+from app.main import app
+from app.models import Evaluation, EvaluationResult, User
+from tests.controllers.api.v1.endpoints import test_client
+
+
+@patch(
+    "app.controllers.api.v1.endpoints.evaluation_results.EvaluationResultUseCase",
+    spec=True,
+)
+def test_assign(m_evaluation_result_uc):
+    """Test assign evaluation to the students of an admin."""
+    assignment_out = {"evaluation_id": 1, "admin_id": 2, "assigned": 3}
+    m_evaluation_result_uc_instance = m_evaluation_result_uc.return_value
+    m_evaluation_result_uc_instance.assign_evaluation.return_value = assignment_out
+
+    response = test_client.post(
+        f"{settings.API_PREFIX}/1/evaluation-result/assign",
+        params={"admin_id": 2},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_result_uc_instance.assign_evaluation.assert_called_once_with(
+        evaluation_id=1, admin_id=2
+    )
+    assert response.json() == assignment_out
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.fixture()
+def assigned_session():
+    """Fixture that serves the endpoints from a session with an admin's student."""
+    # One in-memory database shared with the threads serving the requests
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.add_all(
+        [
+            User(id=1, first_name="Ad", last_name="Min", role="admin"),
+            User(id=2, first_name="Tea", last_name="Cher", role="teacher"),
+            User(id=3, first_name="Stu", last_name="Dent", role="student", admin_id=1),
+            Evaluation(id=1, title="evaluation", teacher_id=2),
+        ]
+    )
+    session.commit()
+    app.dependency_overrides[get_db] = lambda: session
+
+    yield session
+
+    app.dependency_overrides.pop(get_db)
+    session.close()
+    engine.dispose()
+
+
+def test_assign_then_submit(assigned_session):
+    """Test the submission of an assigned student fills in its pending result."""
+    response = test_client.post(
+        f"{settings.API_PREFIX}/1/evaluation-result/assign",
+        params={"admin_id": 1},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    assert response.json()["assigned"] == 1
+
+    response = test_client.post(
+        f"{settings.API_PREFIX}/evaluation-result",
+        json={
+            "evaluation_id": 1,
+            "teacher_id": 2,
+            "admin_id": 3,
+            "is_submitted": True,
+            "comment": "Clear",
+        },
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["is_submitted"] is True
+    assert response.json()["teacher_name"] == "Tea Cher"
+    (result,) = assigned_session.query(EvaluationResult).all()
+    assert (result.admin_id, result.is_submitted, result.comment) == (3, True, "Clear")
+
+
+def test_get_all_by_evaluation_id_names(assigned_session):
+    """Test teacher and student names leave out a missing middle name."""
+    assigned_session.get(User, 3).middle_name = "A."
+    assigned_session.add(
+        EvaluationResult(evaluation_id=1, teacher_id=2, admin_id=3, is_submitted=True)
+    )
+    assigned_session.commit()
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/1/evaluation-result",
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert [
+        (item["teacher_name"], item["student_name"])
+        for item in response.json()["items"]
+    ] == [("Tea Cher", "Stu A. Dent")]
+
+
+@patch(
+    "app.controllers.api.v1.endpoints.evaluation_results.EvaluationResultUseCase",
+    spec=True,
+)
+def test_get_pending_by_evaluation_id(m_evaluation_result_uc):
+    """Test get pending evaluation results of an evaluation."""
+    pending_out = {"items": [], "total": 0, "page": 1, "size": 50, "pages": 0}
+    m_evaluation_result_uc_instance = m_evaluation_result_uc.return_value
+    m_evaluation_result_uc_instance.get_pending_evaluation_results.return_value = (
+        pending_out
+    )
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/1/evaluation-result/pending",
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_result_uc_instance.get_pending_evaluation_results.assert_called_once_with(  # noqa: E501
+        evaluation_id=1
+    )
+    assert response.json() == pending_out
+    assert response.status_code == HTTPStatus.OK
+
+
+@patch(
+    "app.controllers.api.v1.endpoints.evaluation_results.EvaluationResultUseCase",
+    spec=True,
+)
+def test_get_participation(m_evaluation_result_uc):
+    """Test participation is not shadowed by the detail route."""
+    participation_out = {"evaluations": [], "teachers": []}
+    m_evaluation_result_uc_instance = m_evaluation_result_uc.return_value
+    m_evaluation_result_uc_instance.get_participation.return_value = (
+        participation_out
+    )
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation-result/participation",
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_result_uc_instance.get_evaluation_result.assert_not_called()
+    assert response.json() == participation_out
+    assert response.status_code == HTTPStatus.OK
+
+
+@patch(
+    "app.controllers.api.v1.endpoints.evaluation_results.EvaluationResultUseCase",
+    spec=True,
+)
+def test_get_teacher_report(m_evaluation_result_uc):
+    """Test get the rating statistics of a teacher."""
+    statistics_out = {
+        "count": 2,
+        "mean": 4.5,
+        "std": 0.71,
+        "median": 4.5,
+        "ci_low": 3.52,
+        "ci_high": 5.48,
+        "distribution": {"4": 1, "5": 1},
+    }
+    report_out = {
+        "teacher_id": 1,
+        "teacher_name": "John Doe Doe",
+        "results": 1,
+        "score": 4.5,
+        "overall": statistics_out,
+        "categories": [
+            {**statistics_out, "category_id": 2, "category": "Lesson Plans"}
+        ],
+        "questions": [
+            {
+                **statistics_out,
+                "question_id": 3,
+                "question_text": "question 1",
+                "category_id": 2,
+            }
+        ],
+    }
+    m_evaluation_result_uc_instance = m_evaluation_result_uc.return_value
+    m_evaluation_result_uc_instance.get_teacher_report.return_value = report_out
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation-result/teacher/1/report",
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_result_uc_instance.get_teacher_report.assert_called_once_with(
+        teacher_id=1
+    )
+    assert response.json() == report_out
+    assert response.status_code == HTTPStatus.OK
+
+
+@patch(
+    "app.controllers.api.v1.endpoints.evaluation_results.EvaluationResultUseCase",
+    spec=True,
+)
+def test_get_teacher_rankings(m_evaluation_result_uc):
+    """Test get teachers ranked is not shadowed by the detail route."""
+    rankings_out = {
+        "items": [
+            {
+                "teacher_id": 1,
+                "teacher_name": "John Doe Doe",
+                "results": 3,
+                "average": 4.5,
+                "rank": 1,
+                "percentile": 100.0,
+            }
+        ],
+        "total": 1,
+        "page": 1,
+        "size": 50,
+        "pages": 1,
+    }
+    m_evaluation_result_uc_instance = m_evaluation_result_uc.return_value
+    m_evaluation_result_uc_instance.get_teacher_rankings.return_value = rankings_out
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation-result/ranking",
+        params={"admin_id": 7},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_result_uc_instance.get_teacher_rankings.assert_called_once_with(
+        admin_id=7, category_id=None
+    )
+    m_evaluation_result_uc_instance.get_evaluation_result.assert_not_called()
+    assert response.json() == rankings_out
+    assert response.status_code == HTTPStatus.OK
+
+
+@patch(
+    "app.controllers.api.v1.endpoints.evaluation_results.EvaluationResultUseCase",
+    spec=True,
+)
+def test_search_comments(m_evaluation_result_uc):
+    """Test search the comments of an evaluation by keywords."""
+    comments_out = {
+        "items": [
+            {
+                "source": "question_result",
+                "id": 4,
+                "evaluation_result_id": 2,
+                "evaluation_id": 1,
+                "teacher_id": 3,
+                "rank": 0.5,
+                "snippet": "Always <mark>late</mark>",
+            }
+        ],
+        "total": 1,
+        "page": 1,
+        "size": 50,
+        "pages": 1,
+    }
+    m_evaluation_result_uc_instance = m_evaluation_result_uc.return_value
+    m_evaluation_result_uc_instance.search_comments.return_value = comments_out
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation-result/comments/search",
+        params={"q": "late", "evaluation_id": 1},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_result_uc_instance.search_comments.assert_called_once_with(
+        text="late", evaluation_id=1, teacher_id=None
+    )
+    assert response.json() == comments_out
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_search_comments_without_query():
+    """Test search comments requires keywords."""
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation-result/comments/search",
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@patch(
+    "app.controllers.api.v1.endpoints.evaluation_results.EvaluationResultUseCase",
+    spec=True,
+)
+def test_get_themes(m_evaluation_result_uc):
+    """Test get the recurring terms of the comments of a teacher."""
+    themes_out = [{"term": "patient", "count": 3}, {"term": "clear", "count": 1}]
+    m_evaluation_result_uc_instance = m_evaluation_result_uc.return_value
+    m_evaluation_result_uc_instance.get_themes.return_value = themes_out
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation-result/themes",
+        params={"teacher_id": 1, "limit": 2},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_result_uc_instance.get_themes.assert_called_once_with(
+        teacher_id=1, evaluation_id=None, limit=2
+    )
+    assert response.json() == themes_out
+    assert response.status_code == HTTPStatus.OK
+
+
+@patch(
+    "app.controllers.api.v1.endpoints.evaluation_results.EvaluationResultUseCase",
+    spec=True,
+)
+def test_get_teacher_trend(m_evaluation_result_uc):
+    """Test get the average rating of a teacher by month."""
+    trend_out = {
+        "teacher_id": 1,
+        "bucket": "month",
+        "categories": [
+            {
+                "category_id": 2,
+                "category": "Lesson Plans",
+                "points": [{"bucket_start": "2024-09-01", "average": 4.5, "count": 2}],
+            }
+        ],
+    }
+    m_evaluation_result_uc_instance = m_evaluation_result_uc.return_value
+    m_evaluation_result_uc_instance.get_teacher_trend.return_value = trend_out
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation-result/teacher/1/trend",
+        params={"bucket": "month", "category_id": 2},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_result_uc_instance.get_teacher_trend.assert_called_once_with(
+        teacher_id=1, bucket=schemas.TrendBucketEnum.month, category_id=2
+    )
+    assert response.json() == trend_out
+    assert response.status_code == HTTPStatus.OK
+
+
+@patch(
+    "app.controllers.api.v1.endpoints.evaluation_results.EvaluationResultUseCase",
+    spec=True,
+)
+def test_stream_dashboard(m_evaluation_result_uc):
+    """Test stream the live dashboard of an evaluation as server-sent events."""
+    snapshot = 'event: snapshot\ndata: {"evaluation_id": 1}\n\n'
+    m_evaluation_result_uc_instance = m_evaluation_result_uc.return_value
+    m_evaluation_result_uc_instance.stream_dashboard.return_value = StreamingResponse(
+        iter([snapshot]), media_type="text/event-stream"
+    )
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/1/evaluation-result/live",
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_evaluation_result_uc_instance.stream_dashboard.assert_called_once_with(
+        evaluation_id=1
+    )
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == snapshot
+    assert response.status_code == HTTPStatus.OK
+
+
+@patch(
+    "app.controllers.api.v1.endpoints.evaluation_results.EvaluationResultUseCase",
+    spec=True,
+)
+def test_create_idempotency_key_replay(m_evaluation_result_uc):
+    """Test a retried POST is answered without running the use case again."""
+    idempotency_store.clear()
+    evaluation_result_out = {"id": 1, "evaluation_id": 1, "admin_id": 2}
+    m_evaluation_result_uc_instance = m_evaluation_result_uc.return_value
+    m_evaluation_result_uc_instance.create_evaluation_result.return_value = (
+        evaluation_result_out
+    )
+    headers = {"Authorization": "Bearer TEST_TOKEN", "Idempotency-Key": "key-1"}
+
+    response = test_client.post(
+        f"{settings.API_PREFIX}/evaluation-result",
+        json={"evaluation_id": 1, "admin_id": 2},
+        headers=headers,
+    )
+    replay = test_client.post(
+        f"{settings.API_PREFIX}/evaluation-result",
+        json={"evaluation_id": 1, "admin_id": 2},
+        headers=headers,
+    )
+    other_body = test_client.post(
+        f"{settings.API_PREFIX}/evaluation-result",
+        json={"evaluation_id": 1, "admin_id": 3},
+        headers=headers,
+    )
+
+    m_evaluation_result_uc_instance.create_evaluation_result.assert_called_once()
+    assert response.status_code == HTTPStatus.OK
+    assert "Idempotent-Replayed" not in response.headers
+    assert replay.status_code == HTTPStatus.OK
+    assert replay.json() == response.json()
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert other_body.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_idempotency_store_evicts_expired_and_oldest_keys():
+    """Test keys expire after the TTL and above the maximum number of keys."""
+    store = IdempotencyStore(ttl=60, max_keys=2)
+
+    with patch("app.core.idempotency.time.monotonic", return_value=0):
+        store.reserve("a", "fingerprint")
+        store.reserve("b", "fingerprint")
+        _, created = store.reserve("c", "fingerprint")
+        assert created
+        _, created = store.reserve("a", "fingerprint")
+        assert created
+
+    with patch("app.core.idempotency.time.monotonic", return_value=61):
+        _, created = store.reserve("c", "fingerprint")
+        assert created
@@ -0,0 +1,25 @@
+"""Question endpoint unit tests."""
+
+from http import HTTPStatus
+from unittest.mock import patch
+
+from app.core.config import settings
+from tests.controllers.api.v1.endpoints import test_client
+
+
+@patch("app.controllers.api.v1.endpoints.question.QuestionUseCase", spec=True)
+def test_get_questions_by_evaluation_id(m_question_uc, questions_out):
+    """Test get all questions of an evaluation."""
+    m_question_uc_instance = m_question_uc.return_value
+    m_question_uc_instance.get_questions_by_evaluation_id.return_value = questions_out
+
+    response = test_client.get(
+        f"{settings.API_PREFIX}/evaluation/1/questions",
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_question_uc_instance.get_questions_by_evaluation_id.assert_called_once_with(
+        evaluation_id=1
+    )
+    assert response.json() == questions_out
+    assert response.status_code == HTTPStatus.OK
@@ -97,3 +97,29 @@ def test_update_user(m_user_uc, user_db_in, user_db_out, user_out):
 
     assert response.json() == user_out
     assert response.status_code == HTTPStatus.OK
+
+
+@patch("app.controllers.api.v1.endpoints.user.UserUseCase", spec=True)
+def test_get_users_by_ids(m_user_uc, users_out):
+    """Test get users of the given ids."""
+    m_user_uc_instance = m_user_uc.return_value
+    m_user_uc_instance.get_users.return_value = users_out
+
+    test_client.get(
+        f"{settings.API_PREFIX}/user",
+        params={"ids": "1,2"},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    m_user_uc_instance.get_users.assert_called_once_with(ids=[1, 2])
+
+
+def test_get_users_by_invalid_ids():
+    """Test get users with a malformed ids parameter."""
+    response = test_client.get(
+        f"{settings.API_PREFIX}/user",
+        params={"ids": "1,abc"},
+        headers={"Authorization": "Bearer TEST_TOKEN"},
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
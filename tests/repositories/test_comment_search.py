@@ -0,0 +1,107 @@
+"""Comment search unit tests."""
+
+import pytest
+from fastapi_pagination import Page, Params, set_page, set_params
+from sqlalchemy.dialects import postgresql
+
+from app.models import EvaluationResult, QuestionResult
+from app.repositories.comment_search import comment_matches, search_comments
+
+
+@pytest.fixture()
+def teacher_ids(strict_session, make_evaluation_result):
+    """Fixture that returns two teachers with commented results and answers."""
+    teacher_ids = []
+    for comment in ("Explains clearly, great teacher", "Always late"):
+        result = make_evaluation_result(comment=comment)
+        strict_session.add_all(
+            [
+                QuestionResult(
+                    evaluation_result_id=result.id,
+                    comment="The lessons were explained too quickly",
+                ),
+                QuestionResult(evaluation_result_id=result.id, comment=None),
+            ]
+        )
+        teacher_ids.append(result.teacher_id)
+
+    strict_session.commit()
+
+    return teacher_ids
+
+
+def search(session, text, *criterion, size=10):
+    """Search comments with the pagination params of a request."""
+    with set_params(Params(page=1, size=size)), set_page(Page):
+        return search_comments(session, text, *criterion)
+
+
+def test_search_comments(strict_session, teacher_ids):
+    """Test stemmed matches of both tables come best first, highlighted."""
+    page = search(strict_session, "explain", size=2)
+
+    assert page.total == 3
+    assert [(row.source, row.teacher_id, row.snippet) for row in page.items] == [
+        (
+            "evaluation_result",
+            teacher_ids[0],
+            "<mark>Explains</mark> clearly, great teacher",
+        ),
+        (
+            "question_result",
+            teacher_ids[0],
+            "The lessons were <mark>explained</mark> too quickly",
+        ),
+    ]
+    assert page.items[0].rank > page.items[1].rank
+
+
+def test_search_comments_filtered(strict_session, teacher_ids):
+    """Test criterion on the evaluation results filter the matches."""
+    page = search(
+        strict_session, "quickly lessons", EvaluationResult.teacher_id == teacher_ids[1]
+    )
+
+    assert [(row.source, row.teacher_id) for row in page.items] == [
+        ("question_result", teacher_ids[1])
+    ]
+
+
+def test_search_comments_follows_writes(strict_session, teacher_ids):
+    """Test updated and deleted comments are reindexed."""
+    result = (
+        strict_session.query(EvaluationResult).filter_by(comment="Always late").one()
+    )
+    result.comment = "Never late anymore"
+    strict_session.query(QuestionResult).delete()
+    strict_session.commit()
+
+    assert search(strict_session, "always").total == 0
+    assert [row.id for row in search(strict_session, "late anymore").items] == [
+        result.id
+    ]
+    assert search(strict_session, "explained").total == 1
+
+
+def test_search_comments_syntax(strict_session, teacher_ids):
+    """Test search syntax is matched as plain words."""
+    assert search(strict_session, 'late" OR *').total == 0
+    assert search(strict_session, "   ").total == 0
+
+
+def test_postgresql_snippets_for_page_only(mock_session):
+    """Test PostgreSQL highlights the snippets of the given comments only."""
+    mock_session.get_bind.return_value.dialect.name = "postgresql"
+
+    def compile_matches(*args):
+        return str(
+            comment_matches(mock_session, "explain", *args)
+            .select()
+            .compile(dialect=postgresql.dialect())
+        )
+
+    assert "ts_headline(" not in compile_matches()
+    sql = compile_matches({"question_result": [3]})
+    assert sql.count("ts_headline(") == 1
+    assert "question_result.id IN" in sql
+    assert "FROM evaluation_result" not in sql
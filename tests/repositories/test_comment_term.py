@@ -0,0 +1,133 @@
+"""Comment term unit tests."""
+
+import pytest
+
+from app.commands.rebuild_comment_terms import rebuild
+from app.models import CommentTerm, Evaluation, EvaluationResult, QuestionResult
+from app.repositories.comment_term import (
+    CommentTermRepository,
+    maintain_comment_terms,
+)
+from app.repositories.evaluation_result import EvaluationResultRepository
+from app.schemas import EvaluationResultIn
+
+
+def get_terms(session):
+    """Get the (evaluation_id, term, count) of the non zero terms."""
+    return sorted(
+        (term.evaluation_id, term.term, term.count)
+        for term in session.query(CommentTerm)
+        if term.count
+    )
+
+
+@pytest.fixture()
+def evaluation_ids(strict_session, make_evaluation):
+    """Fixture that returns two evaluations of a teacher to comment."""
+    maintain_comment_terms(strict_session)
+
+    evaluation = make_evaluation()
+    evaluations = [evaluation, make_evaluation(teacher_id=evaluation.teacher_id)]
+    strict_session.commit()
+
+    return [evaluation.id for evaluation in evaluations]
+
+
+def add_result(session, evaluation_id, admin_id, comment, answer_comments=()):
+    """Add a result of the teacher of an evaluation, with commented answers."""
+    evaluation = session.get(Evaluation, evaluation_id)
+    result = EvaluationResult(
+        evaluation_id=evaluation_id,
+        teacher_id=evaluation.teacher_id,
+        admin_id=admin_id,
+        comment=comment,
+    )
+    session.add(result)
+    session.flush()
+    answers = [
+        QuestionResult(evaluation_result_id=result.id, comment=answer_comment)
+        for answer_comment in answer_comments
+    ]
+    session.add_all(answers)
+    session.commit()
+
+    return result, answers
+
+
+def test_terms_follow_comments(strict_session, evaluation_ids):
+    """Test created, updated and deleted comments adjust the terms."""
+    evaluation_id = evaluation_ids[0]
+    result, answers = add_result(
+        strict_session,
+        evaluation_id,
+        1,
+        "Great lessons, the teacher's lessons are clear",
+        ["Homework is too long", None],
+    )
+
+    assert get_terms(strict_session) == [
+        (evaluation_id, "clear", 1),
+        (evaluation_id, "great", 1),
+        (evaluation_id, "homework", 1),
+        (evaluation_id, "lessons", 2),
+        (evaluation_id, "long", 1),
+        (evaluation_id, "teacher", 1),
+    ]
+
+    result.comment = "Clear"
+    answers[1].comment = "Clear homework"
+    strict_session.delete(answers[0])
+    strict_session.commit()
+
+    assert get_terms(strict_session) == [
+        (evaluation_id, "clear", 2),
+        (evaluation_id, "homework", 1),
+    ]
+
+
+def test_upsert_counts_terms(strict_session, evaluation_ids):
+    """Test upserted comments replace the terms of the previous comment."""
+    evaluation_id = evaluation_ids[0]
+    add_result(strict_session, evaluation_id, 1, "Late again")
+
+    EvaluationResultRepository.upsert(
+        strict_session,
+        obj_in=EvaluationResultIn(
+            evaluation_id=evaluation_id, admin_id=1, comment="Punctual lately"
+        ),
+    )
+
+    assert get_terms(strict_session) == [
+        (evaluation_id, "lately", 1),
+        (evaluation_id, "punctual", 1),
+    ]
+
+
+def test_get_top_term_rows(strict_session, evaluation_ids):
+    """Test top terms are summed over the filtered evaluations."""
+    add_result(strict_session, evaluation_ids[0], 1, "Clear and patient")
+    add_result(strict_session, evaluation_ids[1], 1, "Patient", ["Patient, kind"])
+
+    rows = CommentTermRepository.get_top_term_rows(strict_session, limit=2)
+
+    assert [tuple(row) for row in rows] == [("patient", 3), ("clear", 1)]
+
+    rows = CommentTermRepository.get_top_term_rows(
+        strict_session, CommentTerm.evaluation_id == evaluation_ids[1], limit=5
+    )
+
+    assert [tuple(row) for row in rows] == [("patient", 2), ("kind", 1)]
+
+
+def test_rebuild(strict_session, evaluation_ids):
+    """Test the parallel rebuild recounts the terms counted incrementally."""
+    add_result(strict_session, evaluation_ids[0], 1, "Clear", ["Clear", "Kind"])
+    add_result(strict_session, evaluation_ids[1], 2, None, ["Late"])
+    expected = get_terms(strict_session)
+    strict_session.query(CommentTerm).delete()
+    strict_session.commit()
+
+    count = rebuild(strict_session, workers=2)
+
+    assert count == 3
+    assert get_terms(strict_session) == expected
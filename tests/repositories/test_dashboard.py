@@ -0,0 +1,208 @@
+"""Dashboard unit tests."""
+
+import asyncio
+
+import pytest
+
+from app.core.events import broadcaster, dashboard_channel
+from app.models import EvaluationResult, Question, QuestionResult, User
+from app.repositories.dashboard import publish_dashboard_events
+from app.repositories.evaluation_result import EvaluationResultRepository
+from app.repositories.question_result import QuestionResultRepository
+from app.schemas import EvaluationResultIn
+
+
+def published(evaluation_id, write):
+    """Get the (name, data) of the events a write publishes to a dashboard."""
+
+    async def watch():
+        with broadcaster.subscribe(dashboard_channel(evaluation_id)) as subscription:
+            write()
+            events = []
+            while (event := await subscription.get(timeout=0.01)) is not None:
+                events.append((event.name, event.data))
+            return events
+
+    return asyncio.run(watch())
+
+
+@pytest.fixture()
+def evaluation_id(strict_session, make_evaluation_result):
+    """Fixture that returns an evaluation with a result and a question."""
+    publish_dashboard_events(strict_session)
+
+    result = make_evaluation_result(id=1)
+    strict_session.add(Question(id=1, question_text="Clear?", category_id=3))
+    strict_session.commit()
+
+    return result.evaluation_id
+
+
+def test_results_publish_counts(strict_session, evaluation_id):
+    """Test committed results publish their count deltas and submissions."""
+    result = strict_session.get(EvaluationResult, 1)
+
+    def write():
+        result.is_submitted = True
+        strict_session.add(EvaluationResult(evaluation_id=evaluation_id, admin_id=2))
+        strict_session.commit()
+
+    assert published(evaluation_id, write) == [
+        (
+            "results",
+            {
+                "total": 1,
+                "submitted": 1,
+                "submissions": [{"admin_id": 1, "teacher_id": result.teacher_id}],
+            },
+        )
+    ]
+
+    def delete():
+        strict_session.delete(result)
+        strict_session.commit()
+
+    assert published(evaluation_id, delete) == [
+        ("results", {"total": -1, "submitted": -1, "submissions": []})
+    ]
+
+
+def test_rollback_publishes_nothing(strict_session, evaluation_id):
+    """Test rolled back writes are not published."""
+
+    def write():
+        strict_session.add(EvaluationResult(evaluation_id=evaluation_id, admin_id=2))
+        strict_session.flush()
+        strict_session.rollback()
+
+    assert published(evaluation_id, write) == []
+
+
+def test_answers_publish_category_ratings(strict_session, evaluation_id):
+    """Test answers publish rating deltas under their own or question category."""
+
+    def write():
+        strict_session.add_all(
+            [
+                QuestionResult(evaluation_result_id=1, question_id=1, rating=4),
+                QuestionResult(evaluation_result_id=1, category_id=5, rating=2),
+                QuestionResult(evaluation_result_id=1, category_id=5, rating=None),
+            ]
+        )
+        strict_session.commit()
+
+    (event,) = published(evaluation_id, write)
+
+    assert event[0] == "ratings"
+    assert sorted(event[1]["categories"], key=lambda c: c["category_id"]) == [
+        {"category_id": 3, "rating_sum": 4, "rating_count": 1},
+        {"category_id": 5, "rating_sum": 2, "rating_count": 1},
+    ]
+
+    answer = strict_session.query(QuestionResult).filter_by(rating=2).one()
+
+    def update():
+        answer.rating = 5
+        strict_session.commit()
+
+    assert published(evaluation_id, update) == [
+        (
+            "ratings",
+            {"categories": [{"category_id": 5, "rating_sum": 3, "rating_count": 0}]},
+        )
+    ]
+
+
+def test_upsert_publishes_counts(strict_session, evaluation_id):
+    """Test upserts publish the change from the previous result."""
+
+    def write():
+        EvaluationResultRepository.upsert(
+            strict_session,
+            obj_in=EvaluationResultIn(
+                evaluation_id=evaluation_id, admin_id=1, is_submitted=True
+            ),
+        )
+
+    assert published(evaluation_id, write) == [
+        (
+            "results",
+            {
+                "total": 0,
+                "submitted": 1,
+                "submissions": [{"admin_id": 1, "teacher_id": 1}],
+            },
+        )
+    ]
+
+
+def test_assign_publishes_counts(strict_session, evaluation_id):
+    """Test assigning publishes the pending results it created."""
+    strict_session.add_all(
+        [
+            User(
+                username=f"s{number}",
+                email=f"s{number}@yahoo.com",
+                role=role,
+                admin_id=9,
+            )
+            for number, role in ((1, "student"), (2, "student"), (3, "teacher"))
+        ]
+    )
+    strict_session.commit()
+
+    def write():
+        EvaluationResultRepository.assign_students(
+            strict_session, evaluation_id=evaluation_id, admin_id=9
+        )
+
+    assert published(evaluation_id, write) == [
+        ("results", {"total": 2, "submitted": 0, "submissions": []})
+    ]
+    assert published(evaluation_id, write) == []
+
+
+def test_unwatched_evaluations_publish_nothing(strict_session, evaluation_id):
+    """Test committed events are dropped while no dashboard is watched."""
+    strict_session.add(EvaluationResult(evaluation_id=evaluation_id, admin_id=2))
+    strict_session.flush()
+    assert strict_session.info["dashboard_events"]
+
+    strict_session.commit()
+    assert not broadcaster.has_subscribers()
+    assert "dashboard_events" not in strict_session.info
+
+
+def test_watched_after_flush_publishes(strict_session, evaluation_id):
+    """Test a dashboard watched between the flush and the commit gets the write."""
+    strict_session.add(EvaluationResult(evaluation_id=evaluation_id, admin_id=2))
+    strict_session.flush()
+
+    assert published(evaluation_id, strict_session.commit) == [
+        ("results", {"total": 1, "submitted": 0, "submissions": []})
+    ]
+
+
+def test_dashboard_rows(strict_session, evaluation_id):
+    """Test the counts and category rating sums the dashboards start from."""
+    strict_session.add_all(
+        [
+            EvaluationResult(
+                evaluation_id=evaluation_id, admin_id=2, is_submitted=True
+            ),
+            QuestionResult(evaluation_result_id=1, question_id=1, rating=4),
+            QuestionResult(evaluation_result_id=1, question_id=1, rating=2),
+            QuestionResult(evaluation_result_id=1, category_id=5, rating=1),
+        ]
+    )
+    strict_session.commit()
+
+    counts = EvaluationResultRepository(EvaluationResult).get_counts_row(
+        strict_session, evaluation_id=evaluation_id
+    )
+    rows = QuestionResultRepository.get_category_rating_rows(
+        strict_session, EvaluationResult.evaluation_id == evaluation_id
+    )
+
+    assert tuple(counts) == (2, 1)
+    assert [tuple(row) for row in rows] == [(3, 6, 2), (5, 1, 1)]
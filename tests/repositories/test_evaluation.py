@@ -3,9 +3,18 @@
 from http import HTTPStatus
 
 import pytest
-from sqlalchemy.exc import IntegrityError
-
-from app.models import Evaluation
+from fastapi_pagination import Page, Params, set_page, set_params
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from sqlalchemy.orm import joinedload
+
+from app.models import (
+    Category,
+    Evaluation,
+    EvaluationCategoryWeight,
+    EvaluationResult,
+    Question,
+    User,
+)
 from app.repositories.evaluation import EvaluationRepository
 from exceptions.exceptions import DatabaseException, APIException
 
@@ -227,3 +236,175 @@ def test_delete_evaluation_exception(mock_session):
 
     assert exc_info.value.detail == "An unexpected error occurred during the deletion."
     assert exc_info.value.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def test_get_evaluation_version(mock_session):
+    """Test retrieval of the max updated_at and count of evaluations."""
+    mock_data = ("2024-12-10T09:17:55.330000", 2)
+    mock_session.query.return_value.filter.return_value.one.return_value = mock_data
+
+    evaluation_repo = EvaluationRepository(Evaluation)
+    result = evaluation_repo.get_version(mock_session)
+
+    mock_session.query.assert_called_once()
+    assert result == mock_data
+
+
+def test_get_evaluation_version_exception(mock_session):
+    """Test exception handling during version retrieval."""
+    mock_session.query.side_effect = Exception("DB error")
+
+    with pytest.raises(DatabaseException) as exc_info:
+        evaluation_repo = EvaluationRepository(Evaluation)
+        evaluation_repo.get_version(mock_session)
+
+    assert exc_info.value.detail == "An error occurred while fetching the version."
+
+
+def test_get_evaluation_with_options(mock_session):
+    """Test loader options are applied to the query."""
+    mock_data = Evaluation
+    query = mock_session.query.return_value.options.return_value
+    query.filter.return_value.first.return_value = mock_data
+    option = joinedload(Evaluation.user)
+
+    evaluation_repo = EvaluationRepository(Evaluation)
+    result = evaluation_repo.get(mock_session, _id=1, options=[option])
+
+    mock_session.query.return_value.options.assert_called_once_with(option)
+    assert result == mock_data
+
+
+def test_lazy_load_raises_in_strict_mode(strict_session):
+    """Test per-row lazy loads fail and eager loaded relationships work."""
+    user = User(username="user 1", email="user@yahoo.com", first_name="John")
+    strict_session.add(user)
+    strict_session.flush()
+    teacher_id = user.id
+    strict_session.add(Evaluation(title="evaluation 1", teacher_id=teacher_id))
+    strict_session.commit()
+    strict_session.expunge_all()
+
+    evaluation_repo = EvaluationRepository(Evaluation)
+
+    evaluation = evaluation_repo.get_all_by_teacher_id(
+        strict_session, teacher_id=teacher_id
+    )[0]
+    with pytest.raises(InvalidRequestError):
+        evaluation.user
+
+    strict_session.expunge_all()
+    evaluation = evaluation_repo.get_all_by_teacher_id(
+        strict_session, teacher_id=teacher_id, options=[joinedload(Evaluation.user)]
+    )[0]
+    assert evaluation.user.first_name == "John"
+
+
+def test_clone_evaluation(strict_session):
+    """Test an evaluation and its questions are copied to each teacher."""
+    teachers = [
+        User(username=f"teacher {i}", email=f"teacher{i}@yahoo.com") for i in range(3)
+    ]
+    strict_session.add_all(teachers)
+    strict_session.flush()
+    teacher_ids = [teacher.id for teacher in teachers]
+    template = Evaluation(title="evaluation 1", teacher_id=teacher_ids[0])
+    strict_session.add(template)
+    strict_session.flush()
+    template_id = template.id
+    category = Category(name="Lesson Plans", display_order=1)
+    strict_session.add(category)
+    strict_session.flush()
+    strict_session.add_all(
+        [
+            Question(question_text=f"question {i}", evaluation_id=template_id)
+            for i in range(2)
+        ]
+        + [
+            EvaluationCategoryWeight(
+                evaluation_id=template_id, category_id=category.id, weight=2.5
+            )
+        ]
+    )
+    strict_session.commit()
+    category_id = category.id
+
+    evaluation_repo = EvaluationRepository(Evaluation)
+    evaluations = evaluation_repo.clone(
+        strict_session, _id=template_id, teacher_ids=teacher_ids[1:] + [999]
+    )
+
+    assert [evaluation.teacher_id for evaluation in evaluations] == teacher_ids[1:]
+    assert {evaluation.title for evaluation in evaluations} == {"evaluation 1"}
+    for evaluation in evaluations:
+        questions = (
+            strict_session.query(Question)
+            .filter(Question.evaluation_id == evaluation.id)
+            .order_by(Question.id)
+            .all()
+        )
+        assert [question.question_text for question in questions] == [
+            "question 0",
+            "question 1",
+        ]
+        weights = (
+            strict_session.query(EvaluationCategoryWeight)
+            .filter(EvaluationCategoryWeight.evaluation_id == evaluation.id)
+            .all()
+        )
+        assert [(weight.category_id, weight.weight) for weight in weights] == [
+            (category_id, 2.5)
+        ]
+
+
+def test_clone_evaluation_not_found(mock_session):
+    """Test clone of an evaluation that does not exist."""
+    mock_session.query.return_value.filter.return_value.first.return_value = None
+
+    with pytest.raises(APIException) as exc_info:
+        evaluation_repo = EvaluationRepository(Evaluation)
+        evaluation_repo.clone(mock_session, _id=1, teacher_ids=[1])
+
+    mock_session.execute.assert_not_called()
+    assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_paginate_pending_rows(strict_session):
+    """Test only enabled evaluations not submitted by the student are listed."""
+    teacher = User(
+        username="teacher", email="t@yahoo.com", first_name="John", last_name="Doe"
+    )
+    strict_session.add(teacher)
+    strict_session.flush()
+    teacher_id = teacher.id
+    evaluations = [
+        Evaluation(title=f"evaluation {i}", teacher_id=teacher_id) for i in range(4)
+    ]
+    evaluations[3].is_disabled = True
+    strict_session.add_all(evaluations)
+    strict_session.flush()
+    strict_session.add_all(
+        [
+            EvaluationResult(
+                evaluation_id=evaluations[0].id, admin_id=7, is_submitted=True
+            ),
+            EvaluationResult(
+                evaluation_id=evaluations[1].id, admin_id=7, is_submitted=False
+            ),
+            EvaluationResult(
+                evaluation_id=evaluations[2].id, admin_id=8, is_submitted=True
+            ),
+        ]
+    )
+    strict_session.commit()
+
+    evaluation_repo = EvaluationRepository(Evaluation)
+    with set_params(Params(page=1, size=1)), set_page(Page):
+        page = evaluation_repo.paginate_pending_rows(
+            strict_session, ["id", "title"], admin_id=7
+        )
+
+    assert page.total == 2
+    assert [(row.title, row.teacher_name) for row in page.items] == [
+        ("evaluation 1", "John Doe")
+    ]
@@ -0,0 +1,290 @@
+"""Evaluation result repository unit tests."""
+
+from http import HTTPStatus
+
+import pytest
+from fastapi_pagination import Page, Params, set_page, set_params
+from sqlalchemy import event
+
+from app.models import (
+    Category,
+    Evaluation,
+    EvaluationResult,
+    Question,
+    QuestionResult,
+    User,
+)
+from app.repositories.evaluation_result import EvaluationResultRepository
+from app.schemas import EvaluationResultIn
+from exceptions.exceptions import APIException, DatabaseException
+
+
+def test_assign_students(strict_session):
+    """Test a pending result is created once for every student of the admin."""
+    admin = User(username="admin", email="admin@yahoo.com", role="admin")
+    strict_session.add(admin)
+    strict_session.flush()
+    admin_id = admin.id
+    strict_session.add_all(
+        [
+            User(username="student 1", email="s1@yahoo.com", role="student"),
+            User(
+                username="student 2",
+                email="s2@yahoo.com",
+                role="student",
+                admin_id=admin_id,
+            ),
+            User(
+                username="student 3",
+                email="s3@yahoo.com",
+                role="student",
+                admin_id=admin_id,
+            ),
+            User(
+                username="teacher",
+                email="t@yahoo.com",
+                role="teacher",
+                admin_id=admin_id,
+            ),
+        ]
+    )
+    evaluation = Evaluation(title="evaluation 1", teacher_id=admin_id)
+    strict_session.add(evaluation)
+    strict_session.commit()
+    evaluation_id = evaluation.id
+
+    evaluation_result_repo = EvaluationResultRepository(EvaluationResult)
+
+    assigned = evaluation_result_repo.assign_students(
+        strict_session, evaluation_id=evaluation_id, admin_id=admin_id
+    )
+    assigned_again = evaluation_result_repo.assign_students(
+        strict_session, evaluation_id=evaluation_id, admin_id=admin_id
+    )
+
+    results = strict_session.query(EvaluationResult).all()
+    assert assigned == 2
+    assert assigned_again == 0
+    assert len(results) == 2
+    assert {result.title for result in results} == {"evaluation 1"}
+    assert {result.is_submitted for result in results} == {False}
+
+
+def test_assign_students_exception(mock_session):
+    """Test assignment rolls back on database error."""
+    mock_session.execute.side_effect = Exception("DB error")
+
+    with pytest.raises(DatabaseException) as exc_info:
+        evaluation_result_repo = EvaluationResultRepository(EvaluationResult)
+        evaluation_result_repo.assign_students(
+            mock_session, evaluation_id=1, admin_id=1
+        )
+
+    mock_session.rollback.assert_called_once()
+    assert exc_info.value.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def test_get_participation_rows(strict_session):
+    """Test total and submitted counts are aggregated per evaluation."""
+    teacher = User(
+        username="teacher", email="t@yahoo.com", first_name="John", last_name="Doe"
+    )
+    strict_session.add(teacher)
+    strict_session.flush()
+    evaluations = [
+        Evaluation(title=f"evaluation {i}", teacher_id=teacher.id) for i in range(2)
+    ]
+    strict_session.add_all(evaluations)
+    strict_session.flush()
+    strict_session.add_all(
+        [
+            EvaluationResult(
+                evaluation_id=evaluations[0].id, admin_id=1, is_submitted=True
+            ),
+            EvaluationResult(
+                evaluation_id=evaluations[0].id, admin_id=2, is_submitted=False
+            ),
+            EvaluationResult(evaluation_id=evaluations[0].id, admin_id=3),
+            EvaluationResult(
+                evaluation_id=evaluations[1].id, admin_id=1, is_submitted=True
+            ),
+        ]
+    )
+    strict_session.commit()
+
+    evaluation_result_repo = EvaluationResultRepository(EvaluationResult)
+    rows = evaluation_result_repo.get_participation_rows(strict_session)
+
+    assert [
+        (row.title, row.teacher_name, row.total, row.submitted) for row in rows
+    ] == [("evaluation 0", "John Doe", 3, 1), ("evaluation 1", "John Doe", 1, 1)]
+
+
+@pytest.fixture()
+def ranking(strict_session):
+    """Fixture that returns an admin and two categories rated for three teachers.
+
+    In the evaluations of the admin, averages are 5, 4 and 4 in the first
+    category and 1, 2 and 3 in the second. Results not submitted or of the
+    evaluations of another admin don't count.
+    """
+    admins = [
+        User(username="admin", email="admin@yahoo.com", role="admin"),
+        User(username="other admin", email="other@yahoo.com", role="admin"),
+    ]
+    categories = [
+        Category(name="Classroom Teaching", display_order=1),
+        Category(name="Lesson Plans", display_order=2),
+    ]
+    strict_session.add_all([*admins, *categories])
+    strict_session.flush()
+    students = [
+        User(
+            username=f"student {number}",
+            email=f"s{number}@yahoo.com",
+            role="student",
+            admin_id=admin.id,
+        )
+        for number, admin in enumerate(admins, start=1)
+    ]
+    strict_session.add_all(students)
+    strict_session.flush()
+
+    for number, ratings in enumerate(((5, 1), (4, 2), (4, 3)), start=1):
+        teacher = User(
+            username=f"teacher {number}",
+            email=f"t{number}@yahoo.com",
+            first_name="Teacher",
+            last_name=str(number),
+            role="teacher",
+        )
+        strict_session.add(teacher)
+        strict_session.flush()
+
+        for admin, student in zip(admins, students):
+            evaluation = Evaluation(
+                title=f"evaluation {number}",
+                teacher_id=teacher.id,
+                admin_id=admin.id,
+            )
+            strict_session.add(evaluation)
+            strict_session.flush()
+            questions = [
+                Question(evaluation_id=evaluation.id, category_id=category.id)
+                for category in categories
+            ]
+            strict_session.add_all(questions)
+
+            for student_id, is_submitted in ((student.id, True), (None, False)):
+                counted = is_submitted and admin is admins[0]
+                result = EvaluationResult(
+                    evaluation_id=evaluation.id,
+                    teacher_id=teacher.id,
+                    admin_id=student_id,
+                    is_submitted=is_submitted,
+                )
+                strict_session.add(result)
+                strict_session.flush()
+                strict_session.add_all(
+                    [
+                        QuestionResult(
+                            question_id=question.id,
+                            evaluation_result_id=result.id,
+                            rating=rating if counted else 1,
+                        )
+                        for question, rating in zip(questions, ratings)
+                    ]
+                )
+
+    strict_session.commit()
+
+    return {
+        "admin_id": admins[0].id,
+        "category_ids": [category.id for category in categories],
+    }
+
+
+def test_paginate_ranking_rows(strict_session, ranking):
+    """Test teachers are ranked on their mean score, ties sharing a rank."""
+    evaluation_result_repo = EvaluationResultRepository(EvaluationResult)
+    with set_params(Params(page=1, size=2)), set_page(Page):
+        page = evaluation_result_repo.paginate_ranking_rows(
+            strict_session, admin_id=ranking["admin_id"]
+        )
+
+    assert page.total == 3
+    assert [
+        (row.teacher_name, row.results, row.average, row.rank, row.percentile)
+        for row in page.items
+    ] == [("Teacher 3", 1, 3.5, 1, 100.0), ("Teacher 1", 1, 3.0, 2, 0.0)]
+
+
+def test_paginate_ranking_rows_by_category(strict_session, ranking):
+    """Test teachers are ranked on their average in a category."""
+    evaluation_result_repo = EvaluationResultRepository(EvaluationResult)
+    with set_params(Params(page=1, size=3)), set_page(Page):
+        page = evaluation_result_repo.paginate_ranking_rows(
+            strict_session,
+            admin_id=ranking["admin_id"],
+            category_id=ranking["category_ids"][0],
+        )
+
+    assert [
+        (row.teacher_name, row.average, row.rank, row.percentile) for row in page.items
+    ] == [
+        ("Teacher 1", 5.0, 1, 100.0),
+        ("Teacher 2", 4.0, 2, 0.0),
+        ("Teacher 3", 4.0, 2, 0.0),
+    ]
+
+
+def test_upsert(strict_session):
+    """Test a resubmission updates the existing result of the student."""
+    evaluation_result_repo = EvaluationResultRepository(EvaluationResult)
+
+    created = evaluation_result_repo.upsert(
+        strict_session,
+        obj_in=EvaluationResultIn(evaluation_id=1, admin_id=2, is_submitted=False),
+    )
+    created_id = created.id
+    updated = evaluation_result_repo.upsert(
+        strict_session,
+        obj_in=EvaluationResultIn(
+            evaluation_id=1, admin_id=2, is_submitted=True, comment="comment"
+        ),
+    )
+
+    assert updated.id == created_id
+    assert updated.is_submitted is True
+    assert updated.comment == "comment"
+    assert strict_session.query(EvaluationResult).count() == 1
+
+
+def test_upsert_locks_the_replaced_result(strict_session):
+    """Test a resubmission reads the result it replaces FOR UPDATE only."""
+    evaluation_result_repo = EvaluationResultRepository(EvaluationResult)
+    obj_in = EvaluationResultIn(evaluation_id=1, admin_id=2, is_submitted=True)
+    locks = []
+
+    @event.listens_for(strict_session, "do_orm_execute")
+    def record_locks(orm_execute_state):
+        if orm_execute_state.is_select:
+            locks.append(orm_execute_state.statement._for_update_arg is not None)
+
+    evaluation_result_repo.upsert(strict_session, obj_in=obj_in)
+    assert locks == []
+
+    evaluation_result_repo.upsert(strict_session, obj_in=obj_in)
+    assert locks == [True]
+
+
+def test_upsert_without_conflict_target(mock_session):
+    """Test upsert requires evaluation_id and admin_id."""
+    with pytest.raises(APIException) as exc_info:
+        evaluation_result_repo = EvaluationResultRepository(EvaluationResult)
+        evaluation_result_repo.upsert(
+            mock_session, obj_in=EvaluationResultIn(evaluation_id=1)
+        )
+
+    mock_session.execute.assert_not_called()
+    assert exc_info.value.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
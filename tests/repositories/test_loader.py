@@ -0,0 +1,55 @@
+"""Batch loader unit tests."""
+
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models import User
+from app.repositories.loader import BatchLoader
+from app.repositories.user import UserRepository
+from exceptions.exceptions import APIException
+
+
+def test_load_batches_primed_ids(mock_session):
+    """Test primed IDs are fetched with a single deduplicated query."""
+    user_1 = User(id=1)
+    user_2 = User(id=2)
+    user_repo = MagicMock(spec=UserRepository)
+    user_repo.get_many.return_value = [user_1, user_2]
+
+    loader = BatchLoader(mock_session, user_repo)
+    loader.prime([1, 2, 1, None])
+
+    assert loader.load(2) is user_2
+    assert loader.load(1) is user_1
+    assert loader.load(2) is user_2
+    user_repo.get_many.assert_called_once_with(mock_session, [1, 2])
+
+
+def test_load_many(mock_session):
+    """Test load many keeps the requested order."""
+    user_1 = User(id=1)
+    user_2 = User(id=2)
+    user_repo = MagicMock(spec=UserRepository)
+    user_repo.get_many.return_value = [user_1, user_2]
+
+    loader = BatchLoader(mock_session, user_repo)
+
+    assert loader.load_many([2, 1, 2]) == [user_2, user_1, user_2]
+    user_repo.get_many.assert_called_once_with(mock_session, [2, 1])
+
+
+def test_load_not_found(mock_session):
+    """Test missing IDs raise not found and are not fetched again."""
+    user_repo = MagicMock(spec=UserRepository)
+    user_repo.get_many.return_value = []
+
+    loader = BatchLoader(mock_session, user_repo)
+
+    for _ in range(2):
+        with pytest.raises(APIException) as exc_info:
+            loader.load(1)
+        assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
+
+    user_repo.get_many.assert_called_once_with(mock_session, [1])
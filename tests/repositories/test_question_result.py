@@ -0,0 +1,217 @@
+"""Question result repository unit tests."""
+
+from http import HTTPStatus
+
+import pytest
+
+from app import schemas
+from app.models import (
+    Category,
+    Evaluation,
+    EvaluationResult,
+    Question,
+    QuestionResult,
+    User,
+)
+from app.repositories.question import QuestionRepository
+from app.repositories.question_result import QuestionResultRepository
+from exceptions.exceptions import APIException
+
+
+@pytest.fixture()
+def question_ids(strict_session):
+    """Fixture that returns the ids of a student and a question."""
+    student = User(
+        username="student",
+        email="student@yahoo.com",
+        first_name="Jane",
+        last_name="Doe",
+        role="student",
+    )
+    strict_session.add(student)
+    strict_session.flush()
+    evaluation = Evaluation(title="evaluation 1", teacher_id=student.id)
+    strict_session.add(evaluation)
+    strict_session.flush()
+    question = Question(
+        question_text="question 1",
+        category="Lesson Plans",
+        evaluation_id=evaluation.id,
+        evaluation_title="evaluation 1",
+    )
+    strict_session.add(question)
+    strict_session.commit()
+
+    return student.id, question.id
+
+
+def test_create_compact(strict_session, question_ids):
+    """Test an answer referencing its question stores only the rating."""
+    student_id, question_id = question_ids
+    question_result_repo = QuestionResultRepository(QuestionResult)
+
+    question_result = question_result_repo.create(
+        strict_session,
+        obj_in=schemas.QuestionResultIn(
+            question_id=question_id,
+            question_text="question 1",
+            category="Lesson Plans",
+            student_id=student_id,
+            student_name="Jane Doe",
+            evaluation_result_id=1,
+            rating=5,
+        ),
+    )
+    question_result_id = question_result.id
+
+    stored = strict_session.get(QuestionResult, question_result_id)
+    assert stored.question_text is None
+    assert stored.category is None
+    assert stored.student_name is None
+    assert stored.rating == 5
+
+    row = question_result_repo.get_row(
+        strict_session, schemas.QuestionResultOut.model_fields, _id=question_result_id
+    )
+    assert row.question_text == "question 1"
+    assert row.category == "Lesson Plans"
+    assert row.evaluation_title == "evaluation 1"
+    assert row.student_name == "Jane Doe"
+
+
+def test_get_all_rows_by_evaluation_result_ids(strict_session, question_ids):
+    """Test compact and legacy answers read back the same fields."""
+    student_id, question_id = question_ids
+    strict_session.add_all(
+        [
+            QuestionResult(question_id=question_id, evaluation_result_id=1, rating=4),
+            QuestionResult(
+                question_text="legacy",
+                category="Classroom Teaching",
+                evaluation_result_id=2,
+                rating=3,
+            ),
+            QuestionResult(question_id=question_id, evaluation_result_id=3),
+        ]
+    )
+    strict_session.commit()
+
+    rows = QuestionResultRepository(
+        QuestionResult
+    ).get_all_rows_by_evaluation_result_ids(
+        strict_session,
+        ["evaluation_result_id", "question_text", "category", "rating"],
+        evaluation_result_ids=[1, 2],
+    )
+
+    assert [tuple(row) for row in rows] == [
+        (1, "question 1", "Lesson Plans", 4),
+        (2, "legacy", "Classroom Teaching", 3),
+    ]
+
+
+def test_get_row_not_found(strict_session):
+    """Test get row of a missing record."""
+    with pytest.raises(APIException) as exc_info:
+        QuestionResultRepository(QuestionResult).get_row(strict_session, ["id"], _id=1)
+
+    assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_delete_question_keeps_answer_text(strict_session, question_ids):
+    """Test deleting a question copies its text into the compact answers."""
+    _, question_id = question_ids
+    category = Category(name="Lesson Plans", display_order=1)
+    strict_session.add(category)
+    strict_session.flush()
+    strict_session.get(Question, question_id).category_id = category.id
+    question_result = QuestionResult(question_id=question_id, rating=4)
+    strict_session.add(question_result)
+    strict_session.commit()
+    question_result_id = question_result.id
+    category_id = category.id
+
+    QuestionRepository(Question).delete(strict_session, _id=question_id)
+
+    strict_session.expire_all()
+    stored = strict_session.get(QuestionResult, question_result_id)
+    assert stored.question_text == "question 1"
+    assert stored.category == "Lesson Plans"
+    assert stored.category_id == category_id
+    assert stored.evaluation_title == "evaluation 1"
+
+
+def test_get_category_average_rows(strict_session, question_ids):
+    """Test ratings are averaged per result and category ID in SQL."""
+    student_id, question_id = question_ids
+    category = Category(name="Classroom Teaching", display_order=1)
+    strict_session.add(category)
+    strict_session.commit()
+    category_id = category.id
+    strict_session.query(Question).update({"category_id": category_id})
+
+    question_result_repo = QuestionResultRepository(QuestionResult)
+    for rating in (4, 5):
+        question_result_repo.create(
+            strict_session,
+            obj_in=schemas.QuestionResultIn(
+                question_id=question_id, evaluation_result_id=1, rating=rating
+            ),
+        )
+    question_result_repo.create(
+        strict_session,
+        obj_in=schemas.QuestionResultIn(
+            category="Classroom Teaching", evaluation_result_id=1, rating=3
+        ),
+    )
+    question_result_repo.create(
+        strict_session,
+        obj_in=schemas.QuestionResultIn(evaluation_result_id=2, rating=1),
+    )
+
+    rows = question_result_repo.get_category_average_rows(
+        strict_session, evaluation_result_ids=[1, 2]
+    )
+
+    assert sorted(tuple(row) for row in rows) == [
+        (1, category_id, 4.0),
+        (2, None, 1.0),
+    ]
+
+
+def test_get_rating_histogram_rows(strict_session, question_ids):
+    """Test answers are counted per question and rating of the filtered results."""
+    student_id, question_id = question_ids
+    evaluation_result = EvaluationResult(teacher_id=student_id, admin_id=student_id)
+    strict_session.add(evaluation_result)
+    strict_session.flush()
+    evaluation_result_id = evaluation_result.id
+    strict_session.add_all(
+        [
+            QuestionResult(
+                question_id=question_id,
+                evaluation_result_id=evaluation_result_id,
+                rating=rating,
+            )
+            for rating in (5, 4, 5, None)
+        ]
+        + [
+            QuestionResult(
+                question_text="legacy",
+                evaluation_result_id=evaluation_result_id,
+                rating=3,
+            ),
+            QuestionResult(question_id=question_id, evaluation_result_id=99, rating=1),
+        ]
+    )
+    strict_session.commit()
+
+    rows = QuestionResultRepository(QuestionResult).get_rating_histogram_rows(
+        strict_session, EvaluationResult.teacher_id == student_id
+    )
+
+    assert [tuple(row) for row in rows] == [
+        (None, "legacy", None, 3, 1),
+        (question_id, "question 1", None, 4, 1),
+        (question_id, "question 1", None, 5, 2),
+    ]
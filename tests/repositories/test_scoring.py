@@ -0,0 +1,96 @@
+"""Scoring unit tests."""
+
+import pytest
+
+from app.models import (
+    Category,
+    EvaluationCategoryWeight,
+    EvaluationResult,
+    Question,
+    QuestionResult,
+)
+from app.repositories.scoring import get_weighted_scores
+
+
+@pytest.fixture()
+def evaluation_ids(strict_session, make_evaluation, make_evaluation_result):
+    """Fixture that returns two evaluations with answers in two categories."""
+    categories = [
+        Category(name="Classroom Teaching", display_order=1),
+        Category(name="Lesson Plans", display_order=2),
+        Category(name="Unused", display_order=3),
+    ]
+    strict_session.add_all(categories)
+    strict_session.flush()
+
+    evaluation_ids = []
+    teacher_id = None
+    for _ in range(2):
+        evaluation = make_evaluation(teacher_id=teacher_id)
+        teacher_id = evaluation.teacher_id
+        questions = [
+            Question(evaluation_id=evaluation.id, category_id=category.id)
+            for category in categories[:2]
+        ]
+        result = make_evaluation_result(evaluation.id)
+        strict_session.add_all(questions)
+        strict_session.flush()
+        strict_session.add_all(
+            [
+                QuestionResult(
+                    question_id=questions[0].id,
+                    evaluation_result_id=result.id,
+                    rating=2,
+                ),
+                QuestionResult(
+                    question_id=questions[0].id,
+                    evaluation_result_id=result.id,
+                    rating=4,
+                ),
+                QuestionResult(
+                    question_id=questions[1].id,
+                    evaluation_result_id=result.id,
+                    rating=5,
+                ),
+            ]
+        )
+        evaluation_ids.append((evaluation.id, result.id))
+
+    strict_session.add_all(
+        [
+            EvaluationCategoryWeight(
+                evaluation_id=evaluation_ids[1][0],
+                category_id=categories[0].id,
+                weight=3,
+            ),
+            EvaluationCategoryWeight(
+                evaluation_id=evaluation_ids[1][0],
+                category_id=categories[2].id,
+                weight=1,
+            ),
+        ]
+    )
+    strict_session.commit()
+
+    return evaluation_ids
+
+
+def test_get_weighted_scores(strict_session, evaluation_ids):
+    """Test scores weigh the category averages of each evaluation."""
+    (_, unweighted_id), (_, weighted_id) = evaluation_ids
+
+    scores = get_weighted_scores(strict_session)
+
+    # (3 + 5) / 2 with default weights, (3 * 3 + 5 + 0) / 5 with weights
+    assert scores == {unweighted_id: 4.0, weighted_id: 2.8}
+
+
+def test_get_weighted_scores_filtered(strict_session, evaluation_ids):
+    """Test criterion on the evaluation results filter the scores."""
+    (evaluation_id, result_id), _ = evaluation_ids
+
+    scores = get_weighted_scores(
+        strict_session, EvaluationResult.evaluation_id == evaluation_id
+    )
+
+    assert scores == {result_id: 4.0}
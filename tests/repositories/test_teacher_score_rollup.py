@@ -0,0 +1,204 @@
+"""Teacher score rollup unit tests."""
+
+from datetime import date, datetime
+
+import pytest
+
+from app.models import (
+    Category,
+    EvaluationResult,
+    Question,
+    QuestionResult,
+    TeacherScoreRollup,
+)
+from app.repositories.evaluation_result import EvaluationResultRepository
+from app.repositories.teacher_score_rollup import (
+    TeacherScoreRollupRepository,
+    maintain_teacher_score_rollups,
+    rollup_start,
+    week_start,
+)
+from app.schemas import EvaluationResultIn
+
+
+def get_rollups(session):
+    """Get the (category_id, bucket_start, rating_sum, rating_count) rollups."""
+    return sorted(
+        (
+            rollup.category_id,
+            rollup.bucket_start,
+            rollup.rating_sum,
+            rollup.rating_count,
+        )
+        for rollup in session.query(TeacherScoreRollup)
+    )
+
+
+@pytest.fixture()
+def answer_ids(strict_session, make_evaluation_result):
+    """Fixture that returns a teacher, a category and a result to answer."""
+    maintain_teacher_score_rollups(strict_session)
+
+    category = Category(name="Classroom Teaching", display_order=1)
+    strict_session.add(category)
+    result = make_evaluation_result(is_submitted=True)
+    question = Question(evaluation_id=result.evaluation_id, category_id=category.id)
+    strict_session.add(question)
+    strict_session.commit()
+
+    return {
+        "teacher_id": result.teacher_id,
+        "category_id": category.id,
+        "question_id": question.id,
+        "evaluation_result_id": result.id,
+    }
+
+
+def test_week_start():
+    """Test buckets start on Monday."""
+    assert week_start(datetime(2024, 9, 1, 23, 59)) == date(2024, 8, 26)
+    assert week_start(datetime(2024, 9, 2)) == date(2024, 9, 2)
+
+
+def test_rollup_start():
+    """Test rollups split the weeks at month boundaries."""
+    assert rollup_start(datetime(2024, 8, 1, 12)) == date(2024, 8, 1)
+    assert rollup_start(datetime(2024, 8, 4)) == date(2024, 8, 1)
+    assert rollup_start(datetime(2024, 7, 31)) == date(2024, 7, 29)
+    assert rollup_start(datetime(2024, 9, 4)) == date(2024, 9, 2)
+
+
+def test_rollups_follow_answers(strict_session, answer_ids):
+    """Test created, updated and deleted answers adjust their rollup."""
+    created_at = datetime(2024, 9, 4)
+    answers = [
+        QuestionResult(
+            question_id=answer_ids["question_id"],
+            evaluation_result_id=answer_ids["evaluation_result_id"],
+            rating=rating,
+            created_at=created_at,
+        )
+        for rating in (4, 2, None)
+    ]
+    strict_session.add_all(answers)
+    strict_session.commit()
+
+    category_id = answer_ids["category_id"]
+    assert get_rollups(strict_session) == [(category_id, date(2024, 9, 2), 6, 2)]
+
+    answers[0].rating = 5
+    answers[2].rating = 3
+    strict_session.commit()
+    assert get_rollups(strict_session) == [(category_id, date(2024, 9, 2), 10, 3)]
+
+    answers[1].created_at = datetime(2024, 9, 9)
+    strict_session.delete(answers[0])
+    strict_session.commit()
+    assert get_rollups(strict_session) == [
+        (category_id, date(2024, 9, 2), 3, 1),
+        (category_id, date(2024, 9, 9), 2, 1),
+    ]
+
+
+def test_rollups_count_submitted_results(strict_session, answer_ids):
+    """Test answers count once their result is submitted, and until it is not."""
+    result = strict_session.get(EvaluationResult, answer_ids["evaluation_result_id"])
+    result.is_submitted = False
+    strict_session.add(
+        QuestionResult(
+            question_id=answer_ids["question_id"],
+            evaluation_result_id=result.id,
+            rating=4,
+            created_at=datetime(2024, 9, 4),
+        )
+    )
+    strict_session.commit()
+    assert get_rollups(strict_session) == []
+
+    result.is_submitted = True
+    strict_session.commit()
+    category_id = answer_ids["category_id"]
+    assert get_rollups(strict_session) == [(category_id, date(2024, 9, 2), 4, 1)]
+
+    EvaluationResultRepository.upsert(
+        strict_session,
+        obj_in=EvaluationResultIn(
+            evaluation_id=result.evaluation_id, admin_id=1, is_submitted=False
+        ),
+    )
+    assert get_rollups(strict_session) == [(category_id, date(2024, 9, 2), 0, 0)]
+
+    strict_session.add(
+        QuestionResult(
+            question_id=answer_ids["question_id"],
+            evaluation_result_id=result.id,
+            rating=2,
+            created_at=datetime(2024, 9, 4),
+        )
+    )
+    strict_session.commit()
+    assert get_rollups(strict_session) == [(category_id, date(2024, 9, 2), 0, 0)]
+    assert TeacherScoreRollupRepository(TeacherScoreRollup).rebuild(strict_session) == 0
+
+
+def test_upsert_resubmission_rolls_up_once(strict_session, answer_ids):
+    """Test resubmitting a submitted result adds its answers only once."""
+    result = strict_session.get(EvaluationResult, answer_ids["evaluation_result_id"])
+    result.is_submitted = False
+    strict_session.add(
+        QuestionResult(
+            question_id=answer_ids["question_id"],
+            evaluation_result_id=result.id,
+            rating=4,
+            created_at=datetime(2024, 9, 4),
+        )
+    )
+    strict_session.commit()
+
+    obj_in = EvaluationResultIn(
+        evaluation_id=result.evaluation_id, admin_id=1, is_submitted=True
+    )
+    EvaluationResultRepository.upsert(strict_session, obj_in=obj_in)
+    EvaluationResultRepository.upsert(strict_session, obj_in=obj_in)
+
+    category_id = answer_ids["category_id"]
+    assert get_rollups(strict_session) == [(category_id, date(2024, 9, 2), 4, 1)]
+
+
+def test_rebuild(strict_session, answer_ids):
+    """Test rebuild recomputes the rollups written incrementally."""
+    strict_session.add_all(
+        [
+            QuestionResult(
+                question_id=answer_ids["question_id"],
+                evaluation_result_id=answer_ids["evaluation_result_id"],
+                rating=rating,
+                created_at=created_at,
+            )
+            for rating, created_at in (
+                (4, datetime(2024, 9, 4)),
+                (2, datetime(2024, 9, 8)),
+                (5, datetime(2024, 9, 9)),
+                (3, datetime(2024, 7, 31)),
+                (1, datetime(2024, 8, 2)),
+            )
+        ]
+    )
+    strict_session.commit()
+    expected = get_rollups(strict_session)
+
+    count = TeacherScoreRollupRepository(TeacherScoreRollup).rebuild(strict_session)
+
+    assert count == 4
+    assert get_rollups(strict_session) == expected
+    assert [
+        (rollup.bucket_start, rollup.rating_count)
+        for rollup in TeacherScoreRollupRepository.get_all_by_teacher_id(
+            strict_session, teacher_id=answer_ids["teacher_id"]
+        )
+    ] == [
+        (date(2024, 7, 29), 1),
+        (date(2024, 8, 1), 1),
+        (date(2024, 9, 2), 2),
+        (date(2024, 9, 9), 1),
+    ]
@@ -148,3 +148,60 @@ def test_update_user_success(mock_session, user_db_update):
 
     assert update_user is not None
     assert update_user.username == user_db_update.username
+
+
+def test_get_many_users(mock_session):
+    """Test retrieval of users by ids in the requested order."""
+    user_1, user_2 = User(id=1), User(id=2)
+    mock_session.query.return_value.filter.return_value.all.return_value = [
+        user_1,
+        user_2,
+    ]
+
+    user_repo = UserRepository(User)
+    result = user_repo.get_many(mock_session, [2, 1, 2, 3])
+
+    mock_session.query.assert_called_once()
+    assert result == [user_2, user_1]
+
+
+def test_get_many_users_chunked(mock_session):
+    """Test retrieval of users by ids in chunks."""
+    mock_session.query.return_value.filter.return_value.all.return_value = []
+
+    user_repo = UserRepository(User)
+    user_repo.get_many(mock_session, range(5), chunk_size=2)
+
+    assert mock_session.query.call_count == 3
+
+
+def test_get_all_rows(strict_session):
+    """Test only the columns of the schema are selected, as plain rows."""
+    strict_session.add(
+        User(username="user 1", email="user@yahoo.com", hashed_password="secret")
+    )
+    strict_session.commit()
+
+    user_repo = UserRepository(User)
+    rows = user_repo.get_all_rows(strict_session, ["id", "username", "full_name"])
+
+    assert rows[0]._fields == ("id", "username")
+    assert rows[0].username == "user 1"
+    assert not strict_session.identity_map
+
+
+def test_full_name_skips_missing_parts(strict_session):
+    """Test the full name reads the same in Python and SQL without a middle name."""
+    strict_session.add_all(
+        [
+            User(id=1, first_name="Tea", middle_name=None, last_name="Cher"),
+            User(id=2, first_name="John", middle_name="Doe", last_name="Doe"),
+            User(id=3, first_name=None, middle_name=None, last_name="Solo"),
+        ]
+    )
+    strict_session.commit()
+
+    names = dict(strict_session.query(User.id, User.full_name).order_by(User.id).all())
+
+    assert names == {1: "Tea Cher", 2: "John Doe Doe", 3: "Solo"}
+    assert {user.id: user.full_name for user in strict_session.query(User)} == names
@@ -6,12 +6,12 @@ from unittest.mock import patch
 from fastapi_pagination import Page
 from starlette.responses import JSONResponse
 
-from app.models import Announcement
+from app.models import Announcement, User
 from app.use_cases.announcement import AnnouncementUseCase
 from exceptions.exceptions import DatabaseException, APIException
 
 
-@patch("app.use_cases.evaluation.UserRepository", spec=True)
+@patch("app.use_cases.announcement.UserRepository", spec=True)
 @patch("app.use_cases.announcement.AnnouncementRepository", spec=True)
 @patch("app.use_cases.announcement.paginate", spec=True)
 def test_get_announcements(
@@ -32,8 +32,11 @@ def test_get_announcements(
     m_repo_announcement_instance = m_repo_announcement.return_value
     m_repo_announcement_instance.get_all.return_value = mock_data
 
+    user_2 = User(
+        id=2, first_name="John", middle_name="Doe", last_name="Doe", role="admin"
+    )
     m_repo_user_instance = m_repo_user.return_value
-    m_repo_user_instance.get.side_effect = [user_model_out, user_model_out]
+    m_repo_user_instance.get_many.return_value = [user_model_out, user_2]
 
     # Mock the paginate call
     m_paginate.return_value = Page(
@@ -75,6 +78,9 @@ def test_get_announcements(
     #     ]
     # )
 
+    # Authors are fetched with one batched query
+    m_repo_user_instance.get_many.assert_called_once_with(mock_session, [1, 2])
+
     # Assertions to check the response matches the expected values
     assert response.items == [
         {
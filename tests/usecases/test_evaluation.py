@@ -1,23 +1,75 @@
 """Evaluation use case unit tests."""
 
 from http import HTTPStatus
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from fastapi_pagination import Page
 from starlette.responses import JSONResponse
 
-from app.models import Evaluation
+from app import schemas
+from app.models import (
+    Evaluation,
+    EvaluationResult,
+    Question,
+    QuestionResult,
+    User,
+)
 from app.use_cases.evaluation import EvaluationUseCase
 from exceptions.exceptions import DatabaseException, APIException
 
 
+@patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
+@patch("app.use_cases.evaluation.paginate", spec=True)
+def test_get_evaluations(m_paginate, m_repo_evaluation, mock_session):
+    """Test get evaluations."""
+    # Rows as selected by the repository, teacher_name included
+    mock_data = [
+        {"teacher_name": "John Doe Doe", "title": "title 1", "teacher_id": 1},
+        {"teacher_name": "John Doe Doe", "title": "title 2", "teacher_id": 2},
+    ]
+
+    # Mock the repository calls
+    m_repo_evaluation_instance = m_repo_evaluation.return_value
+    m_repo_evaluation_instance.get_all_rows_with_teacher_name.return_value = (
+        mock_data
+    )
+
+    # Mock the paginate call
+    m_paginate.return_value = Page(
+        items=mock_data,
+        total=len(mock_data),
+        page=1,
+        size=10,
+    )
+
+    # Create an instance of the use case
+    evaluation_uc = EvaluationUseCase(db=mock_session)
+
+    # Call the method under test
+    response = evaluation_uc.get_evaluations()
+
+    # Only the columns of the out schema are selected
+    m_repo_evaluation_instance.get_all_rows_with_teacher_name.assert_called_once_with(
+        mock_session, schemas.EvaluationsOut.model_fields
+    )
+    m_repo_evaluation_instance.get_all.assert_not_called()
+    m_paginate.assert_called_once_with(mock_data)
+
+    # Assertions to check the response matches the expected values
+    assert response.items == mock_data
+    assert response.total == len(mock_data)
+    assert response.page == 1
+    assert response.size == 10
+
+
 @patch("app.use_cases.evaluation.UserRepository", spec=True)
 @patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
 @patch("app.use_cases.evaluation.paginate", spec=True)
-def test_get_evaluations(
+def test_get_evaluations_by_ids(
     m_paginate, m_repo_evaluation, m_repo_user, mock_session, user_model_out
 ):
-    """Test get evaluations."""
+    """Test get evaluations of the given ids."""
     # Mock data for evaluations
     eval_1 = Evaluation()
     eval_1.title = "title 1"
@@ -26,31 +78,17 @@ def test_get_evaluations(
     eval_2 = Evaluation()
     eval_2.title = "title 2"
     eval_2.teacher_id = 2
-    mock_data = [eval_1, eval_2]
 
     # Mock the repository calls
     m_repo_evaluation_instance = m_repo_evaluation.return_value
-    m_repo_evaluation_instance.get_all.return_value = mock_data
+    m_repo_evaluation_instance.get_many.return_value = [eval_1, eval_2]
 
+    user_2 = User(id=2, first_name="John", middle_name="Doe", last_name="Doe")
     m_repo_user_instance = m_repo_user.return_value
-    m_repo_user_instance.get.side_effect = [user_model_out, user_model_out]
+    m_repo_user_instance.get_many.return_value = [user_model_out, user_2]
 
-    # Mock the paginate call
-    m_paginate.return_value = Page(
-        items=[
-            {"teacher_name": "John Doe Doe", "title": "title 1", "teacher_id": 1},
-            {"teacher_name": "John Doe Doe", "title": "title 2", "teacher_id": 2},
-        ],
-        total=len(mock_data),
-        page=1,
-        size=10,
-    )
-
-    # Create an instance of the use case
     evaluation_uc = EvaluationUseCase(db=mock_session)
-
-    # Call the method under test
-    response = evaluation_uc.get_evaluations()
+    evaluation_uc.get_evaluations(ids=[1, 2])
 
     # Verify that paginate was called with the transformed data (dictionaries)
     m_paginate.assert_called_once_with(
@@ -60,22 +98,16 @@ def test_get_evaluations(
         ]
     )
 
-    # Assertions to check the response matches the expected values
-    assert response.items == [
-        {"teacher_name": "John Doe Doe", "title": "title 1", "teacher_id": 1},
-        {"teacher_name": "John Doe Doe", "title": "title 2", "teacher_id": 2},
-    ]
-    assert response.total == len(mock_data)
-    assert response.page == 1
-    assert response.size == 10
+    # Teachers are fetched with one batched query
+    m_repo_user_instance.get_many.assert_called_once_with(mock_session, [1, 2])
 
 
 @patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
 def test_get_evaluations_exception(m_repo_evaluation, mock_session):
     """Test get evaluations with exception."""
     m_repo_evaluation_instance = m_repo_evaluation.return_value
-    m_repo_evaluation_instance.get_all.side_effect = DatabaseException(
-        status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error"
+    m_repo_evaluation_instance.get_all_rows_with_teacher_name.side_effect = (
+        DatabaseException(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error")
     )
 
     evaluation_uc = EvaluationUseCase(db=mock_session)
@@ -232,3 +264,187 @@ def test_delete_evaluation_exception(
 
     assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
     assert isinstance(response, JSONResponse)
+
+
+@patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
+def test_get_evaluation_etag(m_repo_evaluation, mock_session):
+    """Test get evaluation ETag changes with updated_at."""
+    m_repo_evaluation_instance = m_repo_evaluation.return_value
+    m_repo_evaluation_instance.get_version.return_value = (
+        "2024-12-10T09:17:55.330000",
+        1,
+    )
+
+    evaluation_uc = EvaluationUseCase(db=mock_session)
+    etag = evaluation_uc.get_evaluation_etag(_id=1)
+
+    m_repo_evaluation_instance.get_version.return_value = (
+        "2024-12-11T09:17:55.330000",
+        1,
+    )
+
+    assert etag.startswith('W/"')
+    assert etag != evaluation_uc.get_evaluation_etag(_id=1)
+
+
+@patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
+def test_get_evaluation_etag_not_found(m_repo_evaluation, mock_session):
+    """Test get evaluation ETag of a missing record."""
+    m_repo_evaluation_instance = m_repo_evaluation.return_value
+    m_repo_evaluation_instance.get_version.return_value = (None, 0)
+
+    evaluation_uc = EvaluationUseCase(db=mock_session)
+
+    assert evaluation_uc.get_evaluation_etag(_id=1) is None
+
+
+@patch("app.use_cases.evaluation.QuestionResultRepository", spec=True)
+@patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
+def test_get_evaluation_form(
+    m_repo_evaluation,
+    m_repo_question_result,
+    mock_session,
+    evaluation_model_out,
+    user_model_out,
+):
+    """Test get evaluation form loads prior answers with one query."""
+    question_2 = Question(id=2, question_text="question 2", evaluation_id=1)
+    question_1 = Question(id=1, question_text="question 1", evaluation_id=1)
+    evaluation_result = EvaluationResult(id=3, evaluation_id=1, admin_id=2)
+    question_result = QuestionResult(id=4, evaluation_result_id=3, rating=5)
+
+    evaluation_model_out.user = user_model_out
+    evaluation_model_out.questions = [question_2, question_1]
+    evaluation_model_out.evaluation_results = [evaluation_result]
+
+    m_repo_evaluation_instance = m_repo_evaluation.return_value
+    m_repo_evaluation_instance.get_form.return_value = evaluation_model_out
+    m_repo_question_result_instance = m_repo_question_result.return_value
+    m_get_rows = m_repo_question_result_instance.get_all_rows_by_evaluation_result_ids
+    m_get_rows.return_value = [question_result]
+
+    evaluation_uc = EvaluationUseCase(db=mock_session)
+
+    response = evaluation_uc.get_evaluation_form(_id=1, admin_id=2)
+
+    m_repo_evaluation_instance.get_form.assert_called_once_with(
+        mock_session, _id=1, admin_id=2
+    )
+    m_get_rows.assert_called_once_with(
+        mock_session, schemas.QuestionResultOut.model_fields, evaluation_result_ids=[3]
+    )
+    assert response.evaluation.teacher_name == "John Doe Doe"
+    assert [question.id for question in response.questions] == [1, 2]
+    assert [result.id for result in response.evaluation_results] == [3]
+    assert [result.id for result in response.question_results] == [4]
+
+
+@patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
+def test_get_evaluation_form_exception(m_repo_evaluation, mock_session):
+    """Test get evaluation form of a missing evaluation."""
+    m_repo_evaluation_instance = m_repo_evaluation.return_value
+    m_repo_evaluation_instance.get_form.side_effect = APIException(
+        status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+    )
+
+    evaluation_uc = EvaluationUseCase(db=mock_session)
+
+    response = evaluation_uc.get_evaluation_form(_id=1, admin_id=2)
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert isinstance(response, JSONResponse)
+
+
+@patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
+def test_clone_evaluation(m_repo_evaluation, mock_session, evaluation_model_out):
+    """Test clone evaluation."""
+    m_repo_evaluation_instance = m_repo_evaluation.return_value
+    m_repo_evaluation_instance.clone.return_value = [evaluation_model_out]
+
+    evaluation_uc = EvaluationUseCase(db=mock_session)
+
+    response = evaluation_uc.clone_evaluation(
+        _id=1, obj_in=schemas.EvaluationCloneIn(teacher_ids=[1])
+    )
+
+    m_repo_evaluation_instance.clone.assert_called_once_with(
+        mock_session, _id=1, teacher_ids=[1], title=None
+    )
+    assert [evaluation.id for evaluation in response] == [1]
+    assert response[0].title == "evaluation 1"
+
+
+@patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
+def test_clone_evaluation_exception(m_repo_evaluation, mock_session):
+    """Test clone evaluation with exception."""
+    m_repo_evaluation_instance = m_repo_evaluation.return_value
+    m_repo_evaluation_instance.clone.side_effect = DatabaseException(
+        status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error"
+    )
+
+    evaluation_uc = EvaluationUseCase(db=mock_session)
+
+    response = evaluation_uc.clone_evaluation(
+        _id=1, obj_in=schemas.EvaluationCloneIn(teacher_ids=[1])
+    )
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert isinstance(response, JSONResponse)
+
+
+@patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
+def test_get_pending_evaluations(m_repo_evaluation, mock_session):
+    """Test get pending evaluations of a student."""
+    m_repo_evaluation_instance = m_repo_evaluation.return_value
+    m_repo_evaluation_instance.paginate_pending_rows.return_value = Page(
+        items=[], total=0, page=1, size=10
+    )
+
+    evaluation_uc = EvaluationUseCase(db=mock_session)
+
+    response = evaluation_uc.get_pending_evaluations(admin_id=7)
+
+    m_repo_evaluation_instance.paginate_pending_rows.assert_called_once_with(
+        mock_session, schemas.EvaluationsOut.model_fields, admin_id=7
+    )
+    assert response.total == 0
+
+
+@patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
+def test_get_pending_evaluations_exception(m_repo_evaluation, mock_session):
+    """Test get pending evaluations with exception."""
+    m_repo_evaluation_instance = m_repo_evaluation.return_value
+    m_repo_evaluation_instance.paginate_pending_rows.side_effect = DatabaseException(
+        status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error"
+    )
+
+    evaluation_uc = EvaluationUseCase(db=mock_session)
+
+    response = evaluation_uc.get_pending_evaluations(admin_id=7)
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert isinstance(response, JSONResponse)
+
+
+@patch("app.use_cases.evaluation.QuestionResultRepository", spec=True)
+@patch("app.use_cases.evaluation.EvaluationRepository", spec=True)
+def test_get_rating_histogram(m_repo_evaluation, m_repo_question_result, mock_session):
+    """Test histogram rows are shaped as a question by rating matrix."""
+    m_repo_question_result.return_value.get_rating_histogram_rows.return_value = [
+        SimpleNamespace(question_id=1, question_text="q1", rating=5, count=3),
+        SimpleNamespace(question_id=1, question_text="q1", rating=2, count=1),
+        SimpleNamespace(question_id=2, question_text="q2", rating=4, count=2),
+    ]
+
+    evaluation_uc = EvaluationUseCase(db=mock_session)
+    response = evaluation_uc.get_rating_histogram(_id=1)
+
+    m_repo_evaluation.return_value.get.assert_called_once_with(mock_session, 1)
+    assert response == schemas.RatingHistogramOut(
+        evaluation_id=1,
+        ratings=[1, 2, 3, 4, 5],
+        question_ids=[1, 2],
+        question_texts=["q1", "q2"],
+        responses=[4, 2],
+        counts=[[0, 1, 0, 0, 3], [0, 0, 0, 2, 0]],
+    )
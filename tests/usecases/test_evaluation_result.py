@@ -0,0 +1,658 @@
+"""Evaluation result use case unit tests."""
+
+import asyncio
+import json
+from datetime import date
+from http import HTTPStatus
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fastapi_pagination import Page
+from starlette.responses import JSONResponse
+
+from app import schemas
+from app.core.config import settings
+from app.core.events import Event, broadcaster, dashboard_channel
+from app.models import Category, CommentTerm, EvaluationResult
+from app.use_cases.evaluation_result import EvaluationResultUseCase, LiveDashboard
+from exceptions.exceptions import APIException, DatabaseException
+
+
+def read_streaming_response(response) -> str:
+    """Collect the body of a streaming response."""
+
+    async def collect():
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(collect())
+
+
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+def test_export_evaluation_results_csv(
+    m_repo_evaluation_result, mock_session, evaluation_result_export_rows
+):
+    """Test export evaluation results as CSV."""
+    m_repo_instance = m_repo_evaluation_result.return_value
+    m_repo_instance.stream_export_rows.return_value = iter(
+        evaluation_result_export_rows
+    )
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.export_evaluation_results(
+        evaluation_id=1, export_format=schemas.ExportFormatEnum.csv
+    )
+
+    body = read_streaming_response(response)
+
+    assert response.media_type == "text/csv"
+    assert body.splitlines() == [
+        "evaluation_result_id,student_name,rating",
+        "1,John Doe Doe,5",
+        "1,John Doe Doe,4",
+    ]
+    mock_session.close.assert_called_once()
+
+
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+def test_export_evaluation_results_ndjson(
+    m_repo_evaluation_result, mock_session, evaluation_result_export_rows
+):
+    """Test export evaluation results as NDJSON."""
+    m_repo_instance = m_repo_evaluation_result.return_value
+    m_repo_instance.stream_export_rows.return_value = iter(
+        evaluation_result_export_rows
+    )
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.export_evaluation_results(
+        evaluation_id=1, export_format=schemas.ExportFormatEnum.ndjson
+    )
+
+    body = read_streaming_response(response)
+
+    assert response.media_type == "application/x-ndjson"
+    assert [json.loads(line) for line in body.splitlines()] == (
+        evaluation_result_export_rows
+    )
+    mock_session.close.assert_called_once()
+
+
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+@patch("app.use_cases.evaluation_result.paginate", spec=True)
+def test_get_pending_evaluation_results(
+    m_paginate, m_repo_evaluation_result, mock_session
+):
+    """Test get pending evaluation results selects the out schema columns."""
+    mock_data = [{"id": 1, "student_name": "John Doe Doe", "is_submitted": False}]
+    m_repo_instance = m_repo_evaluation_result.return_value
+    m_repo_instance.get_pending_rows.return_value = mock_data
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    evaluation_result_uc.get_pending_evaluation_results(evaluation_id=1)
+
+    m_repo_instance.get_pending_rows.assert_called_once_with(
+        mock_session, schemas.EvaluationsResultOut.model_fields, evaluation_id=1
+    )
+    m_paginate.assert_called_once_with(mock_data)
+
+
+@patch("app.use_cases.evaluation_result.get_weighted_scores", spec=True)
+@patch("app.use_cases.evaluation_result.UserRepository", spec=True)
+@patch("app.use_cases.evaluation_result.CategoryRepository", spec=True)
+@patch("app.use_cases.evaluation_result.QuestionResultRepository", spec=True)
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+@patch("app.use_cases.evaluation_result.paginate", spec=True)
+def test_get_evaluation_results_by_teacher_id(
+    m_paginate,
+    m_repo_evaluation_result,
+    m_repo_question_result,
+    m_repo_category,
+    m_repo_user,
+    m_get_weighted_scores,
+    mock_session,
+    user_model_out,
+):
+    """Test category averages follow the display order of the categories."""
+    m_repo_evaluation_result.return_value.get_all_by_teacher_id.return_value = [
+        EvaluationResult(id=3, evaluation_id=1, admin_id=1, teacher_id=1)
+    ]
+    m_repo_category.return_value.get_all_ordered.return_value = [
+        Category(id=7, name="Classroom Teaching", display_order=1),
+        Category(id=5, name="Lesson Plans", display_order=2),
+    ]
+    m_repo_question_result_instance = m_repo_question_result.return_value
+    m_repo_question_result_instance.get_category_average_rows.return_value = [
+        SimpleNamespace(evaluation_result_id=3, category_id=5, average=4.0),
+        SimpleNamespace(evaluation_result_id=3, category_id=7, average=10 / 3),
+        SimpleNamespace(evaluation_result_id=3, category_id=None, average=1.0),
+    ]
+    m_repo_user.return_value.get_many.return_value = [user_model_out]
+    m_get_weighted_scores.return_value = {3: 3.5555}
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    evaluation_result_uc.get_evaluation_results_by_teacher_id(teacher_id=1)
+
+    m_repo_question_result_instance.get_category_average_rows.assert_called_once_with(
+        mock_session, evaluation_result_ids=[3]
+    )
+    [response] = m_paginate.call_args.args[0]
+    assert response["average_1"] == 3.33
+    assert response["average_2"] == 4.0
+    assert response["average_3"] == 0
+    assert response["average_4"] == 0
+    assert response["average"] == 3.56
+    assert response["teacher_name"] == "John Doe Doe"
+
+
+@patch("app.use_cases.evaluation_result.get_weighted_scores", spec=True)
+@patch("app.use_cases.evaluation_result.UserRepository", spec=True)
+@patch("app.use_cases.evaluation_result.CategoryRepository", spec=True)
+@patch("app.use_cases.evaluation_result.QuestionResultRepository", spec=True)
+def test_get_teacher_report(
+    m_repo_question_result,
+    m_repo_category,
+    m_repo_user,
+    m_get_weighted_scores,
+    mock_session,
+    user_model_out,
+):
+    """Test report statistics per question, category and overall."""
+    m_repo_user.return_value.get.return_value = user_model_out
+    m_repo_category.return_value.get_all_ordered.return_value = [
+        Category(id=7, name="Classroom Teaching", display_order=1),
+        Category(id=5, name="Lesson Plans", display_order=2),
+    ]
+    m_repo_question_result.return_value.get_rating_histogram_rows.return_value = [
+        SimpleNamespace(
+            question_id=1, question_text="q1", category_id=5, rating=rating, count=count
+        )
+        for rating, count in ((3, 1), (4, 2), (5, 1))
+    ] + [
+        SimpleNamespace(
+            question_id=2, question_text="q2", category_id=7, rating=5, count=3
+        ),
+        SimpleNamespace(
+            question_id=None, question_text="q3", category_id=None, rating=1, count=1
+        ),
+    ]
+    m_get_weighted_scores.return_value = {1: 4.0, 2: 3.0}
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.get_teacher_report(teacher_id=1)
+
+    assert response.teacher_name == "John Doe Doe"
+    assert (response.results, response.score) == (2, 3.5)
+
+    question_1 = response.questions[0]
+    assert question_1.distribution == {3: 1, 4: 2, 5: 1}
+    assert (question_1.count, question_1.mean, question_1.median) == (4, 4.0, 4.0)
+    assert (question_1.std, question_1.ci_low, question_1.ci_high) == (
+        0.82,
+        3.2,
+        4.8,
+    )
+
+    assert [
+        (category.category, category.count, category.mean)
+        for category in response.categories
+    ] == [("Classroom Teaching", 3, 5.0), ("Lesson Plans", 4, 4.0), (None, 1, 1.0)]
+    assert response.overall.count == 8
+    assert response.overall.median == 4.5
+    assert response.overall.distribution == {1: 1, 3: 1, 4: 2, 5: 4}
+
+
+@patch("app.use_cases.evaluation_result.UserRepository", spec=True)
+def test_get_teacher_report_not_found(m_repo_user, mock_session):
+    """Test report of a missing teacher."""
+    m_repo_user.return_value.get.side_effect = APIException(
+        status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+    )
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.get_teacher_report(teacher_id=1)
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert isinstance(response, JSONResponse)
+
+
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+def test_get_teacher_rankings(m_repo_evaluation_result, mock_session):
+    """Test get teachers ranked within the results of an admin."""
+    m_repo_evaluation_result_instance = m_repo_evaluation_result.return_value
+    m_repo_evaluation_result_instance.paginate_ranking_rows.return_value = Page(
+        items=[], total=0, page=1, size=10
+    )
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.get_teacher_rankings(admin_id=7, category_id=2)
+
+    m_repo_evaluation_result_instance.paginate_ranking_rows.assert_called_once_with(
+        mock_session, admin_id=7, category_id=2
+    )
+    assert response.total == 0
+
+
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+def test_get_teacher_rankings_exception(m_repo_evaluation_result, mock_session):
+    """Test get teacher rankings with exception."""
+    m_repo_evaluation_result_instance = m_repo_evaluation_result.return_value
+    m_repo_evaluation_result_instance.paginate_ranking_rows.side_effect = (
+        DatabaseException(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error")
+    )
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.get_teacher_rankings()
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert isinstance(response, JSONResponse)
+
+
+@patch("app.use_cases.evaluation_result.search_comments", spec=True)
+def test_search_comments(m_search_comments, mock_session):
+    """Test search comments of the results of a teacher."""
+    m_search_comments.return_value = Page(items=[], total=0, page=1, size=10)
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.search_comments(text="late", teacher_id=3)
+
+    (session, text, *criterion), _ = m_search_comments.call_args
+    assert (session, text) == (mock_session, "late")
+    assert [str(criteria) for criteria in criterion] == [
+        str(EvaluationResult.teacher_id == 3)
+    ]
+    assert response.total == 0
+
+
+@patch("app.use_cases.evaluation_result.search_comments", spec=True)
+def test_search_comments_exception(m_search_comments, mock_session):
+    """Test search comments with exception."""
+    m_search_comments.side_effect = DatabaseException(
+        status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error"
+    )
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.search_comments(text="late")
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert isinstance(response, JSONResponse)
+
+
+@patch("app.use_cases.evaluation_result.CommentTermRepository", spec=True)
+def test_get_themes(m_repo_comment_term, mock_session):
+    """Test get the top terms of the comments of a teacher."""
+    m_repo_comment_term.return_value.get_top_term_rows.return_value = [
+        SimpleNamespace(term="patient", count=3),
+        SimpleNamespace(term="clear", count=1),
+    ]
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.get_themes(teacher_id=1, limit=2)
+
+    (session, *criterion), kwargs = (
+        m_repo_comment_term.return_value.get_top_term_rows.call_args
+    )
+    assert session == mock_session
+    assert [str(criteria) for criteria in criterion] == [
+        str(CommentTerm.teacher_id == 1)
+    ]
+    assert kwargs == {"limit": 2}
+    assert [(theme.term, theme.count) for theme in response] == [
+        ("patient", 3),
+        ("clear", 1),
+    ]
+
+
+@patch("app.use_cases.evaluation_result.CommentTermRepository", spec=True)
+def test_get_themes_exception(m_repo_comment_term, mock_session):
+    """Test get themes with exception."""
+    m_repo_comment_term.return_value.get_top_term_rows.side_effect = DatabaseException(
+        status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error"
+    )
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.get_themes(evaluation_id=1)
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert isinstance(response, JSONResponse)
+
+
+@patch("app.use_cases.evaluation_result.TeacherScoreRollupRepository", spec=True)
+@patch("app.use_cases.evaluation_result.CategoryRepository", spec=True)
+def test_get_teacher_trend(m_repo_category, m_repo_rollup, mock_session):
+    """Test weekly rollups summed into weeks, months and terms, per category."""
+    m_repo_category.return_value.get_all_ordered.return_value = [
+        Category(id=7, name="Classroom Teaching", display_order=1),
+        Category(id=5, name="Lesson Plans", display_order=2),
+    ]
+    m_repo_rollup.return_value.get_all_by_teacher_id.return_value = [
+        SimpleNamespace(
+            category_id=category_id,
+            bucket_start=bucket_start,
+            rating_sum=rating_sum,
+            rating_count=rating_count,
+        )
+        for category_id, bucket_start, rating_sum, rating_count in (
+            (5, date(2024, 7, 29), 8, 2),
+            (5, date(2024, 8, 1), 1, 1),
+            (5, date(2024, 8, 26), 9, 2),
+            (5, date(2024, 12, 30), 3, 1),
+            (5, date(2025, 1, 6), 5, 1),
+        )
+    ]
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.get_teacher_trend(
+        teacher_id=1, bucket=schemas.TrendBucketEnum.term, category_id=5
+    )
+
+    m_repo_rollup.return_value.get_all_by_teacher_id.assert_called_once_with(
+        mock_session, teacher_id=1, category_id=5
+    )
+    assert [category.category for category in response.categories] == ["Lesson Plans"]
+    assert [
+        (point.bucket_start, point.average, point.count)
+        for point in response.categories[0].points
+    ] == [
+        (date(2024, 1, 1), 4.0, 2),
+        (date(2024, 8, 1), 3.25, 4),
+        (date(2025, 1, 1), 5.0, 1),
+    ]
+
+    response = evaluation_result_uc.get_teacher_trend(
+        teacher_id=1, bucket=schemas.TrendBucketEnum.week
+    )
+
+    assert [
+        (point.bucket_start, point.average, point.count)
+        for point in response.categories[0].points
+    ] == [
+        (date(2024, 7, 29), 3.0, 3),
+        (date(2024, 8, 26), 4.5, 2),
+        (date(2024, 12, 30), 3.0, 1),
+        (date(2025, 1, 6), 5.0, 1),
+    ]
+
+    response = evaluation_result_uc.get_teacher_trend(
+        teacher_id=1, bucket=schemas.TrendBucketEnum.month
+    )
+
+    assert [point.bucket_start for point in response.categories[0].points] == [
+        date(2024, 7, 1),
+        date(2024, 8, 1),
+        date(2024, 12, 1),
+        date(2025, 1, 1),
+    ]
+
+
+@patch("app.use_cases.evaluation_result.EvaluationRepository", spec=True)
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+def test_assign_evaluation(
+    m_repo_evaluation_result, m_repo_evaluation, mock_session
+):
+    """Test assign evaluation to the students of an admin."""
+    m_repo_instance = m_repo_evaluation_result.return_value
+    m_repo_instance.assign_students.return_value = 3
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.assign_evaluation(evaluation_id=1, admin_id=2)
+
+    m_repo_instance.assign_students.assert_called_once_with(
+        mock_session, evaluation_id=1, admin_id=2
+    )
+    assert response == schemas.EvaluationAssignmentOut(
+        evaluation_id=1, admin_id=2, assigned=3
+    )
+
+
+@patch("app.use_cases.evaluation_result.EvaluationRepository", spec=True)
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+def test_assign_evaluation_not_found(
+    m_repo_evaluation_result, m_repo_evaluation, mock_session
+):
+    """Test assign an evaluation that does not exist."""
+    m_repo_evaluation.return_value.get.side_effect = APIException(
+        status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+    )
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.assign_evaluation(evaluation_id=1, admin_id=2)
+
+    m_repo_evaluation_result.return_value.assign_students.assert_not_called()
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert isinstance(response, JSONResponse)
+
+
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+def test_get_participation(m_repo_evaluation_result, mock_session):
+    """Test participation is rolled up per teacher."""
+    m_repo_instance = m_repo_evaluation_result.return_value
+    m_repo_instance.get_participation_rows.return_value = [
+        SimpleNamespace(
+            evaluation_id=1,
+            title="evaluation 1",
+            teacher_id=1,
+            teacher_name="John Doe Doe",
+            total=3,
+            submitted=1,
+        ),
+        SimpleNamespace(
+            evaluation_id=2,
+            title="evaluation 2",
+            teacher_id=1,
+            teacher_name="John Doe Doe",
+            total=1,
+            submitted=1,
+        ),
+    ]
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.get_participation()
+
+    assert [
+        (evaluation.pending, evaluation.completion)
+        for evaluation in response.evaluations
+    ] == [(2, 33.33), (0, 100.0)]
+    assert response.teachers == [
+        schemas.TeacherParticipationOut(
+            teacher_id=1,
+            teacher_name="John Doe Doe",
+            total=4,
+            submitted=2,
+            pending=2,
+            completion=50.0,
+        )
+    ]
+
+
+@patch("app.use_cases.evaluation_result.UserRepository", spec=True)
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+def test_create_evaluation_result_upsert(
+    m_repo_evaluation_result, m_repo_user, mock_session, user_model_out
+):
+    """Test create evaluation result in upsert mode."""
+    obj_in = schemas.EvaluationResultIn(evaluation_id=1, admin_id=2, teacher_id=1)
+    m_repo_instance = m_repo_evaluation_result.return_value
+    m_repo_instance.upsert.return_value = EvaluationResult(
+        id=3, evaluation_id=1, admin_id=2, teacher_id=1
+    )
+    m_repo_user.return_value.get.return_value = user_model_out
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.create_evaluation_result(
+        obj_in=obj_in, upsert=True
+    )
+
+    m_repo_instance.upsert.assert_called_once_with(mock_session, obj_in=obj_in)
+    m_repo_instance.create.assert_not_called()
+    assert response.id == 3
+    assert response.teacher_name == "John Doe Doe"
+
+
+def test_live_dashboard_apply():
+    """Test the live dashboard adds deltas to its counts and averages."""
+    dashboard = LiveDashboard(1, total=2, submitted=1, ratings={3: [9, 2]})
+
+    messages = dashboard.apply(
+        Event(
+            "results",
+            {
+                "total": 1,
+                "submitted": 1,
+                "submissions": [{"admin_id": 4, "teacher_id": 2}],
+            },
+        )
+    )
+
+    assert messages == [
+        (
+            "submission",
+            schemas.DashboardSubmissionOut(evaluation_id=1, admin_id=4, teacher_id=2),
+        ),
+        (
+            "counts",
+            schemas.DashboardCountsOut(
+                evaluation_id=1, total=3, submitted=2, pending=1, completion=66.67
+            ),
+        ),
+    ]
+
+    messages = dashboard.apply(
+        Event(
+            "ratings",
+            {"categories": [{"category_id": 3, "rating_sum": 3, "rating_count": 1}]},
+        )
+    )
+
+    assert messages == [
+        (
+            "categories",
+            [schemas.DashboardCategoryOut(category_id=3, average=4.0, count=3)],
+        )
+    ]
+    assert dashboard.apply(Event("unknown")) == []
+
+
+@patch("app.use_cases.evaluation_result.QuestionResultRepository", spec=True)
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+def test_stream_dashboard(
+    m_repo_evaluation_result, m_repo_question_result, mock_session
+):
+    """Test the dashboard stream sends a snapshot, then the published deltas."""
+    m_repo_instance = m_repo_evaluation_result.return_value
+    m_repo_instance.get_counts_row.return_value = SimpleNamespace(total=2, submitted=1)
+    m_question_repo_instance = m_repo_question_result.return_value
+    m_question_repo_instance.get_category_rating_rows.return_value = [
+        SimpleNamespace(category_id=3, rating_sum=9, rating_count=2)
+    ]
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.stream_dashboard(evaluation_id=1)
+
+    async def collect():
+        chunks = response.body_iterator
+        snapshot = await anext(chunks)
+        broadcaster.publish(
+            dashboard_channel(1),
+            "results",
+            {"total": 1, "submitted": 0, "submissions": []},
+        )
+        counts = await anext(chunks)
+        await chunks.aclose()
+        return snapshot, counts
+
+    snapshot, counts = asyncio.run(collect())
+
+    assert response.media_type == "text/event-stream"
+    assert snapshot.startswith("event: snapshot\n")
+    assert json.loads(snapshot.split("data: ")[1]) == {
+        "evaluation_id": 1,
+        "total": 2,
+        "submitted": 1,
+        "pending": 1,
+        "completion": 50.0,
+        "categories": [{"category_id": 3, "average": 4.5, "count": 2}],
+    }
+    assert counts.startswith("event: counts\n")
+    assert json.loads(counts.split("data: ")[1])["total"] == 3
+    assert not broadcaster.has_subscribers(dashboard_channel(1))
+    mock_session.close.assert_called_once()
+
+
+@patch("app.use_cases.evaluation_result.QuestionResultRepository", spec=True)
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+def test_stream_dashboard_reloads_snapshot(
+    m_repo_evaluation_result, m_repo_question_result, mock_session
+):
+    """Test a write published while the snapshot loads makes it load again."""
+    counts_rows = [
+        SimpleNamespace(total=2, submitted=1),
+        SimpleNamespace(total=3, submitted=1),
+    ]
+
+    def get_counts_row(*args, **kwargs):
+        if len(counts_rows) == 2:
+            broadcaster.publish(
+                dashboard_channel(1),
+                "results",
+                {"total": 1, "submitted": 0, "submissions": []},
+            )
+        return counts_rows.pop(0)
+
+    m_repo_instance = m_repo_evaluation_result.return_value
+    m_repo_instance.get_counts_row.side_effect = get_counts_row
+    m_question_repo_instance = m_repo_question_result.return_value
+    m_question_repo_instance.get_category_rating_rows.return_value = []
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.stream_dashboard(evaluation_id=1)
+
+    async def collect():
+        chunks = response.body_iterator
+        snapshot = await anext(chunks)
+        await chunks.aclose()
+        return snapshot
+
+    snapshot = asyncio.run(collect())
+
+    assert json.loads(snapshot.split("data: ")[1])["total"] == 3
+    assert m_repo_instance.get_counts_row.call_count == 2
+
+
+@patch.object(settings, "DASHBOARD_RESYNC_SECONDS", 0)
+@patch.object(settings, "DASHBOARD_SNAPSHOT_ATTEMPTS", 2)
+@patch("app.use_cases.evaluation_result.QuestionResultRepository", spec=True)
+@patch("app.use_cases.evaluation_result.EvaluationResultRepository", spec=True)
+def test_stream_dashboard_resyncs(
+    m_repo_evaluation_result, m_repo_question_result, mock_session
+):
+    """Test a busy snapshot loads a few times, then snapshots are resent."""
+
+    def get_counts_row(*args, **kwargs):
+        broadcaster.publish(
+            dashboard_channel(1),
+            "results",
+            {"total": 1, "submitted": 0, "submissions": []},
+        )
+        return SimpleNamespace(total=2, submitted=1)
+
+    m_repo_instance = m_repo_evaluation_result.return_value
+    m_repo_instance.get_counts_row.side_effect = get_counts_row
+    m_question_repo_instance = m_repo_question_result.return_value
+    m_question_repo_instance.get_category_rating_rows.return_value = []
+
+    evaluation_result_uc = EvaluationResultUseCase(db=mock_session)
+    response = evaluation_result_uc.stream_dashboard(evaluation_id=1)
+
+    async def collect():
+        chunks = response.body_iterator
+        snapshots = [await anext(chunks), await anext(chunks)]
+        await chunks.aclose()
+        return snapshots
+
+    snapshots = asyncio.run(collect())
+
+    assert [snapshot.split("\n")[0] for snapshot in snapshots] == [
+        "event: snapshot",
+        "event: snapshot",
+    ]
+    assert m_repo_instance.get_counts_row.call_count == 4
@@ -6,6 +6,7 @@ from unittest.mock import patch
 from fastapi_pagination import Page
 from starlette.responses import JSONResponse
 
+from app import schemas
 from app.models import User
 from app.use_cases.user import UserUseCase
 from exceptions.exceptions import DatabaseException, APIException
@@ -26,7 +27,7 @@ def test_get_users(m_paginate, m_repo_user, mock_session):
     mock_data = [user_1, user_2]
 
     m_repo_user_instance = m_repo_user.return_value
-    m_repo_user_instance.get_all.return_value = mock_data
+    m_repo_user_instance.get_all_rows.return_value = mock_data
     m_paginate.return_value = Page(
         items=mock_data, total=len(mock_data), page=1, size=10
     )
@@ -34,6 +35,9 @@ def test_get_users(m_paginate, m_repo_user, mock_session):
     user_uc = UserUseCase(db=mock_session)
 
     response = user_uc.get_users()
+    m_repo_user_instance.get_all_rows.assert_called_once_with(
+        mock_session, schemas.UserOut.model_fields
+    )
     m_paginate.assert_called_once_with(mock_data)
 
     assert response.items == mock_data
@@ -42,11 +46,28 @@ def test_get_users(m_paginate, m_repo_user, mock_session):
     assert response.size == 10
 
 
+@patch("app.use_cases.user.UserRepository", spec=True)
+@patch("app.use_cases.user.paginate", spec=True)
+def test_get_users_by_ids(m_paginate, m_repo_user, mock_session):
+    """Test get users of the given ids with one repository call."""
+    mock_data = [User(id=2), User(id=1)]
+
+    m_repo_user_instance = m_repo_user.return_value
+    m_repo_user_instance.get_many.return_value = mock_data
+
+    user_uc = UserUseCase(db=mock_session)
+    user_uc.get_users(ids=[2, 1])
+
+    m_repo_user_instance.get_many.assert_called_once_with(mock_session, [2, 1])
+    m_repo_user_instance.get_all_rows.assert_not_called()
+    m_paginate.assert_called_once_with(mock_data)
+
+
 @patch("app.use_cases.user.UserRepository", spec=True)
 def test_get_users_exception(m_repo_user, mock_session):
     """Test get users with exception."""
     m_repo_user_instance = m_repo_user.return_value
-    m_repo_user_instance.get_all.side_effect = DatabaseException(
+    m_repo_user_instance.get_all_rows.side_effect = DatabaseException(
         status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error"
     )
 